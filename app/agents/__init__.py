@@ -1,6 +1,7 @@
 """AI Research Crew Pro - Agents Module"""
 
 from .base_agent import AgentFactory, AgentConfig
+from .llm_pool import LLMPool, get_llm_pool
 from .researcher import create_researcher_agent
 from .summarizer import create_summarizer_agent
 from .email_agent import create_email_agent
@@ -8,6 +9,8 @@ from .email_agent import create_email_agent
 __all__ = [
     "AgentFactory",
     "AgentConfig",
+    "LLMPool",
+    "get_llm_pool",
     "create_researcher_agent",
     "create_summarizer_agent",
     "create_email_agent",
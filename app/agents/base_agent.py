@@ -9,8 +9,9 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Any
 from crewai import Agent, LLM
 
-from app.config.settings import get_settings
+from app.config.settings import ModelTier, get_settings
 from app.utils.logger import get_logger
+from .llm_pool import get_llm_pool
 
 logger = get_logger(__name__)
 
@@ -25,6 +26,7 @@ class AgentConfig:
     verbose: bool = True
     max_iter: int = 5
     allow_delegation: bool = False
+    model_tier: ModelTier = "standard"
 
 
 class AgentFactory:
@@ -35,33 +37,34 @@ class AgentFactory:
     configuration and consistent settings.
     """
     
-    _llm_instance: Optional[LLM] = None
-    
     @classmethod
-    def get_llm(cls) -> LLM:
+    def get_llm(
+        cls,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> LLM:
         """
-        Get or create cached LLM instance.
+        Get the pooled LLM client for a model and temperature.
         
+        Args:
+            model: Model name (defaults to the provider's configured model).
+            temperature: Sampling temperature (defaults to LLM_TEMPERATURE).
+            
         Returns:
-            Configured LLM instance based on settings.
+            Shared LLM instance from the pool.
         """
-        if cls._llm_instance is None:
-            settings = get_settings()
-            
-            logger.info(f"Initializing LLM: {settings.llm_provider}")
-            
-            cls._llm_instance = LLM(
-                model=settings.current_model,
-                temperature=settings.llm_temperature,
-                max_retries=5,
-            )
-        
-        return cls._llm_instance
+        settings = get_settings()
+        model = model or settings.current_model
+        return get_llm_pool().get(
+            settings.provider_for_model(model),
+            model,
+            settings.llm_temperature if temperature is None else temperature,
+        )
     
     @classmethod
     def reset_llm(cls):
-        """Reset the cached LLM instance (useful for testing)."""
-        cls._llm_instance = None
+        """Drop all pooled LLM clients (useful for testing)."""
+        get_llm_pool().clear()
     
     @classmethod
     def create_agent(cls, config: AgentConfig) -> Agent:
@@ -76,14 +79,14 @@ class AgentFactory:
         """
         settings = get_settings()
         
-        logger.debug(f"Creating agent: {config.role}")
+        logger.debug(f"Creating agent: {config.role} ({config.model_tier} tier)")
         
         agent = Agent(
             role=config.role,
             goal=config.goal,
             backstory=config.backstory,
             tools=config.tools,
-            llm=cls.get_llm(),
+            llm=cls.get_llm(model=settings.model_for_tier(config.model_tier)),
             verbose=settings.enable_verbose and config.verbose,
             max_iter=settings.max_agent_iterations or config.max_iter,
             allow_delegation=config.allow_delegation,
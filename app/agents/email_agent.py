@@ -5,6 +5,7 @@ Specialized agent for crafting and sending professional
 email reports with research findings.
 """
 
+from typing import Optional
 from crewai import Agent
 
 from .base_agent import AgentFactory, AgentConfig
@@ -35,16 +36,19 @@ You understand that email is often the first impression an organization makes,
 and you treat every message as an opportunity to demonstrate professionalism and value."""
 
 
-def create_email_agent() -> Agent:
+def create_email_agent(batch_id: Optional[str] = None) -> Agent:
     """
     Create a configured Email Coordinator agent.
     
+    Args:
+        batch_id: Optional id tagging emails queued by this agent's tool.
+        
     Returns:
         Configured Agent instance for email coordination.
     """
     logger.info("Creating email coordinator agent")
     
-    email_tool = create_email_tool()
+    email_tool = create_email_tool(batch_id=batch_id)
     
     config = AgentConfig(
         role="Email Communication Specialist",
@@ -53,6 +57,7 @@ def create_email_agent() -> Agent:
         tools=[email_tool],
         max_iter=2,
         allow_delegation=False,
+        model_tier="fast",
     )
     
     return AgentFactory.create_agent(config)
@@ -0,0 +1,182 @@
+"""
+LLM Client Pool for AI Research Crew Pro
+
+Keeps one configured LLM client per (provider, model, temperature) and
+bounds the requests each client has in flight, so concurrent workflows
+share clients safely instead of contending on a single instance.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from crewai import LLM
+from crewai.events import LLMCallCompletedEvent, crewai_event_bus
+from crewai.types.usage_metrics import UsageMetrics
+
+from app.config.settings import get_settings
+from app.utils.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+    install_circuit_breaker,
+    reject_when_open,
+)
+from app.utils.instrumentation import count_llm_calls, record_llm_usage
+from app.utils.llm_cache import install_llm_cache
+from app.utils.logger import get_logger
+from app.utils.rate_limit import install_rate_limit
+from app.utils.replay import install_llm_replay
+from app.utils.tracing import trace_llm_calls
+
+logger = get_logger(__name__)
+
+
+LLMKey = Tuple[str, str, float]
+LLMBuilder = Callable[[str, str, float], Any]
+
+
+def create_llm(provider: str, model: str, temperature: float) -> LLM:
+    """
+    Build a CrewAI LLM client.
+
+    Args:
+        provider: LLM provider name (gemini, openai).
+        model: Model name, including any provider prefix.
+        temperature: Sampling temperature.
+
+    Returns:
+        New LLM instance.
+    """
+    settings = get_settings()
+    logger.info(f"Initializing LLM: {provider} {model} (temperature={temperature})")
+    return LLM(
+        model=model,
+        temperature=temperature,
+        # Retries happen in install_rate_limit(), one token per attempt
+        max_retries=0,
+        stream=settings.llm_streaming,
+    )
+
+
+def limit_concurrency(llm: Any, semaphore: threading.BoundedSemaphore) -> Any:
+    """
+    Wrap an LLM instance's call() so it holds a semaphore slot while in flight.
+
+    Args:
+        llm: CrewAI LLM instance.
+        semaphore: Bounds concurrent requests through this client.
+
+    Returns:
+        The same LLM instance.
+    """
+    call = llm.call
+
+    def limited_call(messages, *args, **kwargs):
+        with semaphore:
+            return call(messages, *args, **kwargs)
+
+    object.__setattr__(llm, "call", limited_call)
+    return llm
+
+
+def record_call_usage(source: Any, event: LLMCallCompletedEvent):
+    """
+    Event handler: add a completed LLM request's token usage to its workflow.
+
+    CrewAI runs handlers in a copy of the emitting context, so the usage
+    reaches the collector and stage of the request that produced it.
+    """
+    usage = UsageMetrics.from_provider_dict(event.usage)
+    if usage is not None:
+        record_llm_usage(usage.prompt_tokens, usage.completion_tokens, usage.total_tokens)
+
+
+class LLMPool:
+    """
+    Thread-safe pool of LLM clients.
+
+    Each (provider, model, temperature) key gets one client, created on
+    first use, with at most max_concurrency requests in flight; every
+    client of a provider draws from that provider's rate-limit budget and
+    reports to its circuit breaker, which rejects calls before they queue
+    while open. Caching, record/replay and tracing wrap all of these, so
+    cache hits and replayed responses never wait. Every request,
+    including cache hits, is counted on the calling workflow's metrics
+    collector.
+    """
+
+    def __init__(self, max_concurrency: int, builder: LLMBuilder = create_llm):
+        """
+        Initialize the pool.
+
+        Args:
+            max_concurrency: In-flight request limit per client.
+            builder: Creates the client for a (provider, model, temperature) key.
+        """
+        self.max_concurrency = max_concurrency
+        self.builder = builder
+        self._clients: Dict[LLMKey, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _breaker(provider: str) -> Optional[CircuitBreaker]:
+        """Circuit breaker shared by all clients of a provider, if enabled."""
+        settings = get_settings()
+        if not settings.circuit_breaker_enabled:
+            return None
+        return get_circuit_breaker(provider, settings.llm_slow_call_seconds)
+
+    def get(self, provider: str, model: str, temperature: float) -> Any:
+        """
+        Get (creating if needed) the client for a key.
+
+        Args:
+            provider: LLM provider name.
+            model: Model name.
+            temperature: Sampling temperature.
+
+        Returns:
+            Shared LLM instance for the key.
+        """
+        key = (provider, model, float(temperature))
+        with self._lock:
+            llm = self._clients.get(key)
+            if llm is None:
+                llm = self.builder(*key)
+                breaker = self._breaker(provider)
+                if breaker is not None:
+                    install_circuit_breaker(llm, breaker)
+                install_rate_limit(llm, provider, retries=get_settings().llm_max_retries)
+                limit_concurrency(llm, threading.BoundedSemaphore(self.max_concurrency))
+                if breaker is not None:
+                    reject_when_open(llm, breaker)
+                install_llm_cache(llm)
+                install_llm_replay(llm)
+                count_llm_calls(llm)
+                trace_llm_calls(llm)
+                self._clients[key] = llm
+            return llm
+
+    def clear(self):
+        """Drop all clients (the next get() builds fresh ones)."""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+@lru_cache()
+def get_llm_pool() -> LLMPool:
+    """
+    Get the process-wide LLM client pool.
+
+    Also starts recording the token usage CrewAI reports for each
+    request on the requesting workflow's collector.
+
+    Returns:
+        LLMPool configured from settings.
+    """
+    crewai_event_bus.on(LLMCallCompletedEvent)(record_call_usage)
+    return LLMPool(max_concurrency=get_settings().llm_max_concurrency)
@@ -8,7 +8,7 @@ using Serper API for search capabilities.
 from crewai import Agent
 
 from .base_agent import AgentFactory, AgentConfig
-from app.tools import create_search_tool
+from app.tools import create_search_tool, create_batch_search_tool
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -51,12 +51,13 @@ def create_researcher_agent(
     logger.info(f"Creating researcher agent for topic: {topic[:50]}...")
     
     search_tool = create_search_tool(max_results=num_results)
+    batch_search_tool = create_batch_search_tool(max_results=num_results)
     
     config = AgentConfig(
         role="Senior Web Research Specialist",
         goal=f"Conduct comprehensive, accurate web research on: {topic}",
         backstory=RESEARCHER_BACKSTORY,
-        tools=[search_tool],
+        tools=[search_tool, batch_search_tool],
         max_iter=5,
         allow_delegation=False,
     )
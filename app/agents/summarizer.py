@@ -88,6 +88,7 @@ def create_summarizer_agent(
         tools=[],  # No external tools needed - works with internal context
         max_iter=3,
         allow_delegation=False,
+        model_tier="advanced",
     )
     
     return AgentFactory.create_agent(config)
@@ -0,0 +1,275 @@
+"""
+prime-brief - Batch Command Line Interface
+
+Headless runner that reads research topics from a CSV or JSONL
+file, executes them in parallel, and streams results to JSONL.
+"""
+
+import argparse
+import csv
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables first
+load_dotenv()
+
+from app.config.settings import get_settings
+from app.services import CrewService, ResearchResult
+from app.utils import validate_email, validate_topic, setup_logging, get_logger
+from app.utils.metrics import start_metrics_exporter, write_textfile
+from app.utils.outbox import get_outbox
+
+logger = get_logger(__name__)
+
+
+REPORT_FORMATS = ["Summary Report", "Detailed Analysis", "Executive Brief"]
+
+OUTBOX_FLUSH_TIMEOUT = 300.0
+
+
+def load_topics(
+    path: Path,
+    default_recipient: Optional[str] = None,
+    default_format: str = "Summary Report",
+    default_num_results: int = 5,
+) -> List[dict]:
+    """
+    Load workflow definitions from a CSV or JSONL file.
+
+    Each record needs a ``topic`` and may override ``recipient_email``
+    (an address, several separated by ``;``, or in JSONL a list of
+    addresses), ``report_format`` and
+    ``num_results``.
+
+    Args:
+        path: Input file (``.csv`` or ``.jsonl``).
+        default_recipient: Recipient used when a record has none.
+        default_format: Report format used when a record has none.
+        default_num_results: Source count used when a record has none.
+
+    Returns:
+        Validated workflow keyword-argument dicts.
+
+    Raises:
+        ValueError: If a record is missing fields or fails validation.
+    """
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            records = list(csv.DictReader(f))
+    else:
+        with path.open(encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+    workflows = []
+    for line_no, record in enumerate(records, 1):
+        topic_result = validate_topic(record.get("topic") or "")
+        if not topic_result.is_valid:
+            raise ValueError(f"Record {line_no}: {topic_result.error}")
+
+        recipients = []
+        raw_recipients = record.get("recipient_email") or default_recipient or ""
+        if isinstance(raw_recipients, str):
+            raw_recipients = raw_recipients.split(";")
+        elif not isinstance(raw_recipients, list):
+            raise ValueError(
+                f"Record {line_no}: recipient_email must be a string or a list"
+            )
+        for address in raw_recipients:
+            if not isinstance(address, str):
+                raise ValueError(f"Record {line_no}: invalid recipient {address!r}")
+            email_result = validate_email(address)
+            if not email_result.is_valid:
+                raise ValueError(f"Record {line_no}: {email_result.error}")
+            recipients.append(email_result.value)
+
+        report_format = record.get("report_format") or default_format
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Record {line_no}: unknown report format '{report_format}'")
+
+        workflows.append({
+            "topic": topic_result.value,
+            "recipient_email": recipients if len(recipients) > 1 else recipients[0],
+            "report_format": report_format,
+            "num_results": int(record.get("num_results") or default_num_results),
+        })
+
+    return workflows
+
+
+def positive_int(value: str) -> int:
+    """argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest-rank) of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_batch(
+    workflows: List[dict],
+    output_path: Path,
+    parallelism: int,
+) -> List[ResearchResult]:
+    """
+    Execute workflows in parallel and stream each result to a JSONL file.
+
+    Args:
+        workflows: Workflow keyword-argument dicts.
+        output_path: JSONL file receiving one record per workflow.
+        parallelism: Maximum workflows run at once.
+
+    Returns:
+        ResearchResults in completion order.
+    """
+    results = []
+    write_lock = threading.Lock()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def run_one(workflow: dict) -> ResearchResult:
+        return CrewService().execute_research_workflow(**workflow)
+
+    with output_path.open("w", encoding="utf-8") as out, ThreadPoolExecutor(
+        max_workers=parallelism, thread_name_prefix="batch"
+    ) as executor:
+        futures = {executor.submit(run_one, w): i for i, w in enumerate(workflows)}
+
+        for future in as_completed(futures):
+            index = futures[future]
+            result = future.result()
+            results.append(result)
+
+            record = {"index": index, **workflows[index], **result.to_dict()}
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+
+            status = "ok" if result.success else f"failed: {result.error_message}"
+            logger.info(
+                f"[{len(results)}/{len(workflows)}] "
+                f"{workflows[index]['topic'][:50]} - {status}"
+            )
+
+    return results
+
+
+def print_summary(results: List[ResearchResult], wall_time: float):
+    """Print aggregate throughput and latency statistics."""
+    latencies = [r.execution_time for r in results]
+    succeeded = sum(1 for r in results if r.success)
+
+    print()
+    print(f"Workflows:   {len(results)} ({succeeded} succeeded, "
+          f"{len(results) - succeeded} failed)")
+    print(f"Wall time:   {wall_time:.1f}s")
+    if wall_time > 0:
+        print(f"Throughput:  {len(results) / wall_time * 60:.2f} workflows/min")
+    if latencies:
+        print(f"Latency p50: {percentile(latencies, 50):.1f}s")
+        print(f"Latency p95: {percentile(latencies, 95):.1f}s")
+        print(f"Latency max: {max(latencies):.1f}s")
+        print(f"Latency avg: {statistics.mean(latencies):.1f}s")
+
+    metrics = [r.metrics for r in results if r.metrics]
+    if metrics:
+        print(f"LLM calls:   {sum(m.llm_calls for m in metrics)}")
+        print(f"Tokens:      {sum(m.total_tokens for m in metrics):,} "
+              f"({sum(m.prompt_tokens for m in metrics):,} prompt, "
+              f"{sum(m.completion_tokens for m in metrics):,} completion)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="research-crew",
+        description="Run research workflows headlessly from a CSV or JSONL file.",
+    )
+    parser.add_argument("input", type=Path, help="CSV or JSONL file of topics")
+    parser.add_argument(
+        "-o", "--output", type=Path, default=Path("results.jsonl"),
+        help="JSONL file to write results to (default: results.jsonl)",
+    )
+    parser.add_argument(
+        "-j", "--parallelism", type=positive_int, default=None,
+        help="Workflows to run at once (default: WORKFLOW_MAX_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--recipient", default=None,
+        help="Default recipient for records without recipient_email",
+    )
+    parser.add_argument(
+        "--report-format", default="Summary Report", choices=REPORT_FORMATS,
+        help="Default report format for records without report_format",
+    )
+    parser.add_argument(
+        "--num-results", type=int, default=5,
+        help="Default number of sources for records without num_results",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+
+    setup_logging()
+    settings = get_settings()
+
+    missing_keys = settings.get_missing_keys()
+    if missing_keys:
+        print(f"Missing configuration: {', '.join(missing_keys)}", file=sys.stderr)
+        return 2
+
+    try:
+        workflows = load_topics(
+            args.input,
+            default_recipient=args.recipient,
+            default_format=args.report_format,
+            default_num_results=args.num_results,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Invalid input: {e}", file=sys.stderr)
+        return 2
+
+    start_metrics_exporter()
+
+    parallelism = args.parallelism or settings.workflow_max_concurrency
+    logger.info(
+        f"Running {len(workflows)} workflows with parallelism {parallelism}"
+    )
+
+    start = time.perf_counter()
+    results = run_batch(workflows, args.output, parallelism)
+    wall_time = time.perf_counter() - start
+
+    print_summary(results, wall_time)
+
+    if settings.email_outbox_enabled:
+        logger.info("Waiting for queued emails to be delivered...")
+        if not get_outbox().flush(timeout=OUTBOX_FLUSH_TIMEOUT):
+            logger.warning("Some emails are still queued; they will be retried on next run")
+
+    if settings.metrics_enabled and settings.metrics_textfile:
+        # Final snapshot, since the background writer dies with the process
+        write_textfile(Path(settings.metrics_textfile))
+
+    return 0 if all(r.success for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
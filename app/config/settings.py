@@ -6,12 +6,17 @@ for type-safe settings with environment variable loading.
 """
 
 import os
-from typing import Literal, Optional
+from pathlib import Path
+from typing import Literal, Optional, get_args
 from functools import lru_cache
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 
+# Model tiers agents can ask for; each maps to a model in Settings
+ModelTier = Literal["fast", "standard", "advanced"]
+
+
 class Settings(BaseSettings):
     """Application settings with validation and defaults."""
     
@@ -22,15 +27,57 @@ class Settings(BaseSettings):
     gemini_model: str = Field("gemini/gemini-2.5-flash", alias="GEMINI_MODEL")
     openai_model: str = Field("gpt-4-turbo-preview", alias="OPENAI_MODEL")
     llm_temperature: float = Field(0.7, alias="LLM_TEMPERATURE", ge=0.0, le=2.0)
+    llm_streaming: bool = Field(False, alias="LLM_STREAMING")
+    llm_max_concurrency: int = Field(8, alias="LLM_MAX_CONCURRENCY", ge=1)
+    llm_max_retries: int = Field(2, alias="LLM_MAX_RETRIES", ge=0)
+    llm_model_fast: Optional[str] = Field(None, alias="LLM_MODEL_FAST")
+    llm_model_standard: Optional[str] = Field(None, alias="LLM_MODEL_STANDARD")
+    llm_model_advanced: Optional[str] = Field(None, alias="LLM_MODEL_ADVANCED")
     
     # Search Configuration
     serper_api_key: Optional[str] = Field(None, alias="SERPER_API_KEY")
+    serper_url: str = Field("https://google.serper.dev/search", alias="SERPER_URL")
+    search_max_concurrency: int = Field(4, alias="SEARCH_MAX_CONCURRENCY", ge=1)
+    
+    # HTTP Configuration
+    http_pool_size: int = Field(10, alias="HTTP_POOL_SIZE", ge=1)
+    http_max_retries: int = Field(3, alias="HTTP_MAX_RETRIES", ge=0)
+    http_backoff_factor: float = Field(0.5, alias="HTTP_BACKOFF_FACTOR", ge=0.0)
+    http_timeout: float = Field(30.0, alias="HTTP_TIMEOUT", gt=0.0)
+    
+    # Cache Configuration
+    cache_dir: str = Field(".cache", alias="CACHE_DIR")
+    search_cache_enabled: bool = Field(True, alias="SEARCH_CACHE_ENABLED")
+    search_cache_ttl: int = Field(21600, alias="SEARCH_CACHE_TTL", ge=0)
+    search_cache_max_entries: int = Field(
+        1000, alias="SEARCH_CACHE_MAX_ENTRIES", ge=1
+    )
+    workflow_cache_enabled: bool = Field(True, alias="WORKFLOW_CACHE_ENABLED")
+    workflow_cache_ttl: int = Field(3600, alias="WORKFLOW_CACHE_TTL", ge=0)
+    workflow_cache_max_entries: int = Field(
+        500, alias="WORKFLOW_CACHE_MAX_ENTRIES", ge=1
+    )
+    llm_cache_mode: Literal["auto", "on", "off"] = Field("auto", alias="LLM_CACHE")
+    llm_cache_ttl: int = Field(86400, alias="LLM_CACHE_TTL", ge=0)
+    llm_cache_max_entries: int = Field(
+        2000, alias="LLM_CACHE_MAX_ENTRIES", ge=1
+    )
     
     # Email Configuration
     email_user: Optional[str] = Field(None, alias="EMAIL_USER")
     email_pass: Optional[str] = Field(None, alias="EMAIL_PASS")
     smtp_server: str = Field("smtp.gmail.com", alias="SMTP_SERVER")
     smtp_port: int = Field(587, alias="SMTP_PORT")
+    smtp_use_tls: bool = Field(True, alias="SMTP_USE_TLS")
+    smtp_pool_size: int = Field(2, alias="SMTP_POOL_SIZE", ge=1)
+    smtp_idle_timeout: float = Field(60.0, alias="SMTP_IDLE_TIMEOUT", ge=0.0)
+    email_delivery_mode: Literal["agent", "direct"] = Field(
+        "agent", alias="EMAIL_DELIVERY_MODE"
+    )
+    email_outbox_enabled: bool = Field(True, alias="EMAIL_OUTBOX_ENABLED")
+    email_outbox_max_attempts: int = Field(5, alias="EMAIL_OUTBOX_MAX_ATTEMPTS", ge=1)
+    email_outbox_backoff: float = Field(30.0, alias="EMAIL_OUTBOX_BACKOFF", ge=0.0)
+    email_outbox_lease: float = Field(300.0, alias="EMAIL_OUTBOX_LEASE", gt=0.0)
     
     # Application Settings
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
@@ -40,6 +87,53 @@ class Settings(BaseSettings):
     enable_verbose: bool = Field(True, alias="ENABLE_VERBOSE")
     max_agent_iterations: int = Field(5, alias="MAX_AGENT_ITERATIONS", ge=1, le=20)
     max_rpm: int = Field(4, alias="MAX_RPM", ge=1)
+    workflow_max_concurrency: int = Field(4, alias="WORKFLOW_MAX_CONCURRENCY", ge=1)
+    job_workers: int = Field(2, alias="JOB_WORKERS", ge=1)
+    job_lease_seconds: float = Field(60.0, alias="JOB_LEASE_SECONDS", gt=0.0)
+    data_dir: str = Field(".data", alias="DATA_DIR")
+    checkpoints_enabled: bool = Field(True, alias="CHECKPOINTS_ENABLED")
+    
+    # Rate Limit Configuration (requests per minute shared by all workflows; 0 = unlimited)
+    rate_limit_backend: Literal["memory", "sqlite"] = Field(
+        "memory", alias="RATE_LIMIT_BACKEND"
+    )
+    rate_limit_burst: int = Field(5, alias="RATE_LIMIT_BURST", ge=1)
+    gemini_rpm: int = Field(60, alias="GEMINI_RPM", ge=0)
+    openai_rpm: int = Field(500, alias="OPENAI_RPM", ge=0)
+    serper_rpm: int = Field(300, alias="SERPER_RPM", ge=0)
+    
+    # Circuit Breaker Configuration
+    circuit_breaker_enabled: bool = Field(True, alias="CIRCUIT_BREAKER_ENABLED")
+    circuit_failure_rate: float = Field(
+        0.5, alias="CIRCUIT_FAILURE_RATE", gt=0.0, le=1.0
+    )
+    circuit_min_calls: int = Field(5, alias="CIRCUIT_MIN_CALLS", ge=1)
+    circuit_window: int = Field(20, alias="CIRCUIT_WINDOW", ge=1)
+    circuit_reset_timeout: float = Field(30.0, alias="CIRCUIT_RESET_TIMEOUT", gt=0.0)
+    circuit_max_reset_timeout: float = Field(
+        300.0, alias="CIRCUIT_MAX_RESET_TIMEOUT", gt=0.0
+    )
+    serper_slow_call_seconds: float = Field(10.0, alias="SERPER_SLOW_CALL_SECONDS", gt=0.0)
+    llm_slow_call_seconds: float = Field(120.0, alias="LLM_SLOW_CALL_SECONDS", gt=0.0)
+    
+    # Observability Configuration
+    tracing_enabled: bool = Field(False, alias="TRACING_ENABLED")
+    tracing_exporter: Literal["console", "file", "otlp"] = Field(
+        "file", alias="TRACING_EXPORTER"
+    )
+    tracing_file: Optional[str] = Field(None, alias="TRACING_FILE")
+    otlp_endpoint: Optional[str] = Field(None, alias="OTEL_EXPORTER_OTLP_ENDPOINT")
+    metrics_enabled: bool = Field(False, alias="METRICS_ENABLED")
+    metrics_host: str = Field("127.0.0.1", alias="METRICS_HOST")
+    metrics_port: int = Field(9108, alias="METRICS_PORT", ge=0, le=65535)
+    metrics_textfile: Optional[str] = Field(None, alias="METRICS_TEXTFILE")
+    metrics_textfile_interval: float = Field(
+        15.0, alias="METRICS_TEXTFILE_INTERVAL", gt=0.0
+    )
+    
+    # Record/Replay Configuration
+    replay_mode: Literal["off", "record", "replay"] = Field("off", alias="REPLAY_MODE")
+    replay_file: Optional[str] = Field(None, alias="REPLAY_FILE")
     
     class Config:
         env_file = ".env"
@@ -61,6 +155,29 @@ class Settings(BaseSettings):
             return self.openai_model
         return self.gemini_model
     
+    def model_for_tier(self, tier: ModelTier) -> str:
+        """Get the model configured for a tier (the provider's model if unset)."""
+        model = getattr(self, f"llm_model_{tier}", None)
+        return model or self.current_model
+    
+    def provider_for_model(self, model: str) -> str:
+        """Get the provider serving a model, from its prefix or name."""
+        name = model.lower()
+        if name.startswith(("gemini/", "google/", "gemini-")):
+            return "gemini"
+        if name.startswith(("openai/", "gpt-", "chatgpt-", "o1", "o3", "o4")):
+            return "openai"
+        return self.llm_provider
+    
+    @property
+    def llm_rate_limited(self) -> bool:
+        """Whether every provider used by the model tiers has a shared RPM budget."""
+        providers = {
+            self.provider_for_model(self.model_for_tier(tier))
+            for tier in get_args(ModelTier)
+        }
+        return all(getattr(self, f"{provider}_rpm", 0) for provider in providers)
+    
     @property
     def current_api_key(self) -> Optional[str]:
         """Get the API key for the selected provider."""
@@ -68,12 +185,49 @@ class Settings(BaseSettings):
             return self.openai_api_key
         return self.google_api_key
     
+    @property
+    def cache_path(self) -> Path:
+        """Get the SQLite file used for on-disk caches."""
+        return Path(self.cache_dir) / "cache.db"
+    
+    @property
+    def data_path(self) -> Path:
+        """Get the directory for durable local state (jobs, spools)."""
+        return Path(self.data_dir)
+    
+    @property
+    def trace_path(self) -> Path:
+        """Get the JSONL file written by the file trace exporter."""
+        if self.tracing_file:
+            return Path(self.tracing_file)
+        return self.data_path / "traces.jsonl"
+    
+    @property
+    def replay_path(self) -> Path:
+        """Get the recording read or written by REPLAY_MODE."""
+        if self.replay_file:
+            return Path(self.replay_file)
+        return self.data_path / "replay.jsonl.gz"
+    
+    @property
+    def replaying(self) -> bool:
+        """Whether LLM and search traffic is served from a recording."""
+        return self.replay_mode == "replay"
+    
+    @property
+    def workflow_cache_active(self) -> bool:
+        """Whether whole workflows may be served from or saved to the cache."""
+        # Recording and replaying must run the full pipeline
+        return self.workflow_cache_enabled and self.replay_mode == "off"
+    
     def validate_required_keys(self) -> dict[str, bool]:
         """Check which required API keys are configured."""
+        # Replayed runs never call the LLM or search APIs, nor send email
+        replaying = self.replaying
         return {
-            "llm": self.current_api_key is not None,
-            "search": self.serper_api_key is not None,
-            "email": self.email_user is not None and self.email_pass is not None,
+            "llm": replaying or self.current_api_key is not None,
+            "search": replaying or self.serper_api_key is not None,
+            "email": replaying or (self.email_user is not None and self.email_pass is not None),
         }
     
     def get_missing_keys(self) -> list[str]:
@@ -8,6 +8,8 @@ research and reporting system.
 import streamlit as st
 import sys
 import os
+import re
+import time
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,20 +20,24 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from app.config.settings import get_settings
-from app.services import CrewService
+from app.services import CrewService, ResearchResult, get_job_queue
 from app.utils import validate_email, validate_topic, setup_logging
+from app.utils.metrics import start_metrics_exporter
 from app.ui import (
     get_custom_css,
     render_header,
     render_config_panel,
     render_features_panel,
     render_results,
+    render_job_progress,
     render_download_buttons,
     render_configuration_warning,
     render_footer,
 )
 
 
+JOB_POLL_INTERVAL = 1.0
+
 
 def setup_page():
     """Configure Streamlit page settings."""
@@ -65,15 +71,24 @@ def check_configuration() -> bool:
 
 def run_research(config: dict):
     """
-    Execute the research workflow with progress updates.
+    Queue the research workflow for background execution.
     
     Args:
         config: Dictionary with research configuration.
     """
     # Validate inputs
-    email_result = validate_email(config["recipient_email"])
-    if not email_result.is_valid:
-        st.error(f"Invalid email: {email_result.error}")
+    recipients = []
+    for address in re.split(r"[,;\s]+", config["recipient_email"]):
+        if not address:
+            continue
+        email_result = validate_email(address)
+        if not email_result.is_valid:
+            st.error(f"Invalid email: {email_result.error}")
+            return
+        recipients.append(email_result.value)
+    
+    if not recipients:
+        st.error("Invalid email: Email address is required")
         return
     
     topic_result = validate_topic(config["topic"])
@@ -81,34 +96,45 @@ def run_research(config: dict):
         st.error(f"Invalid topic: {topic_result.error}")
         return
     
-    # Create progress container
-    progress_container = st.empty()
-    status_container = st.empty()
-    
-    def update_progress(percentage: int, message: str):
-        """Callback for progress updates."""
-        progress_container.progress(percentage / 100)
-        status_container.info(f"{message}")
-    
-    # Initialize crew service with progress callback
-    crew_service = CrewService(progress_callback=update_progress)
-    
-    # Execute research
-    with st.spinner("AI research team is working..."):
-        result = crew_service.execute_research_workflow(
-            topic=topic_result.value,
-            recipient_email=email_result.value,
-            report_format=config["report_format"],
-            num_results=config["num_results"],
-        )
+    # Queue the workflow; a background worker runs it
+    job_id = get_job_queue().submit(
+        topic=topic_result.value,
+        recipient_email=recipients if len(recipients) > 1 else recipients[0],
+        report_format=config["report_format"],
+        num_results=config["num_results"],
+    )
+    
+    # Track the job in session state
+    st.session_state.pop("result", None)
+    st.session_state.job_id = job_id
+    st.session_state.topic = config["topic"]
+
+
+def poll_research_job():
+    """Show progress for the active job and collect its result when done."""
+    job = get_job_queue().get(st.session_state.job_id)
     
-    # Clear progress indicators
-    progress_container.empty()
-    status_container.empty()
+    if job is None:
+        st.session_state.pop("job_id", None)
+        return
+    
+    if job.is_active:
+        render_job_progress(job)
+        time.sleep(JOB_POLL_INTERVAL)
+        st.rerun()
+    
+    # Jobs failed on behalf of a dead worker process have no result
+    result = job.result
+    if result is None:
+        result = ResearchResult(
+            success=False,
+            error_message=job.message,
+            run_id=job.job_id,
+        )
     
     # Store result in session state
     st.session_state.result = result
-    st.session_state.topic = config["topic"]
+    st.session_state.pop("job_id", None)
 
 
 def main():
@@ -116,6 +142,9 @@ def main():
     # Setup logging
     setup_logging()
     
+    # Expose Prometheus metrics (once per process)
+    start_metrics_exporter()
+    
     # Configure page
     setup_page()
     
@@ -151,14 +180,35 @@ def main():
         else:
             run_research(config)
     
+    # Follow the queued job until it finishes
+    if "job_id" in st.session_state:
+        poll_research_job()
+    
     # Display results if available
     if "result" in st.session_state:
+        result = st.session_state.result
+        if result.run_id:
+            result.delivery_status = (
+                CrewService().get_delivery_status(result.run_id)
+                or result.delivery_status
+            )
+        
         st.markdown("---")
         render_results(st.session_state.result)
         render_download_buttons(
             st.session_state.result, 
             st.session_state.get("topic", "research")
         )
+        
+        # Offer to resume failed runs from their last completed stage
+        if not result.success and result.run_id:
+            if st.button("Resume from last completed stage"):
+                if get_job_queue().resume(result.run_id):
+                    st.session_state.pop("result", None)
+                    st.session_state.job_id = result.run_id
+                    st.rerun()
+                else:
+                    st.error("This run can no longer be resumed.")
     
     # Render footer
     render_footer()
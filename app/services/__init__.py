@@ -1,8 +1,24 @@
 """AI Research Crew Pro - Services Module"""
 
-from .crew_service import CrewService, ResearchResult
+from .crew_service import CrewService, ResearchResult, WorkflowRequest
+from .checkpoints import Checkpoint, CheckpointStore, get_checkpoint_store
+from .progress import ProgressTracker, StageHistory, get_stage_history
+from .streaming import stream_to
+from .job_queue import JobQueue, Job, JobStatus, get_job_queue
 
 __all__ = [
     "CrewService",
     "ResearchResult",
+    "WorkflowRequest",
+    "Checkpoint",
+    "CheckpointStore",
+    "get_checkpoint_store",
+    "ProgressTracker",
+    "StageHistory",
+    "get_stage_history",
+    "stream_to",
+    "JobQueue",
+    "Job",
+    "JobStatus",
+    "get_job_queue",
 ]
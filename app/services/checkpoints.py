@@ -0,0 +1,195 @@
+"""
+Workflow Checkpoints for AI Research Crew Pro
+
+Persists the output of each completed workflow stage so a failed
+run can resume from its last completed stage instead of starting over.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+STAGE_RESEARCH = "research"
+STAGE_SUMMARY = "summary"
+STAGE_EMAIL = "email"
+
+STAGE_COLUMNS = {
+    STAGE_RESEARCH: "research_output",
+    STAGE_SUMMARY: "summary_output",
+    STAGE_EMAIL: "email_output",
+}
+
+
+@dataclass
+class Checkpoint:
+    """Stored progress of one workflow run."""
+    run_id: str
+    request: dict
+    research_output: Optional[str] = None
+    summary_output: Optional[str] = None
+    email_output: Optional[str] = None
+    delivery_status: Dict[str, str] = field(default_factory=dict)
+    completed: bool = False
+    updated_at: float = 0.0
+
+    @property
+    def last_stage(self) -> Optional[str]:
+        """Name of the last completed stage, if any."""
+        for stage in (STAGE_EMAIL, STAGE_SUMMARY, STAGE_RESEARCH):
+            if getattr(self, STAGE_COLUMNS[stage]):
+                return stage
+        return None
+
+
+class CheckpointStore:
+    """
+    SQLite-backed store of per-stage workflow output.
+
+    A checkpoint is opened when a workflow starts, updated by task
+    callbacks as each stage completes, and marked complete when the
+    workflow succeeds.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite database file for checkpoints.
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                run_id TEXT PRIMARY KEY,
+                request TEXT NOT NULL,
+                research_output TEXT,
+                summary_output TEXT,
+                email_output TEXT,
+                delivery_status TEXT NOT NULL DEFAULT '{}',
+                completed INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    def begin(self, run_id: str, request: dict):
+        """
+        Open a checkpoint for a run, keeping any stages already stored.
+
+        Args:
+            run_id: Workflow run id.
+            request: Serialized workflow request.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO checkpoints (run_id, request, updated_at) "
+                "VALUES (?, ?, ?) ON CONFLICT(run_id) DO UPDATE SET "
+                "request = excluded.request, updated_at = excluded.updated_at",
+                (run_id, json.dumps(request), time.time()),
+            )
+
+    def save_stage(self, run_id: str, stage: str, output: str):
+        """
+        Record the output of a completed stage.
+
+        Args:
+            run_id: Workflow run id.
+            stage: One of the STAGE_* names.
+            output: Raw task output.
+        """
+        column = STAGE_COLUMNS[stage]
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE checkpoints SET {column} = ?, updated_at = ? "
+                "WHERE run_id = ?",
+                (output, time.time(), run_id),
+            )
+        logger.info(f"Checkpointed {stage} stage for run {run_id}")
+
+    def save_delivery(self, run_id: str, delivery_status: Dict[str, str]):
+        """Record per-recipient delivery status for a run."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE checkpoints SET delivery_status = ?, updated_at = ? "
+                "WHERE run_id = ?",
+                (json.dumps(delivery_status), time.time(), run_id),
+            )
+
+    def mark_completed(self, run_id: str):
+        """Flag a run as having finished successfully."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE checkpoints SET completed = 1, updated_at = ? "
+                "WHERE run_id = ?",
+                (time.time(), run_id),
+            )
+
+    def load(self, run_id: str) -> Optional[Checkpoint]:
+        """
+        Load the checkpoint for a run.
+
+        Args:
+            run_id: Workflow run id.
+
+        Returns:
+            Checkpoint, or None if the run is unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, request, research_output, summary_output, "
+                "email_output, delivery_status, completed, updated_at "
+                "FROM checkpoints WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        (
+            run_id, request, research_output, summary_output,
+            email_output, delivery_status, completed, updated_at,
+        ) = row
+        return Checkpoint(
+            run_id=run_id,
+            request=json.loads(request),
+            research_output=research_output,
+            summary_output=summary_output,
+            email_output=email_output,
+            delivery_status=json.loads(delivery_status),
+            completed=bool(completed),
+            updated_at=updated_at,
+        )
+
+
+@lru_cache()
+def get_checkpoint_store() -> CheckpointStore:
+    """
+    Get the process-wide checkpoint store.
+
+    Returns:
+        CheckpointStore configured from settings.
+    """
+    settings = get_settings()
+    return CheckpointStore(settings.data_path / "checkpoints.db")
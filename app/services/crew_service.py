@@ -5,10 +5,15 @@ Provides high-level orchestration of the multi-agent research
 workflow with progress tracking and result handling.
 """
 
-from dataclasses import dataclass, field
+import asyncio
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
-from typing import Optional, List, Callable, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple, Union, Callable, Any, Iterator
 from crewai import Crew
+from crewai.events import crewai_event_bus
 
 from app.config.settings import get_settings, setup_crewai_environment
 from app.agents import (
@@ -21,11 +26,61 @@ from app.tasks import (
     create_summarization_task,
     create_email_task,
 )
+from app.services.checkpoints import (
+    Checkpoint,
+    get_checkpoint_store,
+    STAGE_RESEARCH,
+    STAGE_SUMMARY,
+    STAGE_EMAIL,
+)
+from app.services.progress import ProgressTracker, get_stage_history
+from app.services.streaming import stream_to
+from app.tools import create_email_tool
+from app.utils.cache import DiskCache
+from app.utils.instrumentation import (
+    MetricsCollector,
+    WorkflowMetrics,
+    collecting,
+    get_collector,
+)
 from app.utils.logger import get_logger, TaskLogger
+from app.utils.metrics import (
+    LLM_CALLS,
+    LLM_TOKENS,
+    STAGE_DURATION,
+    WORKFLOW_DURATION,
+    WORKFLOWS_TOTAL,
+    record_failure,
+)
+from app.utils.outbox import get_outbox
+from app.utils.tracing import (
+    STATUS_ERROR,
+    Span,
+    SpanSequence,
+    get_tracer,
+    trace_span,
+)
 
 logger = get_logger(__name__)
 
 
+REPORT_EMAIL_TEMPLATE = """Hello,
+
+Please find below the {report_format} on **{topic}**, prepared by the Prime Brief research team.
+
+---
+
+{summary}
+
+---
+
+This report was researched and summarized by AI agents. Please verify critical facts before acting on them, and reply to this email with any questions.
+
+Best regards,
+
+Prime Brief"""
+
+
 @dataclass
 class ResearchResult:
     """Container for research workflow results."""
@@ -36,6 +91,10 @@ class ResearchResult:
     error_message: Optional[str] = None
     execution_time: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
+    run_id: Optional[str] = None
+    delivery_status: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+    metrics: Optional[WorkflowMetrics] = None
     
     def get_task_outputs(self) -> List[str]:
         """Get list of all task outputs."""
@@ -47,6 +106,109 @@ class ResearchResult:
         if self.email_output:
             outputs.append(self.email_output)
         return outputs
+    
+    def to_dict(self) -> dict:
+        """Serialize the result to JSON-compatible primitives."""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        data["metrics"] = self.metrics.to_dict() if self.metrics else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResearchResult":
+        """Rebuild a result produced by to_dict()."""
+        data = dict(data)
+        if isinstance(data.get("timestamp"), str):
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        if isinstance(data.get("metrics"), dict):
+            data["metrics"] = WorkflowMetrics.from_dict(data["metrics"])
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass
+class WorkflowRequest:
+    """Parameters of a single research workflow run."""
+    topic: str
+    recipients: List[str]
+    report_format: str = "Summary Report"
+    num_results: int = 5
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    
+    @classmethod
+    def create(
+        cls,
+        topic: str,
+        recipient_email: Union[str, List[str]],
+        report_format: str = "Summary Report",
+        num_results: int = 5,
+        run_id: Optional[str] = None,
+    ) -> "WorkflowRequest":
+        """Build a request from the public workflow arguments."""
+        if isinstance(recipient_email, str):
+            recipients = [recipient_email]
+        else:
+            recipients = list(dict.fromkeys(recipient_email))
+        
+        if not recipients:
+            raise ValueError("At least one recipient email is required")
+        
+        request = cls(
+            topic=topic,
+            recipients=recipients,
+            report_format=report_format,
+            num_results=num_results,
+        )
+        if run_id:
+            request.run_id = run_id
+        return request
+    
+    @property
+    def cache_key(self) -> str:
+        """Result cache key: normalized topic, format and source count."""
+        return DiskCache.make_key(
+            " ".join(self.topic.lower().split()),
+            self.report_format,
+            self.num_results,
+        )
+    
+    @property
+    def subject(self) -> str:
+        """Email subject line for the report."""
+        return f"AI Research Report: {self.topic} - {self.report_format}"
+    
+    @property
+    def use_email_agent(self) -> bool:
+        """Whether delivery runs as an agent task inside the crew."""
+        return (
+            len(self.recipients) == 1
+            and get_settings().email_delivery_mode == "agent"
+        )
+    
+    def format_email_body(self, summary_output: str) -> str:
+        """Wrap the report in the fixed greeting and sign-off."""
+        return REPORT_EMAIL_TEMPLATE.format(
+            report_format=self.report_format,
+            topic=self.topic,
+            summary=summary_output,
+        )
+
+
+@lru_cache()
+def get_workflow_cache() -> DiskCache:
+    """
+    Get the shared on-disk cache for completed workflow outputs.
+    
+    Returns:
+        DiskCache instance configured from settings.
+    """
+    settings = get_settings()
+    return DiskCache(
+        path=settings.cache_path,
+        namespace="workflow",
+        ttl_seconds=settings.workflow_cache_ttl,
+        max_entries=settings.workflow_cache_max_entries,
+    )
 
 
 class CrewService:
@@ -59,7 +221,9 @@ class CrewService:
     
     def __init__(
         self,
-        progress_callback: Optional[Callable[[int, str], None]] = None
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        stage_callback: Optional[Callable[[str, str], None]] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
     ):
         """
         Initialize the crew service.
@@ -67,8 +231,14 @@ class CrewService:
         Args:
             progress_callback: Optional callback for progress updates.
                               Receives (percentage, message) arguments.
+            stage_callback: Optional callback fired as each stage finishes.
+                            Receives (stage name, stage output) arguments.
+            stream_callback: Optional callback for streamed LLM text chunks
+                             (requires LLM_STREAMING).
         """
         self.progress_callback = progress_callback
+        self.stage_callback = stage_callback
+        self.stream_callback = stream_callback
         self._task_logger = TaskLogger("crew_service")
         
         # Ensure CrewAI environment is configured
@@ -80,115 +250,664 @@ class CrewService:
             self.progress_callback(percentage, message)
         self._task_logger.progress(message, percentage)
     
-    def execute_research_workflow(
+    def _update_live_progress(self, percentage: int, message: str):
+        """
+        Forward a tracker update (agent step or periodic tick) to the callback.
+        
+        These arrive every few seconds per workflow, so they are only
+        logged at DEBUG; stage transitions are logged by the tracker.
+        """
+        if self.progress_callback:
+            self.progress_callback(percentage, message)
+        logger.debug(f"[{percentage}%] {message}")
+    
+    def _emit_stage(self, stage: str, output: Optional[str]):
+        """Push a finished stage's output to the stage callback."""
+        if self.stage_callback and output:
+            try:
+                self.stage_callback(stage, output)
+            except Exception as e:
+                logger.warning(f"Stage callback failed for {stage}: {e}")
+    
+    def _build_crew(
         self,
-        topic: str,
-        recipient_email: str,
-        report_format: str = "Summary Report",
-        num_results: int = 5,
-    ) -> ResearchResult:
+        request: WorkflowRequest,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Tuple[Optional[Crew], List[str]]:
         """
-        Execute the complete research workflow.
+        Create the agents and tasks and assemble them into a crew.
+        
+        Stages already present in the checkpoint are skipped and their
+        stored output is passed to the next task instead. The email
+        agent is only included for single-recipient runs in agent
+        delivery mode; otherwise the report is delivered directly
+        after the crew finishes.
         
         Args:
-            topic: Research topic to investigate.
-            recipient_email: Email address to send report to.
-            report_format: Format for the final report.
-            num_results: Number of search results to gather.
+            request: The workflow being executed.
+            checkpoint: Stored progress when resuming a run.
             
         Returns:
-            ResearchResult with all outputs or error information.
+            Tuple of (crew, or None if no stage is left to run,
+            stage names in task order).
         """
-        start_time = datetime.now()
-        self._task_logger.start(f"Starting research workflow for: {topic[:50]}...")
+        research_output = checkpoint.research_output if checkpoint else None
+        summary_output = checkpoint.summary_output if checkpoint else None
+        email_output = checkpoint.email_output if checkpoint else None
         
-        try:
-            # Phase 1: Create agents
-            self._update_progress(10, "Assembling AI research team...")
-            
-            researcher = create_researcher_agent(topic, num_results)
-            summarizer = create_summarizer_agent(report_format)
-            email_agent = create_email_agent()
-            
-            # Phase 2: Create tasks
-            self._update_progress(25, "Configuring research tasks...")
-            
+        agents = []
+        tasks = []
+        stages = []
+        research_task = None
+        summarization_task = None
+        
+        # Phase 1: Create agents and tasks
+        self._update_progress(10, "Assembling AI research team...")
+        
+        if not research_output:
+            researcher = create_researcher_agent(request.topic, request.num_results)
             research_task = create_research_task(
                 agent=researcher,
-                topic=topic,
-                num_results=num_results,
+                topic=request.topic,
+                num_results=request.num_results,
             )
-            
+            agents.append(researcher)
+            tasks.append(research_task)
+            stages.append(STAGE_RESEARCH)
+        
+        # Phase 2: Create tasks
+        self._update_progress(25, "Configuring research tasks...")
+        
+        if not summary_output:
+            summarizer = create_summarizer_agent(request.report_format)
             summarization_task = create_summarization_task(
                 agent=summarizer,
-                report_format=report_format,
+                report_format=request.report_format,
                 research_task=research_task,
+                research_output=research_output,
             )
-            
+            agents.append(summarizer)
+            tasks.append(summarization_task)
+            stages.append(STAGE_SUMMARY)
+        
+        if request.use_email_agent and not email_output:
+            email_agent = create_email_agent(batch_id=request.run_id)
             email_task = create_email_task(
                 agent=email_agent,
-                recipient_email=recipient_email,
-                topic=topic,
-                report_format=report_format,
+                recipient_email=request.recipients[0],
+                topic=request.topic,
+                report_format=request.report_format,
                 summarization_task=summarization_task,
+                summary_output=summary_output,
             )
+            agents.append(email_agent)
+            tasks.append(email_task)
+            stages.append(STAGE_EMAIL)
+        
+        # Phase 3: Assemble crew
+        self._update_progress(40, "Initiating research process...")
+        
+        if not tasks:
+            return None, stages
+        
+        settings = get_settings()
+        
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            verbose=settings.enable_verbose,
+            memory=settings.enable_memory,
+            # The shared per-provider limiter replaces CrewAI's per-crew one
+            max_rpm=None if settings.llm_rate_limited else settings.max_rpm,
+        )
+        return crew, stages
+    
+    def _create_tracker(self, crew: Crew, stages: List[str]) -> ProgressTracker:
+        """
+        Attach an event-driven progress tracker to a crew.
+        
+        Args:
+            crew: The assembled crew.
+            stages: Stage names of the crew's tasks, in order.
             
-            # Phase 3: Assemble and run crew
-            self._update_progress(40, "Initiating research process...")
+        Returns:
+            ProgressTracker fed by the crew's step and task callbacks.
+        """
+        tracker = ProgressTracker(stages, self._update_live_progress, get_stage_history())
+        crew.step_callback = tracker.on_step
+        crew.task_callback = tracker.on_task_complete
+        
+        collector = get_collector()
+        if collector is not None:
+            collector.stage_resolver = lambda: tracker.current_stage
+        return tracker
+    
+    def _checkpoint_tasks(
+        self, crew: Crew, request: WorkflowRequest, tracker: ProgressTracker
+    ):
+        """
+        Checkpoint and publish each stage's output from the crew task callback.
+        
+        This is chained onto the crew rather than set per task, since
+        CrewAI warns that per-task function callbacks cannot be serialized.
+        
+        Args:
+            crew: The assembled crew (after _create_tracker).
+            request: The workflow being executed.
+            tracker: Progress tracker whose current stage is finishing.
+        """
+        on_task_complete = crew.task_callback
+        
+        def task_callback(output: Any):
+            stage = tracker.current_stage
+            if stage is not None:
+                if get_settings().checkpoints_enabled:
+                    get_checkpoint_store().save_stage(request.run_id, stage, output.raw)
+                self._emit_stage(stage, output.raw)
+            on_task_complete(output)
+        
+        crew.task_callback = task_callback
+    
+    def _trace_tasks(self, crew: Crew, stages: List[str]) -> SpanSequence:
+        """
+        Open a tracing span per crew task, closed by the task callback.
+        
+        Args:
+            crew: The assembled crew (after _create_tracker).
+            stages: Stage names of the crew's tasks, in order.
             
-            settings = get_settings()
+        Returns:
+            SpanSequence to run around the crew kickoff.
+        """
+        task_spans = SpanSequence(get_tracer(), [f"task.{stage}" for stage in stages])
+        on_task_complete = crew.task_callback
+        
+        def task_callback(output: Any):
+            on_task_complete(output)
             
-            crew = Crew(
-                agents=[researcher, summarizer, email_agent],
-                tasks=[research_task, summarization_task, email_task],
-                verbose=settings.enable_verbose,
-                memory=settings.enable_memory,
-                max_rpm=settings.max_rpm,
+            attributes = {}
+            collector = get_collector()
+            if collector is not None and task_spans.index < len(stages):
+                stats = collector.metrics.stage(stages[task_spans.index])
+                attributes = dict(
+                    llm_calls=stats.llm_calls,
+                    prompt_tokens=stats.prompt_tokens,
+                    completion_tokens=stats.completion_tokens,
+                    total_tokens=stats.total_tokens,
+                )
+            task_spans.advance(
+                agent=str(getattr(output, "agent", "")),
+                output_chars=len(output.raw or ""),
+                **attributes,
             )
+        
+        crew.task_callback = task_callback
+        return task_spans
+    
+    def _collect_crew_metrics(self, stages: List[str], tracker: ProgressTracker):
+        """
+        Fold per-stage timing of a finished crew into the current
+        metrics collector.
+        
+        LLM requests and token usage are recorded as they happen (see
+        LLMPool); this waits for the last usage reports to arrive.
+        
+        Args:
+            stages: Stage names of the crew's tasks, in order.
+            tracker: Progress tracker that observed the run.
+        """
+        collector = get_collector()
+        if collector is None:
+            return
+        collector.stage_resolver = None
+        crewai_event_bus.flush()
+        
+        for stage in stages:
+            stats = collector.metrics.stage(stage)
+            stats.wall_time += tracker.durations.get(stage, 0.0)
+            stats.tool_calls += tracker.tool_calls.get(stage, 0)
             
-            self._update_progress(50, "AI agents working on research...")
+            logger.info(
+                f"Stage {stage}: {stats.wall_time:.1f}s, {stats.llm_calls} LLM calls, "
+                f"{stats.total_tokens} tokens, {stats.tool_calls} tool calls"
+            )
+    
+    def _deliver_report(
+        self, request: WorkflowRequest, summary_output: str
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Send the finished report to every recipient outside the LLM loop.
+        
+        The subject follows the email task's pattern and the body wraps
+        the summary in a fixed template, so no LLM call is needed.
+        
+        Args:
+            request: The workflow being executed.
+            summary_output: The summarizer's Markdown report.
             
-            # Execute the crew
-            result = crew.kickoff()
+        Returns:
+            Tuple of (delivery summary text, per-recipient status).
+        """
+        self._update_progress(
+            95, f"Delivering report to {len(request.recipients)} recipient(s)..."
+        )
+        
+        collector = get_collector()
+        email_tool = create_email_tool(batch_id=request.run_id)
+        with collector.stage(STAGE_EMAIL) if collector else nullcontext():
+            status = email_tool.send_bulk(
+                request.recipients,
+                request.subject,
+                request.format_email_body(summary_output),
+            )
+        
+        delivered = sum(1 for s in status.values() if s in ("sent", "queued"))
+        email_output = (
+            f"Report delivered to {delivered} of {len(request.recipients)} recipients"
+        )
+        return email_output, status
+    
+    def _build_result(
+        self,
+        request: WorkflowRequest,
+        result: Any,
+        start_time: datetime,
+        stages: List[str],
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> ResearchResult:
+        """
+        Convert a crew output into a ResearchResult.
+        
+        Args:
+            request: The workflow being executed.
+            result: Output returned by crew kickoff (None if no crew ran).
+            start_time: When the workflow started.
+            stages: Stage names of the crew's tasks, in order.
+            checkpoint: Stored progress when resuming a run.
             
-            self._update_progress(90, "Finalizing results...")
+        Returns:
+            Successful ResearchResult with task outputs.
+        """
+        self._update_progress(90, "Finalizing results...")
+        
+        # Start from checkpointed stages, then overlay this run's outputs
+        outputs = {}
+        delivery_status = {}
+        if checkpoint:
+            outputs = {
+                STAGE_RESEARCH: checkpoint.research_output,
+                STAGE_SUMMARY: checkpoint.summary_output,
+                STAGE_EMAIL: checkpoint.email_output,
+            }
+            delivery_status = dict(checkpoint.delivery_status)
+        
+        if hasattr(result, 'tasks_output') and result.tasks_output:
+            for stage, task_output in zip(stages, result.tasks_output):
+                outputs[stage] = task_output.raw
+        
+        research_output = outputs.get(STAGE_RESEARCH)
+        summary_output = outputs.get(STAGE_SUMMARY)
+        email_output = outputs.get(STAGE_EMAIL)
+        
+        if research_output and summary_output and get_settings().workflow_cache_active:
+            get_workflow_cache().set(request.cache_key, {
+                "research_output": research_output,
+                "summary_output": summary_output,
+            })
+        
+        if not request.use_email_agent and summary_output and not email_output:
+            email_output, delivery_status = self._deliver_report(request, summary_output)
+            self._emit_stage(STAGE_EMAIL, email_output)
+            if get_settings().checkpoints_enabled:
+                store = get_checkpoint_store()
+                store.save_stage(request.run_id, STAGE_EMAIL, email_output)
+                store.save_delivery(request.run_id, delivery_status)
+        
+        if get_settings().checkpoints_enabled:
+            get_checkpoint_store().mark_completed(request.run_id)
+        
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self._update_progress(100, "Research complete!")
+        self._task_logger.success(f"Workflow completed in {execution_time:.2f}s")
+        
+        return ResearchResult(
+            success=True,
+            research_output=research_output,
+            summary_output=summary_output,
+            email_output=email_output,
+            execution_time=execution_time,
+            run_id=request.run_id,
+            delivery_status=self.get_delivery_status(request.run_id) or delivery_status,
+            metrics=self._current_metrics(),
+        )
+    
+    def _serve_from_cache(
+        self, request: WorkflowRequest, start_time: datetime
+    ) -> Optional[ResearchResult]:
+        """
+        Return a result built from a fresh cached run, if one exists.
+        
+        The cached report is still delivered to this request's recipients.
+        
+        Args:
+            request: The workflow being executed.
+            start_time: When the workflow started.
             
-            # Extract task outputs
-            research_output = None
-            summary_output = None
-            email_output = None
+        Returns:
+            ResearchResult served from cache, or None on a miss.
+        """
+        if not get_settings().workflow_cache_active:
+            return None
+        
+        cached = get_workflow_cache().get(request.cache_key)
+        if cached is None:
+            return None
+        
+        self._update_progress(50, "Reusing a recent report on this topic...")
+        
+        summary_output = cached["summary_output"]
+        self._emit_stage(STAGE_RESEARCH, cached["research_output"])
+        self._emit_stage(STAGE_SUMMARY, summary_output)
+        
+        email_output, delivery_status = self._deliver_report(request, summary_output)
+        self._emit_stage(STAGE_EMAIL, email_output)
+        
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self._update_progress(100, "Research complete!")
+        self._task_logger.success(f"Workflow served from cache in {execution_time:.2f}s")
+        
+        return ResearchResult(
+            success=True,
+            research_output=cached["research_output"],
+            summary_output=summary_output,
+            email_output=email_output,
+            execution_time=execution_time,
+            run_id=request.run_id,
+            delivery_status=self.get_delivery_status(request.run_id) or delivery_status,
+            from_cache=True,
+            metrics=self._current_metrics(),
+        )
+    
+    def _build_error_result(
+        self, request: WorkflowRequest, error: Exception, start_time: datetime
+    ) -> ResearchResult:
+        """Convert a workflow exception into a failed ResearchResult."""
+        execution_time = (datetime.now() - start_time).total_seconds()
+        
+        self._task_logger.error("Workflow failed", error)
+        record_failure("workflow", type(error).__name__)
+        
+        return ResearchResult(
+            success=False,
+            error_message=str(error),
+            execution_time=execution_time,
+            run_id=request.run_id,
+            metrics=self._current_metrics(),
+        )
+    
+    @contextmanager
+    def _observe(self, request: WorkflowRequest, **attributes: Any) -> Iterator[Span]:
+        """
+        Collect metrics and open a workflow span for one run.
+        
+        Args:
+            request: The workflow being executed.
+            **attributes: Extra span attributes.
+        """
+        with collecting(MetricsCollector()), trace_span(
+            "workflow",
+            run_id=request.run_id,
+            topic=request.topic[:200],
+            report_format=request.report_format,
+            num_results=request.num_results,
+            recipient_count=len(request.recipients),
+            **attributes,
+        ) as span:
+            yield span
+    
+    @staticmethod
+    def _record_metrics(result: ResearchResult):
+        """Export a finished workflow's outcome, stage timings and token usage."""
+        status = "success" if result.success else "failure"
+        WORKFLOWS_TOTAL.inc(status=status, source="cache" if result.from_cache else "crew")
+        WORKFLOW_DURATION.observe(result.execution_time, status=status)
+        
+        if result.metrics is None:
+            return
+        for stage, stats in result.metrics.stages.items():
+            STAGE_DURATION.observe(stats.wall_time, stage=stage)
+            if stats.llm_calls:
+                LLM_CALLS.inc(stats.llm_calls, stage=stage)
+            if stats.prompt_tokens:
+                LLM_TOKENS.inc(stats.prompt_tokens, stage=stage, kind="prompt")
+            if stats.completion_tokens:
+                LLM_TOKENS.inc(stats.completion_tokens, stage=stage, kind="completion")
+    
+    def _finish_span(self, span: Span, result: ResearchResult) -> ResearchResult:
+        """Record a workflow's outcome on its span and in metrics, then return it."""
+        self._record_metrics(result)
+        span.set_attributes(
+            success=result.success,
+            from_cache=result.from_cache,
+            execution_time=result.execution_time,
+        )
+        if result.metrics:
+            span.set_attributes(
+                llm_calls=result.metrics.llm_calls,
+                total_tokens=result.metrics.total_tokens,
+                tool_calls=result.metrics.tool_calls,
+            )
+        if not result.success:
+            span.set_status(STATUS_ERROR, result.error_message)
+        return result
+    
+    @staticmethod
+    def _current_metrics() -> Optional[WorkflowMetrics]:
+        """Metrics gathered so far by the current collector, if any."""
+        collector = get_collector()
+        return collector.metrics if collector else None
+    
+    def _begin_checkpoint(self, request: WorkflowRequest):
+        """Open a checkpoint record for a new run."""
+        if get_settings().checkpoints_enabled:
+            get_checkpoint_store().begin(request.run_id, asdict(request))
+    
+    def _run_workflow(
+        self,
+        request: WorkflowRequest,
+        start_time: datetime,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> ResearchResult:
+        """Build and run the crew for the remaining stages of a workflow."""
+        crew, stages = self._build_crew(request, checkpoint)
+        
+        result = None
+        if crew is not None:
+            tracker = self._create_tracker(crew, stages)
+            self._checkpoint_tasks(crew, request, tracker)
+            task_spans = self._trace_tasks(crew, stages)
             
-            if hasattr(result, 'tasks_output') and result.tasks_output:
-                if len(result.tasks_output) > 0:
-                    research_output = result.tasks_output[0].raw
-                if len(result.tasks_output) > 1:
-                    summary_output = result.tasks_output[1].raw
-                if len(result.tasks_output) > 2:
-                    email_output = result.tasks_output[2].raw
+            # Execute the crew
+            try:
+                with tracker.running(), task_spans.running(), \
+                        stream_to(request.run_id, self.stream_callback):
+                    result = crew.kickoff()
+            finally:
+                self._collect_crew_metrics(stages, tracker)
+        
+        return self._build_result(request, result, start_time, stages, checkpoint)
+    
+    def _execute(self, request: WorkflowRequest, start_time: datetime) -> ResearchResult:
+        """Serve a new run from the workflow cache, or checkpoint and run it."""
+        result = self._serve_from_cache(request, start_time)
+        if result is None:
+            self._begin_checkpoint(request)
+            result = self._run_workflow(request, start_time)
+        return result
+    
+    def execute_research_workflow(
+        self,
+        topic: str,
+        recipient_email: Union[str, List[str]],
+        report_format: str = "Summary Report",
+        num_results: int = 5,
+        run_id: Optional[str] = None,
+    ) -> ResearchResult:
+        """
+        Execute the complete research workflow.
+        
+        Args:
+            topic: Research topic to investigate.
+            recipient_email: Email address, or list of addresses, to send
+                             the report to. A list is delivered in bulk
+                             after a single research run.
+            report_format: Format for the final report.
+            num_results: Number of search results to gather.
+            run_id: Optional id for the run (used for checkpoints and
+                    resume). Generated when omitted.
             
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_progress(100, "Research complete!")
-            self._task_logger.success(f"Workflow completed in {execution_time:.2f}s")
+        Returns:
+            ResearchResult with all outputs or error information.
+        """
+        request = WorkflowRequest.create(
+            topic, recipient_email, report_format, num_results, run_id
+        )
+        start_time = datetime.now()
+        self._task_logger.start(f"Starting research workflow for: {topic[:50]}...")
+        
+        with self._observe(request) as span:
+            try:
+                result = self._execute(request, start_time)
+                
+            except Exception as e:
+                result = self._build_error_result(request, e, start_time)
             
-            return ResearchResult(
-                success=True,
-                research_output=research_output,
-                summary_output=summary_output,
-                email_output=email_output,
-                execution_time=execution_time,
-            )
+            return self._finish_span(span, result)
+    
+    async def execute_research_workflow_async(
+        self,
+        topic: str,
+        recipient_email: Union[str, List[str]],
+        report_format: str = "Summary Report",
+        num_results: int = 5,
+        run_id: Optional[str] = None,
+    ) -> ResearchResult:
+        """
+        Execute the complete research workflow without blocking the event loop.
+        
+        Args:
+            topic: Research topic to investigate.
+            recipient_email: Email address, or list of addresses, to send
+                             the report to.
+            report_format: Format for the final report.
+            num_results: Number of search results to gather.
+            run_id: Optional id for the run (used for checkpoints and
+                    resume). Generated when omitted.
             
-        except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            error_message = str(e)
+        Returns:
+            ResearchResult with all outputs or error information.
+        """
+        request = WorkflowRequest.create(
+            topic, recipient_email, report_format, num_results, run_id
+        )
+        start_time = datetime.now()
+        self._task_logger.start(f"Starting async research workflow for: {topic[:50]}...")
+        
+        with self._observe(request) as span:
+            try:
+                # Cache lookups, checkpoints, crew building and kickoff all
+                # block, so the whole run happens off the event loop (the
+                # thread inherits this context's metrics collector and span)
+                result = await asyncio.to_thread(self._execute, request, start_time)
+                
+            except Exception as e:
+                result = self._build_error_result(request, e, start_time)
             
-            self._task_logger.error("Workflow failed", e)
+            return self._finish_span(span, result)
+    
+    def resume(self, run_id: str) -> ResearchResult:
+        """
+        Resume a workflow from its last completed stage.
+        
+        Stored research and summary output is reused, so only the
+        stages that did not finish are run again.
+        
+        Args:
+            run_id: Id of the run to resume (ResearchResult.run_id).
             
+        Returns:
+            ResearchResult with all outputs or error information.
+        """
+        start_time = datetime.now()
+        checkpoint = get_checkpoint_store().load(run_id)
+        
+        if checkpoint is None:
+            self._task_logger.error(f"No checkpoint found for run {run_id}")
             return ResearchResult(
                 success=False,
-                error_message=error_message,
-                execution_time=execution_time,
+                error_message=f"No checkpoint found for run {run_id}",
+                run_id=run_id,
             )
+        
+        request = WorkflowRequest(**checkpoint.request)
+        self._task_logger.start(
+            f"Resuming workflow {run_id} after stage: {checkpoint.last_stage or 'none'}"
+        )
+        
+        with self._observe(request, resumed_after=checkpoint.last_stage or "") as span:
+            try:
+                result = self._run_workflow(request, start_time, checkpoint)
+                
+            except Exception as e:
+                result = self._build_error_result(request, e, start_time)
+            
+            return self._finish_span(span, result)
+    
+    async def execute_many_async(
+        self,
+        workflows: List[dict],
+        max_concurrency: Optional[int] = None,
+    ) -> List[ResearchResult]:
+        """
+        Run several research workflows concurrently on one event loop.
+        
+        Args:
+            workflows: Keyword-argument dicts for execute_research_workflow_async.
+            max_concurrency: Maximum workflows in flight. Defaults to settings.
+            
+        Returns:
+            ResearchResults in the same order as the workflows.
+        """
+        settings = get_settings()
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.workflow_max_concurrency
+        )
+        
+        async def run_one(workflow: dict) -> ResearchResult:
+            async with semaphore:
+                return await self.execute_research_workflow_async(**workflow)
+        
+        return await asyncio.gather(*(run_one(w) for w in workflows))
+    
+    def get_delivery_status(self, run_id: str) -> Dict[str, str]:
+        """
+        Get the outbox delivery status of emails queued by a workflow.
+        
+        Args:
+            run_id: Workflow id from ResearchResult.run_id.
+            
+        Returns:
+            Mapping of recipient address to delivery status.
+        """
+        if not get_settings().email_outbox_enabled:
+            return {}
+        
+        status = {}
+        for message in get_outbox().status_for_batch(run_id):
+            status[message.recipient] = message.status.value
+            if message.last_error:
+                status[message.recipient] += f" ({message.last_error})"
+        return status
     
     def validate_configuration(self) -> dict:
         """
@@ -0,0 +1,435 @@
+"""
+Job Queue Service for AI Research Crew Pro
+
+Provides a SQLite-backed job queue with a worker pool so research
+workflows run in the background while callers poll for status.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, List, Union
+
+from app.config.settings import get_settings
+from app.services.crew_service import CrewService, ResearchResult
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Streamed LLM text is persisted at most this often, keeping only the tail
+STREAM_FLUSH_INTERVAL = 0.5
+STREAM_TAIL_CHARS = 4000
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a queued workflow."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """Snapshot of a queued research workflow."""
+    job_id: str
+    params: dict
+    status: JobStatus
+    progress: int = 0
+    message: str = ""
+    result: Optional[ResearchResult] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    partial_outputs: Dict[str, str] = field(default_factory=dict)
+    stream_text: str = ""
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is still waiting or running."""
+        return self.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class JobQueue:
+    """
+    Background queue for research workflows.
+
+    Submissions return a job id immediately; a pool of worker
+    threads runs the workflows and records progress and results
+    in SQLite so they survive restarts. The job id doubles as the
+    workflow run id, so failed jobs can resume from checkpoints.
+
+    Several processes may share the database: a worker claims a job
+    atomically and refreshes its heartbeat while running it, and only
+    running jobs whose heartbeat is older than lease_seconds are
+    treated as interrupted.
+    """
+
+    _COLUMNS = (
+        "job_id, params, status, progress, message, result, created_at, "
+        "started_at, finished_at, partial_outputs, stream_text"
+    )
+
+    def __init__(self, db_path: Path, max_workers: int, lease_seconds: float = 60.0):
+        """
+        Initialize the job queue.
+
+        Args:
+            db_path: SQLite database file for job records.
+            max_workers: Number of workflows run concurrently.
+            lease_seconds: Heartbeat age after which a running job is
+                considered abandoned by its process.
+        """
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._running: set = set()
+        self._stopping = threading.Event()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress INTEGER NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                result TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                partial_outputs TEXT NOT NULL DEFAULT '{}',
+                stream_text TEXT NOT NULL DEFAULT '',
+                owner TEXT,
+                heartbeat_at REAL
+            )
+            """
+        )
+        self._migrate()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="research-job"
+        )
+        self._recover()
+        threading.Thread(
+            target=self._heartbeat_loop, name="research-job-heartbeat", daemon=True
+        ).start()
+
+    def _migrate(self):
+        """Add columns introduced after the jobs table was first created."""
+        for column in (
+            "partial_outputs TEXT NOT NULL DEFAULT '{}'",
+            "stream_text TEXT NOT NULL DEFAULT ''",
+            "owner TEXT",
+            "heartbeat_at REAL",
+        ):
+            try:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+    def _recover(self):
+        """Requeue jobs that were waiting and fail jobs interrupted mid-run."""
+        self._fail_abandoned()
+        with self._lock:
+            queued = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at",
+                (JobStatus.QUEUED.value,),
+            ).fetchall()
+
+        # Jobs another process claims first are skipped by _run_job
+        for (job_id,) in queued:
+            logger.info(f"Requeueing job {job_id}")
+            self._executor.submit(self._run_job, job_id)
+
+    def _fail_abandoned(self) -> int:
+        """
+        Fail running jobs whose process stopped sending heartbeats.
+
+        Returns:
+            Number of jobs failed.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, finished_at = ? "
+                "WHERE status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                (
+                    JobStatus.FAILED.value,
+                    "Interrupted: its worker process stopped",
+                    time.time(),
+                    JobStatus.RUNNING.value,
+                    time.time() - self.lease_seconds,
+                ),
+            )
+        if cursor.rowcount:
+            logger.warning(f"Failed {cursor.rowcount} abandoned job(s)")
+        return cursor.rowcount
+
+    def _heartbeat_loop(self):
+        """Refresh the heartbeat of this process's jobs and reap abandoned ones."""
+        while not self._stopping.wait(self.lease_seconds / 3):
+            try:
+                with self._lock:
+                    running = list(self._running)
+                    self._conn.executemany(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND owner = ?",
+                        [(time.time(), job_id, self.owner) for job_id in running],
+                    )
+                self._fail_abandoned()
+            except sqlite3.Error as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+
+    def submit(
+        self,
+        topic: str,
+        recipient_email: Union[str, List[str]],
+        report_format: str = "Summary Report",
+        num_results: int = 5,
+    ) -> str:
+        """
+        Queue a research workflow.
+
+        Args:
+            topic: Research topic to investigate.
+            recipient_email: Email address, or list of addresses, to send
+                the report to.
+            report_format: Format for the final report.
+            num_results: Number of search results to gather.
+
+        Returns:
+            The new job id.
+        """
+        job_id = uuid.uuid4().hex
+        params = {
+            "topic": topic,
+            "recipient_email": recipient_email,
+            "report_format": report_format,
+            "num_results": num_results,
+        }
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, params, status, message, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    json.dumps(params),
+                    JobStatus.QUEUED.value,
+                    "Waiting for a free worker...",
+                    time.time(),
+                ),
+            )
+
+        logger.info(f"Queued job {job_id} for topic: {topic[:50]}...")
+        self._executor.submit(self._run_job, job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by id.
+
+        Args:
+            job_id: Id returned by submit().
+
+        Returns:
+            Job snapshot, or None if unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, limit: int = 50) -> List[Job]:
+        """
+        List the most recently submitted jobs.
+
+        Args:
+            limit: Maximum number of jobs to return.
+
+        Returns:
+            Jobs ordered newest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and optionally wait for running jobs."""
+        self._executor.shutdown(wait=wait)
+        self._stopping.set()
+
+    def _update(self, job_id: str, **fields):
+        """Persist changed job fields."""
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns} WHERE job_id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def resume(self, job_id: str) -> bool:
+        """
+        Requeue a failed job to resume from its last completed stage.
+
+        Args:
+            job_id: Id of a failed job.
+
+        Returns:
+            True if the job was requeued, False if it is not resumable.
+        """
+        job = self.get(job_id)
+        if job is None or job.status != JobStatus.FAILED:
+            return False
+
+        self._update(
+            job_id,
+            status=JobStatus.QUEUED.value,
+            message="Waiting to resume...",
+            finished_at=None,
+        )
+        logger.info(f"Resuming job {job_id}")
+        self._executor.submit(self._run_job, job_id, True)
+        return True
+
+    def _claim(self, job_id: str) -> bool:
+        """Atomically move a queued job to running; False if already taken."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, started_at = ?, "
+                "owner = ?, heartbeat_at = ? WHERE job_id = ? AND status = ?",
+                (
+                    JobStatus.RUNNING.value,
+                    "Starting research workflow...",
+                    now,
+                    self.owner,
+                    now,
+                    job_id,
+                    JobStatus.QUEUED.value,
+                ),
+            )
+            if cursor.rowcount == 1:
+                self._running.add(job_id)
+        return cursor.rowcount == 1
+
+    def _run_job(self, job_id: str, resume: bool = False):
+        """Worker entry point: execute (or resume) one queued workflow."""
+        job = self.get(job_id)
+        if job is None or not self._claim(job_id):
+            return
+
+        def update_progress(percentage: int, message: str):
+            self._update(job_id, progress=percentage, message=message)
+
+        partial_outputs = dict(job.partial_outputs) if resume else {}
+        stream = {"text": "", "flushed_at": 0.0}
+
+        def update_stage(stage: str, output: str):
+            partial_outputs[stage] = output
+            stream["text"] = ""
+            self._update(
+                job_id,
+                partial_outputs=json.dumps(partial_outputs),
+                stream_text="",
+            )
+
+        def update_stream(chunk: str):
+            stream["text"] = (stream["text"] + chunk)[-STREAM_TAIL_CHARS:]
+            now = time.monotonic()
+            if now - stream["flushed_at"] >= STREAM_FLUSH_INTERVAL:
+                stream["flushed_at"] = now
+                self._update(job_id, stream_text=stream["text"])
+
+        try:
+            try:
+                crew_service = CrewService(
+                    progress_callback=update_progress,
+                    stage_callback=update_stage,
+                    stream_callback=update_stream,
+                )
+                if resume:
+                    result = crew_service.resume(job_id)
+                else:
+                    result = crew_service.execute_research_workflow(
+                        **job.params, run_id=job_id
+                    )
+            except Exception as e:
+                logger.error(f"Job {job_id} crashed: {e}", exc_info=True)
+                result = ResearchResult(
+                    success=False, error_message=str(e), run_id=job_id
+                )
+
+            status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
+            self._update(
+                job_id,
+                status=status.value,
+                result=json.dumps(result.to_dict()),
+                message=result.error_message or "Research complete!",
+                finished_at=time.time(),
+                stream_text="",
+            )
+            logger.info(f"Job {job_id} finished with status {status.value}")
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+
+    @staticmethod
+    def _row_to_job(row: tuple) -> Job:
+        """Convert a database row into a Job."""
+        (
+            job_id, params, status, progress, message,
+            result, created_at, started_at, finished_at,
+            partial_outputs, stream_text,
+        ) = row
+        return Job(
+            job_id=job_id,
+            params=json.loads(params),
+            status=JobStatus(status),
+            progress=progress,
+            message=message,
+            result=ResearchResult.from_dict(json.loads(result)) if result else None,
+            created_at=created_at,
+            started_at=started_at,
+            finished_at=finished_at,
+            partial_outputs=json.loads(partial_outputs or "{}"),
+            stream_text=stream_text or "",
+        )
+
+
+@lru_cache()
+def get_job_queue() -> JobQueue:
+    """
+    Get the process-wide job queue.
+
+    Returns:
+        JobQueue configured from settings.
+    """
+    settings = get_settings()
+    return JobQueue(
+        db_path=settings.data_path / "jobs.db",
+        max_workers=settings.job_workers,
+        lease_seconds=settings.job_lease_seconds,
+    )
@@ -0,0 +1,292 @@
+"""
+Workflow Progress Tracking for AI Research Crew Pro
+
+Derives progress and ETA from crew events (task completions and agent
+steps) weighted by how long each stage has historically taken.
+"""
+
+import sqlite3
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.config.settings import get_settings
+from app.services.checkpoints import STAGE_RESEARCH, STAGE_SUMMARY, STAGE_EMAIL
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Fallback stage durations (seconds) until enough runs have been recorded
+DEFAULT_STAGE_SECONDS = {
+    STAGE_RESEARCH: 90.0,
+    STAGE_SUMMARY: 45.0,
+    STAGE_EMAIL: 20.0,
+}
+
+STAGE_LABELS = {
+    STAGE_RESEARCH: "Researching sources",
+    STAGE_SUMMARY: "Writing the report",
+    STAGE_EMAIL: "Composing the email",
+}
+
+# A running stage never reports more than this share of its weight
+MAX_STAGE_FRACTION = 0.95
+
+
+class StageHistory:
+    """
+    SQLite-backed record of how long each workflow stage took.
+
+    The median of the most recent runs is used as the expected
+    duration of a stage when weighting progress and estimating ETA.
+    """
+
+    def __init__(self, db_path: Path, window: int = 20):
+        """
+        Initialize the history store.
+
+        Args:
+            db_path: SQLite database file for stage durations.
+            window: Number of recent runs per stage used for estimates.
+        """
+        self.db_path = Path(db_path)
+        self.window = window
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS stage_durations (
+                stage TEXT NOT NULL,
+                duration REAL NOT NULL,
+                tool_calls INTEGER NOT NULL DEFAULT 0,
+                recorded_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_stage_durations "
+            "ON stage_durations (stage, recorded_at)"
+        )
+
+    def record(self, stage: str, duration: float, tool_calls: int = 0):
+        """
+        Store the duration of a completed stage.
+
+        Args:
+            stage: One of the STAGE_* names.
+            duration: Seconds the stage took.
+            tool_calls: Tool invocations made during the stage.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO stage_durations (stage, duration, tool_calls, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (stage, duration, tool_calls, time.time()),
+            )
+
+    def expected(self, stage: str) -> float:
+        """
+        Expected duration of a stage.
+
+        Args:
+            stage: One of the STAGE_* names.
+
+        Returns:
+            Median of recent durations, or the default when none are stored.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT duration FROM stage_durations WHERE stage = ? "
+                "ORDER BY recorded_at DESC LIMIT ?",
+                (stage, self.window),
+            ).fetchall()
+
+        if not rows:
+            return DEFAULT_STAGE_SECONDS.get(stage, 60.0)
+        return statistics.median(duration for (duration,) in rows)
+
+
+class ProgressTracker:
+    """
+    Reports crew progress from task and step events.
+
+    The kickoff window (``start``..``end`` percent) is split between
+    the crew's stages in proportion to their expected durations. Within
+    the running stage, progress advances with elapsed time against the
+    expectation and is refreshed on every agent step, every completed
+    task, and by a background ticker between events.
+    """
+
+    def __init__(
+        self,
+        stages: List[str],
+        report: Callable[[int, str], None],
+        history: StageHistory,
+        start: int = 45,
+        end: int = 90,
+        tick_interval: float = 2.0,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            stages: Stage names of the crew's tasks, in order.
+            report: Receives (percentage, message) updates.
+            history: Store of past stage durations.
+            start: Percentage reported when the crew starts.
+            end: Percentage reported when the last stage finishes.
+            tick_interval: Seconds between updates when no events arrive.
+        """
+        self.stages = stages
+        self.report = report
+        self.history = history
+        self.start_pct = start
+        self.end_pct = end
+        self.tick_interval = tick_interval
+
+        self.expected = {stage: history.expected(stage) for stage in stages}
+        self.durations: Dict[str, float] = {}
+        self.tool_calls: Dict[str, int] = {stage: 0 for stage in stages}
+        self.steps: Dict[str, int] = {stage: 0 for stage in stages}
+
+        self._index = 0
+        self._stage_started = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._ticker: Optional[threading.Thread] = None
+
+    @property
+    def current_stage(self) -> Optional[str]:
+        """Stage currently running, or None once all have finished."""
+        if self._index < len(self.stages):
+            return self.stages[self._index]
+        return None
+
+    def on_step(self, step: Any):
+        """Crew step callback: count tool calls and refresh progress."""
+        with self._lock:
+            stage = self.current_stage
+            if stage is None:
+                return
+            self.steps[stage] += 1
+            if getattr(step, "tool", None):
+                self.tool_calls[stage] += 1
+        self._publish()
+
+    def on_task_complete(self, output: Any):
+        """Crew task callback: close the running stage and start the next."""
+        with self._lock:
+            stage = self.current_stage
+            if stage is None:
+                return
+            duration = time.monotonic() - self._stage_started
+            self.durations[stage] = duration
+            self._index += 1
+            self._stage_started = time.monotonic()
+
+        logger.info(
+            f"Stage {stage} finished in {duration:.1f}s "
+            f"({self.tool_calls[stage]} tool calls)"
+        )
+        try:
+            self.history.record(stage, duration, self.tool_calls[stage])
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record {stage} duration: {e}")
+        self._publish()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Compute the current progress.
+
+        Returns:
+            Dict with percentage, stage, stage_elapsed, tool_calls and
+            eta_seconds.
+        """
+        with self._lock:
+            total = sum(self.expected.values()) or 1.0
+            done = sum(self.expected[s] for s in self.stages[:self._index])
+            stage = self.current_stage
+            elapsed = time.monotonic() - self._stage_started
+            eta = sum(self.expected[s] for s in self.stages[self._index + 1:])
+
+            if stage is not None:
+                expected = self.expected[stage]
+                done += expected * min(elapsed / expected, MAX_STAGE_FRACTION)
+                # Once a stage overruns, assume it is close to finishing
+                eta += max(expected - elapsed, expected * (1 - MAX_STAGE_FRACTION))
+
+            fraction = done / total
+            return {
+                "percentage": int(
+                    self.start_pct + (self.end_pct - self.start_pct) * fraction
+                ),
+                "stage": stage,
+                "stage_elapsed": elapsed,
+                "tool_calls": self.tool_calls.get(stage, 0) if stage else 0,
+                "eta_seconds": eta if stage else 0.0,
+            }
+
+    def _publish(self):
+        """Send the current progress to the report callback."""
+        state = self.snapshot()
+        stage = state["stage"]
+        if stage is None:
+            message = "Finalizing results..."
+        else:
+            message = (
+                f"{STAGE_LABELS.get(stage, stage)} - "
+                f"{state['stage_elapsed']:.0f}s elapsed, "
+                f"{state['tool_calls']} tool calls, "
+                f"~{state['eta_seconds']:.0f}s remaining"
+            )
+        try:
+            self.report(state["percentage"], message)
+        except Exception as e:
+            logger.debug(f"Progress report failed: {e}")
+
+    def _tick(self):
+        """Background loop refreshing progress between events."""
+        while not self._stopped.wait(self.tick_interval):
+            self._publish()
+
+    @contextmanager
+    def running(self) -> Iterator["ProgressTracker"]:
+        """Track progress for the duration of a crew kickoff."""
+        self._stage_started = time.monotonic()
+        self._stopped.clear()
+        self._ticker = threading.Thread(
+            target=self._tick, name="progress-ticker", daemon=True
+        )
+        self._ticker.start()
+        self._publish()
+
+        try:
+            yield self
+        finally:
+            self._stopped.set()
+            self._ticker.join()
+
+
+@lru_cache()
+def get_stage_history() -> StageHistory:
+    """
+    Get the process-wide stage duration history.
+
+    Returns:
+        StageHistory configured from settings.
+    """
+    settings = get_settings()
+    return StageHistory(settings.data_path / "history.db")
@@ -0,0 +1,94 @@
+"""
+LLM Output Streaming for AI Research Crew Pro
+
+Routes streamed LLM token chunks from CrewAI's event bus to the
+callback of the workflow that produced them.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+StreamCallback = Callable[[str], None]
+
+_current_run: ContextVar[Optional[str]] = ContextVar("stream_run_id", default=None)
+_sinks: Dict[str, StreamCallback] = {}
+_sinks_lock = threading.Lock()
+_listener_installed = False
+
+
+def _on_stream_chunk(source, event):
+    """Forward a chunk to the callback registered for the current run."""
+    run_id = _current_run.get()
+
+    with _sinks_lock:
+        if run_id is None and len(_sinks) == 1:
+            # Handler ran outside the workflow's context; only one candidate
+            callback = next(iter(_sinks.values()))
+        else:
+            callback = _sinks.get(run_id)
+
+    if callback is not None:
+        try:
+            callback(event.chunk)
+        except Exception as e:
+            logger.debug(f"Stream callback failed: {e}")
+
+
+def _install_listener() -> bool:
+    """Subscribe to CrewAI stream chunk events once per process."""
+    global _listener_installed
+
+    with _sinks_lock:
+        if _listener_installed:
+            return True
+
+        try:
+            from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+        except ImportError:
+            try:
+                from crewai.utilities.events import (
+                    crewai_event_bus,
+                    LLMStreamChunkEvent,
+                )
+            except ImportError:
+                logger.warning(
+                    "Installed CrewAI does not emit stream events; "
+                    "token streaming disabled"
+                )
+                return False
+
+        crewai_event_bus.on(LLMStreamChunkEvent)(_on_stream_chunk)
+        _listener_installed = True
+        return True
+
+
+@contextmanager
+def stream_to(run_id: str, callback: Optional[StreamCallback]) -> Iterator[None]:
+    """
+    Route LLM chunks emitted in this context to a callback.
+
+    Args:
+        run_id: Workflow run id.
+        callback: Receives each text chunk; no-op when None.
+    """
+    if callback is None or not _install_listener():
+        yield
+        return
+
+    with _sinks_lock:
+        _sinks[run_id] = callback
+    token = _current_run.set(run_id)
+
+    try:
+        yield
+    finally:
+        _current_run.reset(token)
+        with _sinks_lock:
+            _sinks.pop(run_id, None)
@@ -51,6 +51,7 @@ Research Requirements:
    - Recent news and announcements
 5. Note publication dates and assess source credibility
 6. Look for both supporting and contrasting viewpoints
+7. When you need several related searches, run them together with the batch search tool
 {focus_section}
 
 Quality Standards:
@@ -82,7 +83,8 @@ A comprehensive research report containing:
 def create_summarization_task(
     agent: Agent,
     report_format: str,
-    research_task: Task
+    research_task: Optional[Task] = None,
+    research_output: Optional[str] = None
 ) -> Task:
     """
     Create a content summarization task.
@@ -91,6 +93,8 @@ def create_summarization_task(
         agent: The summarizer agent to assign.
         report_format: Format for the final report.
         research_task: The research task to use as context.
+        research_output: Stored research findings to use instead of a
+                         research task (e.g. when resuming a workflow).
         
     Returns:
         Configured Task for summarization.
@@ -151,6 +155,9 @@ Writing Guidelines:
 - Use Markdown formatting for structure
 """
 
+    if research_output:
+        description += f"\nResearch Findings:\n\n{research_output}\n"
+
     expected_output = f"""
 A professionally formatted {report_format} in Markdown with:
 - Clear structure and organization
@@ -164,7 +171,7 @@ A professionally formatted {report_format} in Markdown with:
         description=description.strip(),
         expected_output=expected_output.strip(),
         agent=agent,
-        context=[research_task],
+        context=[research_task] if research_task else None,
     )
 
 
@@ -173,7 +180,8 @@ def create_email_task(
     recipient_email: str,
     topic: str,
     report_format: str,
-    summarization_task: Task
+    summarization_task: Optional[Task] = None,
+    summary_output: Optional[str] = None
 ) -> Task:
     """
     Create an email delivery task.
@@ -184,6 +192,8 @@ def create_email_task(
         topic: The research topic (for subject line).
         report_format: Type of report being sent.
         summarization_task: The summarization task for context.
+        summary_output: Stored report to use instead of a summarization
+                        task (e.g. when resuming a workflow).
         
     Returns:
         Configured Task for email delivery.
@@ -211,6 +221,9 @@ Email Best Practices:
 Send the email and confirm successful delivery.
 """
 
+    if summary_output:
+        description += f"\nResearch Report:\n\n{summary_output}\n"
+
     expected_output = f"""
 Confirmation that:
 1. Email was composed with proper formatting
@@ -223,5 +236,5 @@ Confirmation that:
         description=description.strip(),
         expected_output=expected_output.strip(),
         agent=agent,
-        context=[summarization_task],
+        context=[summarization_task] if summarization_task else None,
     )
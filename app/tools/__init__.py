@@ -1,11 +1,18 @@
 """AI Research Crew Pro - Tools Module"""
 
-from .search_tool import SearchTool, create_search_tool
+from .search_tool import (
+    SearchTool,
+    BatchSearchTool,
+    create_search_tool,
+    create_batch_search_tool,
+)
 from .email_tool import EmailTool, create_email_tool
 
 __all__ = [
     "SearchTool",
     "create_search_tool",
+    "BatchSearchTool",
+    "create_batch_search_tool",
     "EmailTool", 
     "create_email_tool",
 ]
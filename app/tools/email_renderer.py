@@ -0,0 +1,274 @@
+"""
+Email Rendering for AI Research Crew Pro
+
+Converts Markdown report bodies into the branded HTML email
+template, reusing parser state and caching rendered output.
+"""
+
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
+from typing import List, Optional, Tuple
+
+import markdown
+
+from app.utils.instrumentation import record_cache_lookup
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+MARKDOWN_EXTENSIONS = ['tables', 'fenced_code', 'nl2br']
+
+
+# Professional HTML email template
+EMAIL_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+        
+        body {{
+            font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif;
+            line-height: 1.8;
+            color: #2d3748;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f7fafc;
+        }}
+        .container {{
+            background-color: #ffffff;
+            border-radius: 16px;
+            box-shadow: 0 4px 20px rgba(0,0,0,0.05);
+            overflow: hidden;
+            border: 1px solid rgba(0,0,0,0.05);
+        }}
+        .header {{
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+            color: white;
+            padding: 40px 30px;
+            text-align: center;
+        }}
+        .header h1 {{
+            margin: 0;
+            font-size: 28px;
+            font-weight: 700;
+            letter-spacing: -0.5px;
+            text-shadow: 0 2px 4px rgba(0,0,0,0.2);
+        }}
+        .header p {{
+            margin: 10px 0 0;
+            font-size: 16px;
+            opacity: 0.9;
+            font-weight: 500;
+        }}
+        .content {{
+            padding: 40px 30px;
+        }}
+        h2 {{
+            color: #2a5298;
+            font-size: 22px;
+            font-weight: 600;
+            margin-top: 30px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #edf2f7;
+        }}
+        h3 {{
+            color: #4a5568;
+            font-size: 18px;
+            font-weight: 600;
+            margin-top: 25px;
+        }}
+        p {{
+            margin-bottom: 16px;
+        }}
+        ul, ol {{
+            padding-left: 20px;
+            margin-bottom: 20px;
+        }}
+        li {{
+            margin-bottom: 8px;
+            color: #4a5568;
+        }}
+        a {{
+            color: #2a5298;
+            text-decoration: none;
+            font-weight: 500;
+            border-bottom: 1px dotted #2a5298;
+            transition: all 0.2s;
+        }}
+        a:hover {{
+            color: #1e3c72;
+            border-bottom: 1px solid #1e3c72;
+        }}
+        code {{
+            background-color: #edf2f7;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', monospace;
+            font-size: 0.9em;
+            color: #c53030;
+        }}
+        blockquote {{
+            border-left: 4px solid #2a5298;
+            background-color: #f8fbff;
+            padding: 15px 20px;
+            margin: 20px 0;
+            border-radius: 0 8px 8px 0;
+            font-style: italic;
+            color: #4a5568;
+        }}
+        strong {{
+            color: #2d3748;
+            font-weight: 600;
+        }}
+        .footer {{
+            background-color: #f7fafc;
+            padding: 30px;
+            text-align: center;
+            border-top: 1px solid #edf2f7;
+        }}
+        .footer p {{
+            margin: 5px 0;
+            font-size: 13px;
+            color: #718096;
+        }}
+        .tag {{
+            display: inline-block;
+            padding: 4px 12px;
+            background-color: rgba(255,255,255,0.2);
+            border-radius: 20px;
+            font-size: 12px;
+            font-weight: 600;
+            margin-top: 10px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Prime Brief</h1>
+            <span class="tag">EXECUTIVE SUMMARY</span>
+            <p>{subject}</p>
+        </div>
+        <div class="content">
+            {content}
+        </div>
+        <div class="footer">
+            <p><strong>Generated by Prime Brief</strong></p>
+            <p>Powered by Multi-Agent Artificial Intelligence • CrewAI • Gemini</p>
+            <p style="margin-top: 15px; font-size: 11px; color: #a0aec0;">
+                This automated report contains AI-synthesized information. Please verify critical facts.
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+class EmailRenderer:
+    """
+    Cached Markdown-to-HTML email renderer.
+    
+    Features:
+    - Single Markdown parser instance, reset between documents
+    - Template pre-split into static chunks at construction
+    - LRU memoization of rendered HTML by content hash
+    """
+    
+    def __init__(self, template: str = EMAIL_TEMPLATE, max_entries: int = 128):
+        """
+        Initialize the renderer.
+        
+        Args:
+            template: str.format-style template with {subject} and {content}.
+            max_entries: Maximum rendered emails kept in memory.
+        """
+        self.max_entries = max_entries
+        self._chunks = self._split_template(template)
+        self._markdown = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _split_template(template: str) -> List[Tuple[str, Optional[str]]]:
+        """Split a format template into (literal, field_name) pairs."""
+        return [
+            (literal, field_name)
+            for literal, field_name, _, _ in Formatter().parse(template)
+        ]
+    
+    def markdown_to_html(self, body: str) -> str:
+        """
+        Convert Markdown to an HTML fragment.
+        
+        Args:
+            body: Markdown text.
+            
+        Returns:
+            HTML fragment.
+        """
+        with self._lock:
+            try:
+                return self._markdown.convert(body)
+            finally:
+                self._markdown.reset()
+    
+    def render(self, subject: str, body: str) -> str:
+        """
+        Render a complete HTML email.
+        
+        Args:
+            subject: Email subject shown in the header.
+            body: Email body in Markdown format.
+            
+        Returns:
+            Full HTML document.
+        """
+        key = hashlib.sha256(f"{subject}\0{body}".encode("utf-8")).hexdigest()
+        
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                logger.debug("Reusing rendered email HTML")
+        
+        record_cache_lookup("email_render", cached is not None)
+        if cached is not None:
+            return cached
+        
+        values = {
+            # The subject embeds the user-supplied topic
+            "subject": html.escape(subject),
+            "content": self.markdown_to_html(body),
+        }
+        rendered = "".join(
+            literal + (values[field_name] if field_name else "")
+            for literal, field_name in self._chunks
+        )
+        
+        with self._lock:
+            self._cache[key] = rendered
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        
+        return rendered
+
+
+@lru_cache()
+def get_email_renderer() -> EmailRenderer:
+    """
+    Get the shared email renderer.
+    
+    Returns:
+        Process-wide EmailRenderer instance.
+    """
+    return EmailRenderer()
@@ -6,15 +6,21 @@ with HTML formatting, templates, and error handling.
 """
 
 import smtplib
+from collections import deque
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Type, Optional
+from typing import Type, Optional, List, Dict
 from pydantic import BaseModel, Field, EmailStr
 from crewai.tools import BaseTool
-import markdown
 
+from .email_renderer import get_email_renderer
 from app.config.settings import get_settings
+from app.utils.instrumentation import timed_tool
 from app.utils.logger import get_logger
+from app.utils.metrics import record_failure
+from app.utils.outbox import get_outbox
+from app.utils.smtp import get_smtp_pool
+from app.utils.tracing import STATUS_ERROR, trace_span
 
 logger = get_logger(__name__)
 
@@ -37,164 +43,16 @@ class EmailInput(BaseModel):
     )
 
 
-# Professional HTML email template
-EMAIL_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        
-        body {{
-            font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif;
-            line-height: 1.8;
-            color: #2d3748;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f7fafc;
-        }}
-        .container {{
-            background-color: #ffffff;
-            border-radius: 16px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.05);
-            overflow: hidden;
-            border: 1px solid rgba(0,0,0,0.05);
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            color: white;
-            padding: 40px 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 28px;
-            font-weight: 700;
-            letter-spacing: -0.5px;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        }}
-        .header p {{
-            margin: 10px 0 0;
-            font-size: 16px;
-            opacity: 0.9;
-            font-weight: 500;
-        }}
-        .content {{
-            padding: 40px 30px;
-        }}
-        h2 {{
-            color: #2a5298;
-            font-size: 22px;
-            font-weight: 600;
-            margin-top: 30px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #edf2f7;
-        }}
-        h3 {{
-            color: #4a5568;
-            font-size: 18px;
-            font-weight: 600;
-            margin-top: 25px;
-        }}
-        p {{
-            margin-bottom: 16px;
-        }}
-        ul, ol {{
-            padding-left: 20px;
-            margin-bottom: 20px;
-        }}
-        li {{
-            margin-bottom: 8px;
-            color: #4a5568;
-        }}
-        a {{
-            color: #2a5298;
-            text-decoration: none;
-            font-weight: 500;
-            border-bottom: 1px dotted #2a5298;
-            transition: all 0.2s;
-        }}
-        a:hover {{
-            color: #1e3c72;
-            border-bottom: 1px solid #1e3c72;
-        }}
-        code {{
-            background-color: #edf2f7;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', monospace;
-            font-size: 0.9em;
-            color: #c53030;
-        }}
-        blockquote {{
-            border-left: 4px solid #2a5298;
-            background-color: #f8fbff;
-            padding: 15px 20px;
-            margin: 20px 0;
-            border-radius: 0 8px 8px 0;
-            font-style: italic;
-            color: #4a5568;
-        }}
-        strong {{
-            color: #2d3748;
-            font-weight: 600;
-        }}
-        .footer {{
-            background-color: #f7fafc;
-            padding: 30px;
-            text-align: center;
-            border-top: 1px solid #edf2f7;
-        }}
-        .footer p {{
-            margin: 5px 0;
-            font-size: 13px;
-            color: #718096;
-        }}
-        .tag {{
-            display: inline-block;
-            padding: 4px 12px;
-            background-color: rgba(255,255,255,0.2);
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-top: 10px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Prime Brief</h1>
-            <span class="tag">EXECUTIVE SUMMARY</span>
-            <p>{subject}</p>
-        </div>
-        <div class="content">
-            {content}
-        </div>
-        <div class="footer">
-            <p><strong>Generated by Prime Brief</strong></p>
-            <p>Powered by Multi-Agent Artificial Intelligence • CrewAI • Gemini</p>
-            <p style="margin-top: 15px; font-size: 11px; color: #a0aec0;">
-                This automated report contains AI-synthesized information. Please verify critical facts.
-            </p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-
 class EmailTool(BaseTool):
     """
     Email sending tool using SMTP.
     
     Features:
-    - Markdown to HTML conversion
+    - Markdown to HTML conversion with cached rendering
     - Professional email templates
     - Comprehensive error handling
+    - Pooled, reused SMTP connections
+    - Optional durable outbox for asynchronous delivery
     """
     
     name: str = "Send Email"
@@ -203,6 +61,7 @@ class EmailTool(BaseTool):
         "Accepts Markdown content which will be converted to formatted HTML."
     )
     args_schema: Type[BaseModel] = EmailInput
+    batch_id: Optional[str] = None
     
     def _run(self, to_email: str, subject: str, body: str) -> str:
         """
@@ -216,8 +75,27 @@ class EmailTool(BaseTool):
         Returns:
             Success or error message.
         """
+        with trace_span(
+            "tool.send_email",
+            recipient=to_email,
+            subject=subject[:200],
+            body_chars=len(body),
+        ) as span:
+            result = self._send(to_email, subject, body)
+            if result.startswith("Email failed"):
+                span.set_status(STATUS_ERROR, result)
+            return result
+    
+    def _send(self, to_email: str, subject: str, body: str) -> str:
+        """Render one email and queue or send it."""
         settings = get_settings()
         
+        if settings.replaying:
+            # Exercise rendering, but never re-email recipients of a recorded run
+            get_email_renderer().render(subject, body)
+            logger.info(f"Replay mode: email to {to_email} rendered, not sent")
+            return f"Email sent successfully to {to_email} (replay mode: not delivered)"
+        
         if not settings.email_user or not settings.email_pass:
             logger.error("Email credentials not configured")
             return "Email failed: Email credentials not configured"
@@ -225,65 +103,193 @@ class EmailTool(BaseTool):
         try:
             logger.info(f"Sending email to: {to_email}")
             
-            # Convert Markdown to HTML
-            html_content = markdown.markdown(
-                body,
-                extensions=['tables', 'fenced_code', 'nl2br']
-            )
-            
-            # Apply template
-            html_body = EMAIL_TEMPLATE.format(content=html_content)
+            # Convert Markdown to HTML and apply template
+            html_body = get_email_renderer().render(subject, body)
             
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["From"] = settings.email_user
-            msg["To"] = to_email
-            msg["Subject"] = subject
+            msg = self._build_message(to_email, subject, body, html_body)
             
-            # Attach plain text version
-            msg.attach(MIMEText(body, "plain"))
+            # Hand off to the outbox so delivery happens outside the workflow
+            if settings.email_outbox_enabled:
+                with timed_tool("email_outbox"):
+                    message_id = get_outbox().enqueue(
+                        sender=settings.email_user,
+                        recipient=to_email,
+                        subject=subject,
+                        message=msg.as_string(),
+                        batch_id=self.batch_id,
+                    )
+                return f"Email queued for delivery to {to_email} (message id: {message_id})"
             
-            # Attach HTML version
-            msg.attach(MIMEText(html_body, "html"))
-            
-            # Send email
-            with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-                server.starttls()
-                server.login(settings.email_user, settings.email_pass)
-                server.sendmail(
-                    settings.email_user, 
-                    to_email, 
+            # Send email over a pooled connection
+            with timed_tool("smtp_send"):
+                get_smtp_pool().send(
+                    settings.email_user,
+                    [to_email],
                     msg.as_string()
                 )
             
             logger.info(f"Email sent successfully to {to_email}")
             return f"Email sent successfully to {to_email}"
             
-        except smtplib.SMTPAuthenticationError:
+        except smtplib.SMTPAuthenticationError as e:
             logger.error("SMTP authentication failed")
+            record_failure("email", type(e).__name__)
             return (
                 "Email failed: Authentication error. "
                 "Please check your email credentials and ensure you're using an App Password."
             )
             
-        except smtplib.SMTPRecipientsRefused:
+        except smtplib.SMTPRecipientsRefused as e:
             logger.error(f"Recipient refused: {to_email}")
+            record_failure("email", type(e).__name__)
             return f"Email failed: The recipient address '{to_email}' was rejected."
             
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error: {e}")
+            record_failure("email", type(e).__name__)
             return f"Email failed: SMTP error - {str(e)}"
             
         except Exception as e:
             logger.error(f"Unexpected error sending email: {e}")
+            record_failure("email", type(e).__name__)
             return f"Email failed: {str(e)}"
+    
+    def send_bulk(
+        self, recipients: List[str], subject: str, body: str
+    ) -> Dict[str, str]:
+        """
+        Send the same email to many recipients.
+        
+        The HTML is rendered once and all messages share one SMTP
+        session (or are spooled to the outbox when it is enabled).
+        
+        Args:
+            recipients: Recipient email addresses.
+            subject: Email subject line.
+            body: Email body in Markdown format.
+            
+        Returns:
+            Mapping of recipient address to delivery status.
+        """
+        with trace_span(
+            "tool.send_email_bulk",
+            recipient_count=len(recipients),
+            subject=subject[:200],
+            body_chars=len(body),
+        ) as span:
+            status = self._send_bulk(recipients, subject, body)
+            failed = sum(1 for v in status.values() if v.startswith("failed"))
+            span.set_attribute("failed_count", failed)
+            if failed:
+                span.set_status(STATUS_ERROR, f"{failed} of {len(recipients)} failed")
+            return status
+    
+    def _send_bulk(
+        self, recipients: List[str], subject: str, body: str
+    ) -> Dict[str, str]:
+        """Render once, then queue or send to every recipient."""
+        settings = get_settings()
+        
+        if settings.replaying:
+            get_email_renderer().render(subject, body)
+            logger.info(f"Replay mode: email to {len(recipients)} recipients rendered, not sent")
+            return {r: "skipped (replay mode)" for r in recipients}
+        
+        if not settings.email_user or not settings.email_pass:
+            logger.error("Email credentials not configured")
+            return {r: "failed (email credentials not configured)" for r in recipients}
+        
+        logger.info(f"Sending email to {len(recipients)} recipients")
+        
+        html_body = get_email_renderer().render(subject, body)
+        messages = {
+            r: self._build_message(r, subject, body, html_body).as_string()
+            for r in recipients
+        }
+        
+        if settings.email_outbox_enabled:
+            outbox = get_outbox()
+            for recipient, message in messages.items():
+                with timed_tool("email_outbox"):
+                    outbox.enqueue(
+                        sender=settings.email_user,
+                        recipient=recipient,
+                        subject=subject,
+                        message=message,
+                        batch_id=self.batch_id,
+                    )
+            return {r: "queued" for r in recipients}
+        
+        status = {}
+        pending = deque(messages.items())
+        reconnected = False
+        while pending:
+            try:
+                with get_smtp_pool().connection() as server:
+                    while pending:
+                        recipient, message = pending[0]
+                        try:
+                            with timed_tool("smtp_send"):
+                                server.sendmail(settings.email_user, [recipient], message)
+                            status[recipient] = "sent"
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                            logger.error(f"Recipient refused: {recipient}")
+                            record_failure("email", type(e).__name__)
+                            status[recipient] = f"failed ({e})"
+                        pending.popleft()
+            except smtplib.SMTPServerDisconnected as e:
+                if not reconnected:
+                    # Like SMTPConnectionPool.send: reconnect once and carry on
+                    logger.warning(
+                        f"SMTP connection dropped with {len(pending)} recipients left, reconnecting"
+                    )
+                    reconnected = True
+                    continue
+                error = e
+            except Exception as e:
+                error = e
+            else:
+                break
+            
+            logger.error(f"Bulk email send aborted: {error}")
+            record_failure("email", type(error).__name__)
+            for recipient, _ in pending:
+                status.setdefault(recipient, f"failed ({error})")
+            break
+        
+        sent = sum(1 for v in status.values() if v == "sent")
+        logger.info(f"Bulk email sent to {sent}/{len(recipients)} recipients")
+        return status
+    
+    @staticmethod
+    def _build_message(
+        to_email: str, subject: str, body: str, html_body: str
+    ) -> MIMEMultipart:
+        """Assemble a multipart message with plain text and HTML parts."""
+        settings = get_settings()
+        
+        msg = MIMEMultipart("alternative")
+        msg["From"] = settings.email_user
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        
+        # Attach plain text version
+        msg.attach(MIMEText(body, "plain"))
+        
+        # Attach HTML version
+        msg.attach(MIMEText(html_body, "html"))
+        
+        return msg
 
 
-def create_email_tool() -> EmailTool:
+def create_email_tool(batch_id: Optional[str] = None) -> EmailTool:
     """
     Factory function to create a configured email tool.
     
+    Args:
+        batch_id: Optional id tagging outbox messages sent by this tool.
+        
     Returns:
         Configured EmailTool instance.
     """
-    return EmailTool()
+    return EmailTool(batch_id=batch_id)
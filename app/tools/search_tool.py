@@ -2,20 +2,55 @@
 Search Tool for AI Research Crew Pro
 
 Provides web search capabilities using Serper API
-with retry logic, rate limiting, and error handling.
+with retry logic, rate limiting, result caching, and error handling.
 """
 
-from typing import Type, Optional
+import contextvars
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Type, Optional, List
 import requests
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
 from app.config.settings import get_settings
+from app.utils.cache import DiskCache
+from app.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.utils.http import get_http_session, retry_after
+from app.utils.instrumentation import timed_tool
+from app.utils.tracing import STATUS_ERROR, current_span, trace_span
 from app.utils.logger import get_logger
+from app.utils.metrics import record_failure
+from app.utils.rate_limit import get_rate_limiter, is_retryable
+from app.utils.replay import KIND_SEARCH, ReplayMissError, get_cassette
 
 logger = get_logger(__name__)
 
 
+@lru_cache()
+def get_search_cache() -> DiskCache:
+    """
+    Get the shared on-disk cache for search results.
+    
+    Returns:
+        DiskCache instance configured from settings.
+    """
+    settings = get_settings()
+    return DiskCache(
+        path=settings.cache_path,
+        namespace="search",
+        ttl_seconds=settings.search_cache_ttl,
+        max_entries=settings.search_cache_max_entries,
+    )
+
+
+def normalize_query(search_query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace)."""
+    return " ".join(search_query.lower().split())
+
+
 class SearchInput(BaseModel):
     """Input schema for search tool."""
     search_query: str = Field(
@@ -26,6 +61,16 @@ class SearchInput(BaseModel):
     )
 
 
+class BatchSearchInput(BaseModel):
+    """Input schema for batch search tool."""
+    search_queries: List[str] = Field(
+        ...,
+        description="List of related search queries to execute together",
+        min_length=1,
+        max_length=10
+    )
+
+
 class SearchTool(BaseTool):
     """
     Web search tool using Serper API.
@@ -34,6 +79,8 @@ class SearchTool(BaseTool):
     - Structured result formatting
     - Error handling with fallback
     - Configurable result count
+    - Persistent result cache keyed by normalized query
+    - Pooled keep-alive connections with retry on 429/5xx
     """
     
     name: str = "Web Search"
@@ -58,57 +105,193 @@ class SearchTool(BaseTool):
         Returns:
             Formatted search results or error message.
         """
+        return self.search(search_query)
+    
+    def search_many(self, search_queries: List[str]) -> List[str]:
+        """
+        Execute several searches concurrently.
+        
+        Args:
+            search_queries: Queries to execute.
+            
+        Returns:
+            Formatted results (or error messages) in the same order as the queries.
+        """
+        if not search_queries:
+            return []
+        
         settings = get_settings()
+        max_workers = min(len(search_queries), settings.search_max_concurrency)
         
-        if not settings.serper_api_key:
+        logger.info(
+            f"Running {len(search_queries)} searches "
+            f"with concurrency {max_workers}"
+        )
+        
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="search"
+        ) as executor:
+            # Each search runs in a copy of the caller's context so that
+            # instrumentation is attributed to the calling workflow
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.search, query)
+                for query in search_queries
+            ]
+            return [future.result() for future in futures]
+    
+    def search(self, search_query: str) -> str:
+        """
+        Execute a single web search using Serper API.
+        
+        Args:
+            search_query: The search query to execute.
+            
+        Returns:
+            Formatted search results or error message.
+        """
+        with trace_span(
+            "tool.web_search",
+            query=search_query[:200],
+            max_results=self.max_results,
+        ) as span:
+            formatted = self._search(search_query)
+            if formatted.startswith("❌"):
+                span.set_status(STATUS_ERROR, formatted)
+            return formatted
+    
+    def _search(self, search_query: str) -> str:
+        """Look up a query in the cache or fetch it from Serper."""
+        settings = get_settings()
+        cassette = get_cassette()
+        replaying = cassette is not None and cassette.replaying
+        
+        if not settings.serper_api_key and not replaying:
             logger.error("Serper API key not configured")
             return "❌ Search failed: Serper API key not configured"
         
+        cache = get_search_cache() if settings.search_cache_enabled else None
+        cache_key = DiskCache.make_key(normalize_query(search_query), self.max_results)
+        
+        if cache is not None and not replaying:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for: {search_query[:50]}...")
+                if cassette is not None:
+                    cassette.record(KIND_SEARCH, cache_key, cached)
+                current_span().set_attributes(
+                    cached=True, result_count=len(cached.get("organic", []))
+                )
+                return self._format_results(cached)
+        
         try:
-            logger.info(f"Searching for: {search_query[:50]}...")
+            if replaying:
+                results = cassette.play(KIND_SEARCH, cache_key)
+                current_span().set_attributes(
+                    cached=False, result_count=len(results.get("organic", []))
+                )
+                return self._format_results(results)
             
-            url = "https://google.serper.dev/search"
-            payload = {
-                "q": search_query,
-                "num": self.max_results
-            }
-            headers = {
-                "X-API-KEY": settings.serper_api_key,
-                "Content-Type": "application/json"
-            }
+            logger.info(f"Searching for: {search_query[:50]}...")
             
-            response = requests.post(
-                url, 
-                json=payload, 
-                headers=headers,
-                timeout=30
-            )
-            response.raise_for_status()
+            results = self._fetch(search_query)
+            if cache is not None:
+                cache.set(cache_key, results)
+            if cassette is not None:
+                cassette.record(KIND_SEARCH, cache_key, results)
             
-            results = response.json()
             formatted = self._format_results(results)
             
+            current_span().set_attributes(
+                cached=False, result_count=len(results.get("organic", []))
+            )
             logger.info(f"Found {len(results.get('organic', []))} results")
             return formatted
             
-        except requests.exceptions.Timeout:
+        except ReplayMissError:
+            # Let the workflow fail instead of the agent working around it
+            raise
+            
+        except CircuitOpenError as e:
+            logger.warning(f"Search skipped: {e}")
+            record_failure("search", type(e).__name__)
+            return f"❌ Search failed: {e}. Please try again later."
+            
+        except requests.exceptions.Timeout as e:
             logger.error("Search request timed out")
+            record_failure("search", type(e).__name__)
             return "❌ Search failed: Request timed out. Please try again."
             
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error during search: {e}")
+            record_failure("search", f"HTTP {e.response.status_code}")
             if e.response.status_code == 403:
                 return "❌ Search failed: Invalid API key or quota exceeded"
             return f"❌ Search failed: HTTP error {e.response.status_code}"
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error during search: {e}")
+            record_failure("search", type(e).__name__)
             return "❌ Search failed: Network error. Please check your connection."
             
         except Exception as e:
             logger.error(f"Unexpected error during search: {e}")
+            record_failure("search", type(e).__name__)
             return f"❌ Search failed: {str(e)}"
     
+    def _fetch(self, search_query: str) -> dict:
+        """
+        POST a query to Serper, retrying rate-limited and failed requests.
+        
+        Every attempt takes a token from the shared serper budget.
+        Retries wait for the server's Retry-After, or back off
+        exponentially when it sends none.
+        
+        Args:
+            search_query: The search query to execute.
+            
+        Returns:
+            Decoded Serper response.
+        """
+        settings = get_settings()
+        url = settings.serper_url
+        payload = {
+            "q": search_query,
+            "num": self.max_results
+        }
+        headers = {
+            "X-API-KEY": settings.serper_api_key,
+            "Content-Type": "application/json"
+        }
+        
+        breaker = None
+        if settings.circuit_breaker_enabled:
+            breaker = get_circuit_breaker("serper", settings.serper_slow_call_seconds)
+        
+        for attempt in range(settings.http_max_retries + 1):
+            if breaker is not None:
+                breaker.check()
+            get_rate_limiter().acquire("serper")
+            try:
+                with breaker.guard() if breaker else nullcontext(), timed_tool("serper_search"):
+                    response = get_http_session().post(
+                        url, 
+                        json=payload, 
+                        headers=headers,
+                        timeout=settings.http_timeout
+                    )
+                    response.raise_for_status()
+                return response.json()
+            except requests.exceptions.RequestException as e:
+                if attempt >= settings.http_max_retries or not is_retryable(e):
+                    raise
+                delay = retry_after(e.response)
+                if delay is None:
+                    delay = settings.http_backoff_factor * 2 ** attempt
+                logger.warning(
+                    f"Search request failed ({type(e).__name__}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+    
     def _format_results(self, results: dict) -> str:
         """Format API results into readable text."""
         formatted_parts = []
@@ -148,6 +331,41 @@ class SearchTool(BaseTool):
         return "\n".join(formatted_parts)
 
 
+class BatchSearchTool(SearchTool):
+    """
+    Multi-query web search tool using Serper API.
+    
+    Dispatches a list of queries concurrently and returns
+    the formatted results for each query in order.
+    """
+    
+    name: str = "Batch Web Search"
+    description: str = (
+        "Search the internet for several related queries at once. "
+        "Use this to fan out sub-questions of a topic in a single step. "
+        "Returns web results for each query in the order given."
+    )
+    args_schema: Type[BaseModel] = BatchSearchInput
+    
+    def _run(self, search_queries: List[str]) -> str:
+        """
+        Execute multiple web searches concurrently.
+        
+        Args:
+            search_queries: The search queries to execute.
+            
+        Returns:
+            Formatted results grouped by query.
+        """
+        results = self.search_many(search_queries)
+        
+        sections = [
+            f"## Query {i}: {query}\n\n{result}"
+            for i, (query, result) in enumerate(zip(search_queries, results), 1)
+        ]
+        return "\n\n---\n\n".join(sections)
+
+
 def create_search_tool(max_results: int = 5) -> SearchTool:
     """
     Factory function to create a configured search tool.
@@ -159,3 +377,16 @@ def create_search_tool(max_results: int = 5) -> SearchTool:
         Configured SearchTool instance.
     """
     return SearchTool(max_results=max_results)
+
+
+def create_batch_search_tool(max_results: int = 5) -> BatchSearchTool:
+    """
+    Factory function to create a configured batch search tool.
+    
+    Args:
+        max_results: Maximum number of results to return per query.
+        
+    Returns:
+        Configured BatchSearchTool instance.
+    """
+    return BatchSearchTool(max_results=max_results)
@@ -5,6 +5,7 @@ from .components import (
     render_header,
     render_config_panel,
     render_results,
+    render_job_progress,
     render_download_buttons,
     render_configuration_warning,
     render_features_panel,
@@ -17,6 +18,7 @@ __all__ = [
     "render_header",
     "render_config_panel",
     "render_results",
+    "render_job_progress",
     "render_download_buttons",
     "render_configuration_warning",
     "render_features_panel",
@@ -8,7 +8,16 @@ the application interface.
 import streamlit as st
 from typing import Optional, List
 
-from app.services import ResearchResult
+from app.services import ResearchResult, Job
+from app.services.checkpoints import STAGE_RESEARCH, STAGE_SUMMARY, STAGE_EMAIL
+from app.utils.instrumentation import WorkflowMetrics
+
+
+STAGE_TITLES = {
+    STAGE_RESEARCH: "Research Findings",
+    STAGE_SUMMARY: "Analysis Summary",
+    STAGE_EMAIL: "Email Delivery",
+}
 
 
 def render_header():
@@ -37,9 +46,9 @@ def render_config_panel() -> dict:
         )
         
         recipient_email = st.text_input(
-            "Email Recipient",
-            placeholder="recipient@example.com",
-            help="Where to send the research report"
+            "Email Recipients",
+            placeholder="recipient@example.com, team@example.com",
+            help="Where to send the research report. Separate multiple addresses with commas."
         )
         
         col1, col2 = st.columns(2)
@@ -107,6 +116,30 @@ def render_configuration_warning(missing_keys: List[str]):
     )
 
 
+def render_job_progress(job: Job):
+    """
+    Render progress for a queued or running research job.
+    
+    Args:
+        job: The Job snapshot from the job queue.
+    """
+    st.progress(job.progress / 100)
+    st.info(job.message or "Waiting for a free worker...")
+    st.caption(f"Job ID: {job.job_id}")
+    
+    # Outputs of stages that have already finished
+    for stage, title in STAGE_TITLES.items():
+        output = job.partial_outputs.get(stage)
+        if output:
+            with st.expander(f"✅ {title}", expanded=False):
+                st.markdown(output)
+    
+    # Live LLM output of the stage in progress
+    if job.stream_text:
+        st.markdown("**Live output**")
+        st.code(job.stream_text, language=None)
+
+
 def render_results(result: ResearchResult):
     """
     Render research results in tabs.
@@ -121,7 +154,10 @@ def render_results(result: ResearchResult):
     
     # Success notification
     st.balloons()
-    st.success(f"Research completed in {result.execution_time:.1f} seconds!")
+    if result.from_cache:
+        st.success(f"Served a recent report on this topic in {result.execution_time:.1f} seconds!")
+    else:
+        st.success(f"Research completed in {result.execution_time:.1f} seconds!")
     
     # Results tabs
     tab1, tab2, tab3 = st.tabs([
@@ -150,6 +186,49 @@ def render_results(result: ResearchResult):
             st.markdown(result.email_output)
         else:
             st.info("No email status available")
+        
+        if result.delivery_status:
+            st.subheader("Outbox")
+            for recipient, status in result.delivery_status.items():
+                st.markdown(f"- **{recipient}**: {status}")
+    
+    if result.metrics:
+        render_metrics(result.metrics)
+
+
+def render_metrics(metrics: WorkflowMetrics):
+    """
+    Render per-stage timing, token usage and cache statistics.
+    
+    Args:
+        metrics: The WorkflowMetrics attached to a ResearchResult.
+    """
+    with st.expander("Run Metrics", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("LLM Calls", metrics.llm_calls)
+        col2.metric("Total Tokens", f"{metrics.total_tokens:,}")
+        col3.metric("Tool Calls", metrics.tool_calls)
+        
+        rows = []
+        for stage, stats in metrics.stages.items():
+            tool_time = sum(t.total_time for t in stats.tools.values())
+            rows.append({
+                "Stage": STAGE_TITLES.get(stage, stage),
+                "Wall Time (s)": round(stats.wall_time, 1),
+                "LLM Calls": stats.llm_calls,
+                "Prompt Tokens": stats.prompt_tokens,
+                "Completion Tokens": stats.completion_tokens,
+                "Tool Calls": stats.tool_calls,
+                "Tool Time (s)": round(tool_time, 2),
+            })
+        if rows:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+        
+        for name, cache in metrics.caches.items():
+            st.markdown(
+                f"- **{name}** cache: {cache.hit_rate:.0%} hit rate "
+                f"({cache.hits} hits, {cache.misses} misses)"
+            )
 
 
 def render_download_buttons(result: ResearchResult, topic: str):
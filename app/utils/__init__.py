@@ -2,6 +2,11 @@
 
 from .logger import get_logger, setup_logging
 from .validators import validate_email, validate_topic, ValidationError
+from .cache import DiskCache, CacheStats
+from .http import get_http_session
+from .instrumentation import MetricsCollector, WorkflowMetrics, StageMetrics
+from .tracing import get_tracer, trace_span, current_span
+from .metrics import REGISTRY, start_metrics_exporter
 
 __all__ = [
     "get_logger",
@@ -9,4 +14,15 @@ __all__ = [
     "validate_email",
     "validate_topic",
     "ValidationError",
+    "DiskCache",
+    "CacheStats",
+    "get_http_session",
+    "MetricsCollector",
+    "WorkflowMetrics",
+    "StageMetrics",
+    "get_tracer",
+    "trace_span",
+    "current_span",
+    "REGISTRY",
+    "start_metrics_exporter",
 ]
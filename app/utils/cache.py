@@ -0,0 +1,200 @@
+"""
+Disk Cache Utilities for AI Research Crew Pro
+
+Provides a SQLite-backed key/value cache with TTL expiry,
+size-capped LRU eviction, and hit/miss statistics.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils.instrumentation import record_cache_lookup
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Clock used for expiry and LRU order (replaced in tests)
+_wall_clock = time.time
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache usage counters."""
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DiskCache:
+    """
+    Persistent JSON value cache stored in SQLite.
+
+    Features:
+    - Namespaces so several caches can share one database file
+    - Time-to-live expiry checked on read
+    - Least-recently-used eviction once max_entries is exceeded
+    - Thread-safe access from a single shared connection
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        namespace: str,
+        ttl_seconds: int,
+        max_entries: int,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing).
+            namespace: Logical cache name within the database.
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry).
+            max_entries: Maximum entries kept in this namespace.
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_lru "
+            "ON cache (namespace, accessed_at)"
+        )
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable hash key from JSON-serializable parts."""
+        raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The decoded value, or None on a miss or expired entry.
+        """
+        now = _wall_clock()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+                record_cache_lookup(self.namespace, False)
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self._misses += 1
+                record_cache_lookup(self.namespace, False)
+                return None
+
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            self._hits += 1
+
+        record_cache_lookup(self.namespace, True)
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting least-recently-used entries if over capacity.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value.
+        """
+        now = _wall_clock()
+        payload = json.dumps(value, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(namespace, key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, now, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM cache WHERE namespace = ? AND key IN (
+                    SELECT key FROM cache WHERE namespace = ?
+                    ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.namespace, self.namespace, self.max_entries),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries in this namespace and reset counters."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+            )
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit/miss counters and entry count."""
+        with self._lock:
+            (size,) = self._conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+            return CacheStats(hits=self._hits, misses=self._misses, size=size)
@@ -0,0 +1,280 @@
+"""
+Circuit Breakers for AI Research Crew Pro
+
+Tracks the recent error rate and latency of each upstream (Serper, LLM
+providers). When an upstream degrades its breaker opens and callers fail
+fast instead of waiting on timeouts and retries; after a cool-down a
+single probe request decides whether it closes again.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Deque, Iterator
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+from app.utils.metrics import CIRCUIT_REJECTIONS, CIRCUIT_STATE
+
+logger = get_logger(__name__)
+
+# Clock used for cooldowns and slow-call timing (replaced in tests)
+_monotonic = time.monotonic
+
+
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half_open"
+STATE_OPEN = "open"
+
+# Values of the circuit state gauge
+STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(
+            f"{name} is temporarily unavailable (circuit open, retry in {retry_in:.0f}s)"
+        )
+        self.name = name
+        self.retry_in = retry_in
+
+
+def is_outage(error: BaseException) -> bool:
+    """
+    Decide whether an error says the upstream is unhealthy.
+
+    Client errors (bad request, invalid key) are the caller's fault and
+    do not count; server errors, rate limiting, timeouts and connection
+    failures do.
+
+    Args:
+        error: Exception raised by the upstream call.
+
+    Returns:
+        True if the error should count against the breaker.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status >= 500 or status == 429
+    return True
+
+
+class CircuitBreaker:
+    """
+    Error-rate and latency circuit breaker for one upstream.
+
+    Calls that raise an outage error or take longer than
+    slow_call_seconds count as failures. Once at least min_calls of the
+    last window calls are recorded and the failure rate reaches
+    failure_rate, the breaker opens for reset_timeout seconds. Each
+    failed probe doubles the cool-down, up to max_reset_timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        slow_call_seconds: float = 30.0,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 300.0,
+    ):
+        """
+        Initialize the breaker (starts closed).
+
+        Args:
+            name: Upstream name, used in errors, logs and metrics.
+            failure_rate: Fraction of failed calls that opens the breaker.
+            min_calls: Calls needed in the window before it can open.
+            window: Number of recent calls considered.
+            slow_call_seconds: Calls slower than this count as failures.
+            reset_timeout: Initial seconds to stay open before probing.
+            max_reset_timeout: Upper bound for the growing cool-down.
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._cooldown = reset_timeout
+        self._probing = False
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.set(STATE_VALUES[STATE_CLOSED], breaker=name)
+
+    @property
+    def state(self) -> str:
+        """Current state (closed, half_open or open)."""
+        with self._lock:
+            return self._state
+
+    def _set_state(self, state: str):
+        """Switch state (lock held) and publish it."""
+        if state != self._state:
+            logger.warning(f"Circuit {self.name}: {self._state} -> {state}")
+        self._state = state
+        CIRCUIT_STATE.set(STATE_VALUES[state], breaker=self.name)
+
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self._cooldown - _monotonic())
+
+    def check(self):
+        """
+        Fail fast if a call would be rejected right now.
+
+        Does not claim the half-open probe, so it is safe to call before
+        queueing for other resources (rate limits, connection slots).
+
+        Raises:
+            CircuitOpenError: If the breaker is open and still cooling down.
+        """
+        with self._lock:
+            if self._state == STATE_OPEN and self._retry_in() > 0:
+                retry_in = self._retry_in()
+            elif self._state == STATE_HALF_OPEN and self._probing:
+                retry_in = self._cooldown
+            else:
+                return
+        CIRCUIT_REJECTIONS.inc(breaker=self.name)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def _before_call(self):
+        """Admit a call, moving an expired open breaker to half-open."""
+        with self._lock:
+            if self._state == STATE_OPEN and self._retry_in() <= 0:
+                self._set_state(STATE_HALF_OPEN)
+            if self._state == STATE_HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            if self._state == STATE_CLOSED:
+                return
+            retry_in = self._retry_in() if self._state == STATE_OPEN else self._cooldown
+        CIRCUIT_REJECTIONS.inc(breaker=self.name)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def _after_call(self, failed: bool):
+        """Record a call outcome and open or close the breaker."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._probing = False
+                if failed:
+                    # Recovery probe failed: back off for longer
+                    self._cooldown = min(self._cooldown * 2, self.max_reset_timeout)
+                    self._opened_at = _monotonic()
+                    self._set_state(STATE_OPEN)
+                else:
+                    self._cooldown = self.reset_timeout
+                    self._outcomes.clear()
+                    self._set_state(STATE_CLOSED)
+                return
+
+            self._outcomes.append(failed)
+            failures = sum(self._outcomes)
+            if (
+                self._state == STATE_CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._outcomes.clear()
+                self._opened_at = _monotonic()
+                self._set_state(STATE_OPEN)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one upstream call through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call.
+        """
+        self._before_call()
+        start = _monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._after_call(failed=is_outage(e))
+            raise
+        self._after_call(failed=_monotonic() - start > self.slow_call_seconds)
+
+
+@lru_cache(maxsize=None)
+def get_circuit_breaker(name: str, slow_call_seconds: float) -> CircuitBreaker:
+    """
+    Get the process-wide breaker of an upstream.
+
+    Args:
+        name: Upstream name (serper, or an LLM provider).
+        slow_call_seconds: Latency above which a call counts as failed.
+
+    Returns:
+        CircuitBreaker configured from settings.
+    """
+    settings = get_settings()
+    return CircuitBreaker(
+        name,
+        failure_rate=settings.circuit_failure_rate,
+        min_calls=settings.circuit_min_calls,
+        window=settings.circuit_window,
+        slow_call_seconds=slow_call_seconds,
+        reset_timeout=settings.circuit_reset_timeout,
+        max_reset_timeout=settings.circuit_max_reset_timeout,
+    )
+
+
+def install_circuit_breaker(llm: Any, breaker: CircuitBreaker) -> Any:
+    """
+    Wrap an LLM instance's call() so each request runs through a breaker.
+
+    Install this before other wrappers that queue (rate limits,
+    concurrency slots) so only the request itself is timed.
+
+    Args:
+        llm: CrewAI LLM instance.
+        breaker: Breaker of the LLM provider.
+
+    Returns:
+        The same LLM instance.
+    """
+    call = llm.call
+
+    def guarded_call(messages, *args, **kwargs):
+        with breaker.guard():
+            return call(messages, *args, **kwargs)
+
+    object.__setattr__(llm, "call", guarded_call)
+    return llm
+
+
+def reject_when_open(llm: Any, breaker: CircuitBreaker) -> Any:
+    """
+    Wrap an LLM instance's call() to fail fast while its breaker is open.
+
+    Install this after wrappers that queue, so rejected calls do not
+    wait for rate-limit tokens or concurrency slots first.
+
+    Args:
+        llm: CrewAI LLM instance.
+        breaker: Breaker of the LLM provider.
+
+    Returns:
+        The same LLM instance.
+    """
+    call = llm.call
+
+    def checked_call(messages, *args, **kwargs):
+        breaker.check()
+        return call(messages, *args, **kwargs)
+
+    object.__setattr__(llm, "call", checked_call)
+    return llm
@@ -0,0 +1,120 @@
+"""
+HTTP Session Utilities for AI Research Crew Pro
+
+Provides a shared, pooled requests session with keep-alive
+connections and automatic retries for HTTP-based tools.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Responses worth re-sending. Callers retry these themselves, so every
+# attempt takes a token from the shared rate limiter.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a requests session with pooling and retry configured from settings.
+
+    Only failed connection attempts are retried here, since they never
+    reach the server. Responses and read errors are returned to the
+    caller, which retries them through the rate limiter (see
+    RETRY_STATUS_CODES and retry_after()).
+
+    Returns:
+        Configured requests.Session instance.
+    """
+    settings = get_settings()
+
+    retry = Retry(
+        total=settings.http_max_retries,
+        connect=settings.http_max_retries,
+        read=0,
+        status=0,
+        backoff_factor=settings.http_backoff_factor,
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_size,
+        pool_maxsize=settings.http_pool_size,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+
+    logger.debug(
+        f"Created HTTP session (pool={settings.http_pool_size}, "
+        f"retries={settings.http_max_retries})"
+    )
+    return session
+
+
+def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Read the delay a server asked for before the next request.
+
+    Args:
+        response: Rate-limited or failed response.
+
+    Returns:
+        Seconds to wait, or None if the response has no usable
+        Retry-After header.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide shared HTTP session.
+
+    Returns:
+        Shared requests.Session, created on first use.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_http_session()
+
+    return _session
+
+
+def reset_http_session():
+    """Close and discard the shared session (useful for testing)."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
@@ -0,0 +1,316 @@
+"""
+Workflow Instrumentation for AI Research Crew Pro
+
+Collects per-stage timing, token usage, tool latency and cache hit
+metrics for a workflow run. Tools and caches report into the
+collector bound to the current context, so they need no reference
+to the workflow that invoked them.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from app.utils.logger import get_logger
+from app.utils.metrics import CACHE_LOOKUPS, TOOL_DURATION
+
+logger = get_logger(__name__)
+
+
+# Stage used for work that happens outside any crew task
+UNSTAGED = "workflow"
+
+
+@dataclass
+class ToolMetrics:
+    """Call count and latency of one tool."""
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        """Mean seconds per call."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+@dataclass
+class CacheMetrics:
+    """Lookup outcomes for one cache."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class StageMetrics:
+    """Timing and usage of one workflow stage."""
+    wall_time: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    tool_calls: int = 0
+    tools: Dict[str, ToolMetrics] = field(default_factory=dict)
+
+
+@dataclass
+class WorkflowMetrics:
+    """Per-stage and cache metrics of a workflow run."""
+    stages: Dict[str, StageMetrics] = field(default_factory=dict)
+    caches: Dict[str, CacheMetrics] = field(default_factory=dict)
+
+    def stage(self, name: str) -> StageMetrics:
+        """Get (creating if needed) the metrics of a stage."""
+        if name not in self.stages:
+            self.stages[name] = StageMetrics()
+        return self.stages[name]
+
+    @property
+    def llm_calls(self) -> int:
+        return sum(s.llm_calls for s in self.stages.values())
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(s.prompt_tokens for s in self.stages.values())
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(s.completion_tokens for s in self.stages.values())
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(s.total_tokens for s in self.stages.values())
+
+    @property
+    def tool_calls(self) -> int:
+        return sum(s.tool_calls for s in self.stages.values())
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible primitives, including totals."""
+        data = asdict(self)
+        data["totals"] = {
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "tool_calls": self.tool_calls,
+        }
+        for name, cache in self.caches.items():
+            data["caches"][name]["hit_rate"] = cache.hit_rate
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WorkflowMetrics":
+        """Rebuild metrics produced by to_dict()."""
+        stages = {}
+        for name, stage in (data.get("stages") or {}).items():
+            stage = dict(stage)
+            tools = {
+                tool: ToolMetrics(**values)
+                for tool, values in (stage.pop("tools", None) or {}).items()
+            }
+            stages[name] = StageMetrics(**stage, tools=tools)
+
+        caches = {
+            name: CacheMetrics(hits=values["hits"], misses=values["misses"])
+            for name, values in (data.get("caches") or {}).items()
+        }
+        return cls(stages=stages, caches=caches)
+
+
+class MetricsCollector:
+    """
+    Accumulates metrics for one workflow run.
+
+    Tool and cache events are attributed to the current stage, which
+    is either set explicitly with stage() or looked up through
+    stage_resolver (e.g. the progress tracker's running stage).
+    """
+
+    def __init__(self):
+        self.metrics = WorkflowMetrics()
+        self.stage_resolver: Optional[Callable[[], Optional[str]]] = None
+        self._stage_override: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def current_stage(self) -> str:
+        """Stage that new events are attributed to."""
+        if self._stage_override:
+            return self._stage_override
+        if self.stage_resolver is not None:
+            return self.stage_resolver() or UNSTAGED
+        return UNSTAGED
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """Attribute events to a stage and add the block's wall time to it."""
+        previous = self._stage_override
+        self._stage_override = name
+        start = time.perf_counter()
+
+        try:
+            yield self.metrics.stage(name)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.metrics.stage(name).wall_time += elapsed
+            self._stage_override = previous
+
+    def record_tool(self, tool: str, seconds: float):
+        """Record one tool execution."""
+        with self._lock:
+            stats = self.metrics.stage(self.current_stage).tools.setdefault(
+                tool, ToolMetrics()
+            )
+            stats.calls += 1
+            stats.total_time += seconds
+            stats.max_time = max(stats.max_time, seconds)
+
+    def record_llm_call(self, stage: str):
+        """Record one LLM request made during a stage."""
+        with self._lock:
+            self.metrics.stage(stage).llm_calls += 1
+
+    def record_llm_usage(
+        self, stage: str, prompt_tokens: int, completion_tokens: int, total_tokens: int
+    ):
+        """Add one LLM request's token usage to a stage."""
+        with self._lock:
+            stats = self.metrics.stage(stage)
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.total_tokens += total_tokens
+
+    def record_cache(self, cache: str, hit: bool):
+        """Record one cache lookup."""
+        with self._lock:
+            stats = self.metrics.caches.setdefault(cache, CacheMetrics())
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+
+_collector: ContextVar[Optional[MetricsCollector]] = ContextVar(
+    "metrics_collector", default=None
+)
+
+# Stage of the LLM request in progress, read by usage reports it triggers
+_llm_call_stage: ContextVar[Optional[str]] = ContextVar("llm_call_stage", default=None)
+
+
+def get_collector() -> Optional[MetricsCollector]:
+    """Collector bound to the current context, if any."""
+    return _collector.get()
+
+
+@contextmanager
+def collecting(collector: MetricsCollector) -> Iterator[MetricsCollector]:
+    """
+    Bind a collector to the current context.
+
+    Args:
+        collector: Receives tool and cache events raised in this context.
+    """
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+
+
+@contextmanager
+def timed_tool(tool: str) -> Iterator[None]:
+    """
+    Time a tool execution and record it on the current collector and
+    in the tool latency histogram.
+
+    Args:
+        tool: Tool name used as the metrics key.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        TOOL_DURATION.observe(elapsed, tool=tool)
+        collector = _collector.get()
+        if collector is not None:
+            collector.record_tool(tool, elapsed)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """
+    Record a cache lookup in the cache counter and on the current collector.
+
+    Args:
+        cache: Cache name used as the metrics key.
+        hit: Whether the lookup found a fresh entry.
+    """
+    CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+    collector = _collector.get()
+    if collector is not None:
+        collector.record_cache(cache, hit)
+
+
+def count_llm_calls(llm: Any) -> Any:
+    """
+    Wrap an LLM instance's call() to count requests on the current collector.
+
+    Each request is attributed to the stage running when it starts, and
+    token usage reported while it runs (see record_llm_usage()) goes to
+    the same stage, so shared clients never mix up workflows.
+
+    Args:
+        llm: CrewAI LLM instance.
+
+    Returns:
+        The same LLM instance.
+    """
+    call = llm.call
+
+    def counted_call(messages, *args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return call(messages, *args, **kwargs)
+
+        stage = collector.current_stage
+        token = _llm_call_stage.set(stage)
+        try:
+            response = call(messages, *args, **kwargs)
+        finally:
+            _llm_call_stage.reset(token)
+        collector.record_llm_call(stage)
+        return response
+
+    object.__setattr__(llm, "call", counted_call)
+    return llm
+
+
+def record_llm_usage(prompt_tokens: int, completion_tokens: int, total_tokens: int):
+    """
+    Record one LLM request's token usage on the current collector.
+
+    Must run in the context of the request (or a copy of it), so the
+    usage lands on the workflow and stage that made it.
+
+    Args:
+        prompt_tokens: Tokens billed for the prompt.
+        completion_tokens: Tokens billed for the completion.
+        total_tokens: Total tokens billed.
+    """
+    collector = _collector.get()
+    if collector is None:
+        return
+    stage = _llm_call_stage.get() or collector.current_stage
+    collector.record_llm_usage(stage, prompt_tokens, completion_tokens, total_tokens)
@@ -0,0 +1,110 @@
+"""
+LLM Response Cache for AI Research Crew Pro
+
+Serves repeated LLM requests (same model, temperature, messages and
+tools) from the on-disk cache, so re-runs and retries after downstream
+failures do not pay for identical prompts again.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional
+
+from app.config.settings import get_settings
+from app.utils.cache import DiskCache
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def llm_cache_key(
+    model: str,
+    temperature: Optional[float],
+    messages: Any,
+    tools: Optional[List[dict]] = None,
+) -> str:
+    """
+    Key an LLM request by everything that determines its response.
+
+    Args:
+        model: Model name.
+        temperature: Sampling temperature.
+        messages: Prompt string or full list of chat messages.
+        tools: Function-calling schemas offered to the model.
+
+    Returns:
+        Stable hex key.
+    """
+    return DiskCache.make_key(model, temperature, messages, tools or [])
+
+
+def should_cache(temperature: Optional[float], mode: Optional[str] = None) -> bool:
+    """
+    Decide whether responses at a temperature may be cached.
+
+    Args:
+        temperature: Sampling temperature of the LLM.
+        mode: LLM_CACHE setting (defaults to the configured one).
+
+    Returns:
+        True for mode "on", or for mode "auto" with deterministic sampling.
+    """
+    mode = mode or get_settings().llm_cache_mode
+    if mode == "on":
+        return True
+    return mode == "auto" and temperature == 0
+
+
+@lru_cache()
+def get_llm_cache() -> DiskCache:
+    """
+    Get the shared on-disk cache for LLM responses.
+
+    Returns:
+        DiskCache instance configured from settings.
+    """
+    settings = get_settings()
+    return DiskCache(
+        path=settings.cache_path,
+        namespace="llm",
+        ttl_seconds=settings.llm_cache_ttl,
+        max_entries=settings.llm_cache_max_entries,
+    )
+
+
+def install_llm_cache(llm: Any, cache: Optional[DiskCache] = None) -> Any:
+    """
+    Wrap an LLM instance's call() to read and fill the response cache.
+
+    Nothing is installed unless should_cache() allows it for the
+    instance's temperature. Only plain text responses are cached.
+
+    Args:
+        llm: CrewAI LLM instance.
+        cache: Cache to use (defaults to the shared LLM cache).
+
+    Returns:
+        The same LLM instance.
+    """
+    temperature = getattr(llm, "temperature", None)
+    if not should_cache(temperature):
+        return llm
+
+    cache = cache or get_llm_cache()
+    call = llm.call
+    model = str(getattr(llm, "model", "unknown"))
+
+    def cached_call(messages, tools=None, *args, **kwargs):
+        key = llm_cache_key(model, temperature, messages, tools)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for {model}")
+            return cached
+
+        response = call(messages, tools, *args, **kwargs)
+        if isinstance(response, str) and response:
+            cache.set(key, response)
+        return response
+
+    object.__setattr__(llm, "call", cached_call)
+    logger.info(f"LLM response cache enabled for {model} (temperature={temperature})")
+    return llm
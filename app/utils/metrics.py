@@ -0,0 +1,420 @@
+"""
+Prometheus Metrics for AI Research Crew Pro
+
+Provides a dependency-free metrics registry (counters, gauges and
+histograms) rendered in the Prometheus text exposition format, served
+over HTTP or written to a node_exporter textfile.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800)
+LATENCY_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render a label set as {a="x",b="y"} (empty string when unlabelled)."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, keeping integers free of a trailing .0."""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    """Shared label handling for all metric types."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Validate labels and order their values by labelnames."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        """Add a non-negative amount to the labelled series."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value of the labelled series."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+            for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, optionally read from a callback."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str):
+        """Set the labelled series."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the (unlabelled) value from a callback at render time."""
+        self._function = function
+
+    def render(self) -> List[str]:
+        if self._function is not None:
+            try:
+                self.set(self._function())
+            except Exception as e:
+                logger.debug(f"Gauge {self.name} callback failed: {e}")
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}"
+            for k, v in items
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Per series: [bucket counts..., sum, count]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str):
+        """Record one observation in the labelled series."""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        label_names = self.labelnames + ("le",)
+
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+
+        for key, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                labels = _format_labels(label_names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of named metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+WORKFLOWS_TOTAL = REGISTRY.counter(
+    "research_workflows_total",
+    "Research workflows finished, by outcome.",
+    ("status", "source"),
+)
+WORKFLOW_DURATION = REGISTRY.histogram(
+    "research_workflow_duration_seconds",
+    "End-to-end research workflow duration.",
+    ("status",),
+    buckets=DURATION_BUCKETS,
+)
+STAGE_DURATION = REGISTRY.histogram(
+    "research_stage_duration_seconds",
+    "Wall time of each workflow stage.",
+    ("stage",),
+    buckets=DURATION_BUCKETS,
+)
+TOOL_DURATION = REGISTRY.histogram(
+    "research_tool_duration_seconds",
+    "Latency of external calls made by tools (search, SMTP, outbox).",
+    ("tool",),
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "research_cache_lookups_total",
+    "Cache lookups, by cache and result.",
+    ("cache", "result"),
+)
+LLM_CALLS = REGISTRY.counter(
+    "research_llm_calls_total",
+    "LLM requests made by agents, by stage.",
+    ("stage",),
+)
+LLM_TOKENS = REGISTRY.counter(
+    "research_llm_tokens_total",
+    "LLM tokens consumed, by stage and kind.",
+    ("stage", "kind"),
+)
+FAILURES = REGISTRY.counter(
+    "research_failures_total",
+    "Failures, by component and error type.",
+    ("component", "type"),
+)
+RATE_LIMIT_WAIT = REGISTRY.histogram(
+    "research_rate_limit_wait_seconds",
+    "Time requests waited for a shared rate-limit budget.",
+    ("limiter",),
+)
+CIRCUIT_STATE = REGISTRY.gauge(
+    "research_circuit_state",
+    "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open).",
+    ("breaker",),
+)
+CIRCUIT_REJECTIONS = REGISTRY.counter(
+    "research_circuit_rejections_total",
+    "Calls rejected without reaching the upstream because its circuit was open.",
+    ("breaker",),
+)
+OUTBOX_PENDING = REGISTRY.gauge(
+    "research_outbox_pending",
+    "Emails waiting in the outbox for delivery.",
+)
+
+
+def record_failure(component: str, error_type: str):
+    """
+    Count a failure.
+
+    Args:
+        component: Where it happened (workflow, search, email, outbox).
+        error_type: Exception class name or short error code.
+    """
+    FAILURES.inc(component=component, type=error_type)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry on /metrics."""
+
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the application log
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve the registry on http://host:port/metrics in a daemon thread.
+
+    Args:
+        port: TCP port to listen on.
+        host: Interface to bind.
+
+    Returns:
+        The running server.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
+
+
+def write_textfile(path: Path, registry: MetricsRegistry = REGISTRY):
+    """
+    Atomically write the registry to a node_exporter textfile.
+
+    Args:
+        path: Destination ``.prom`` file.
+        registry: Registry to render.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(registry.render(), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _textfile_loop(path: Path, interval: float):
+    """Background loop rewriting the textfile."""
+    while True:
+        try:
+            write_textfile(path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics textfile: {e}")
+        time.sleep(interval)
+
+
+_exporter_lock = threading.Lock()
+_exporter_started = False
+
+
+def start_metrics_exporter() -> bool:
+    """
+    Start the HTTP endpoint and/or textfile writer configured in settings.
+
+    Safe to call repeatedly (e.g. on every Streamlit rerun); only the
+    first call in a process starts anything.
+
+    Returns:
+        True if metrics export is enabled.
+    """
+    global _exporter_started
+    from app.config.settings import get_settings
+
+    settings = get_settings()
+    if not settings.metrics_enabled:
+        return False
+
+    with _exporter_lock:
+        if _exporter_started:
+            return True
+        _exporter_started = True
+
+        if settings.metrics_port:
+            try:
+                start_http_server(settings.metrics_port, settings.metrics_host)
+            except OSError as e:
+                logger.warning(
+                    f"Metrics endpoint not started on port {settings.metrics_port}: {e}"
+                )
+
+        if settings.metrics_textfile:
+            threading.Thread(
+                target=_textfile_loop,
+                args=(Path(settings.metrics_textfile), settings.metrics_textfile_interval),
+                name="metrics-textfile",
+                daemon=True,
+            ).start()
+            logger.info(f"Writing metrics to {settings.metrics_textfile}")
+
+    return True
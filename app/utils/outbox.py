@@ -0,0 +1,412 @@
+"""
+Email Outbox for AI Research Crew Pro
+
+Provides a durable SQLite spool for rendered email messages and a
+background sender that drains it with retries and backoff.
+"""
+
+import smtplib
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from app.config.settings import get_settings
+from app.utils.instrumentation import timed_tool
+from app.utils.logger import get_logger
+from app.utils.metrics import OUTBOX_PENDING, record_failure
+from app.utils.smtp import get_smtp_pool
+
+logger = get_logger(__name__)
+
+# Clock used for backoff and claim leases (replaced in tests)
+_wall_clock = time.time
+
+
+class DeliveryStatus(str, Enum):
+    """Delivery states of a spooled message."""
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclass
+class OutboxMessage:
+    """Delivery record for one spooled message."""
+    message_id: str
+    batch_id: Optional[str]
+    recipient: str
+    subject: str
+    status: DeliveryStatus
+    attempts: int = 0
+    last_error: Optional[str] = None
+    created_at: float = 0.0
+    sent_at: Optional[float] = None
+
+
+class EmailOutbox:
+    """
+    Durable outbox for outgoing email.
+
+    Messages are stored fully rendered, so a sender thread can deliver
+    them independently of the workflow that composed them. Transient
+    failures are retried with exponential backoff; refused recipients
+    and exhausted retries are marked failed.
+
+    Several processes may drain the same spool: a sender claims a
+    message atomically and holds it for lease_seconds, after which a
+    claim left by a crashed sender is returned to the queue.
+    """
+
+    _COLUMNS = (
+        "message_id, batch_id, recipient, subject, status, "
+        "attempts, last_error, created_at, sent_at"
+    )
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        poll_interval: float = 2.0,
+        lease_seconds: float = 300.0,
+    ):
+        """
+        Initialize the outbox.
+
+        Args:
+            db_path: SQLite database file for the spool.
+            max_attempts: Delivery attempts before a message is failed.
+            backoff_seconds: Base delay between attempts (doubles each time).
+            poll_interval: Seconds the sender sleeps when the spool is idle.
+            lease_seconds: Seconds a claimed message may stay in delivery
+                before another sender may retry it.
+        """
+        self.db_path = Path(db_path)
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                message_id TEXT PRIMARY KEY,
+                batch_id TEXT,
+                sender TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                message TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                next_attempt_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                sent_at REAL,
+                claimed_at REAL
+            )
+            """
+        )
+        self._migrate()
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_outbox_due "
+            "ON outbox (status, next_attempt_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_outbox_batch ON outbox (batch_id)"
+        )
+
+    def _migrate(self):
+        """Add columns introduced after the outbox table was first created."""
+        try:
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN claimed_at REAL")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+    def enqueue(
+        self,
+        sender: str,
+        recipient: str,
+        subject: str,
+        message: str,
+        batch_id: Optional[str] = None,
+    ) -> str:
+        """
+        Spool a rendered message for delivery.
+
+        Args:
+            sender: Envelope sender address.
+            recipient: Envelope recipient address.
+            subject: Subject line (for status reporting).
+            message: Fully rendered RFC 5322 message.
+            batch_id: Optional id grouping messages of one workflow.
+
+        Returns:
+            The new message id.
+        """
+        message_id = uuid.uuid4().hex
+        now = _wall_clock()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO outbox (message_id, batch_id, sender, recipient, "
+                "subject, message, status, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    message_id, batch_id, sender, recipient, subject,
+                    message, DeliveryStatus.PENDING.value, now, now,
+                ),
+            )
+
+        logger.info(f"Queued email {message_id} to {recipient}")
+        self._wakeup.set()
+        return message_id
+
+    def get(self, message_id: str) -> Optional[OutboxMessage]:
+        """Look up a message's delivery record."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM outbox WHERE message_id = ?",
+                (message_id,),
+            ).fetchone()
+        return self._row_to_message(row) if row else None
+
+    def status_for_batch(self, batch_id: str) -> List[OutboxMessage]:
+        """List delivery records for all messages in a batch."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM outbox WHERE batch_id = ? "
+                "ORDER BY created_at",
+                (batch_id,),
+            ).fetchall()
+        return [self._row_to_message(row) for row in rows]
+
+    def pending_count(self) -> int:
+        """Number of messages not yet sent or failed."""
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status IN (?, ?)",
+                (DeliveryStatus.PENDING.value, DeliveryStatus.SENDING.value),
+            ).fetchone()
+        return count
+
+    def drain_once(self) -> int:
+        """
+        Attempt delivery of every message that is due.
+
+        Returns:
+            Number of messages attempted.
+        """
+        self._release_stale_claims()
+
+        with self._lock:
+            due = self._conn.execute(
+                "SELECT message_id FROM outbox "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY created_at",
+                (DeliveryStatus.PENDING.value, _wall_clock()),
+            ).fetchall()
+
+        attempted = 0
+        for (message_id,) in due:
+            if self._claim(message_id):
+                self._deliver(message_id)
+                attempted += 1
+        return attempted
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the spool has no pending messages.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the spool drained, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.start()
+
+        while self.pending_count():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wakeup.set()
+            time.sleep(min(self.poll_interval, 0.5))
+        return True
+
+    def start(self):
+        """Start the background sender thread if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._sender_loop, name="email-outbox", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background sender thread."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _sender_loop(self):
+        """Background loop draining the spool."""
+        logger.info("Email outbox sender started")
+        while not self._stopping.is_set():
+            try:
+                self.drain_once()
+            except Exception as e:
+                logger.error(f"Outbox drain failed: {e}", exc_info=True)
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _release_stale_claims(self) -> int:
+        """
+        Return messages whose sender died mid-delivery to the queue.
+
+        Only claims older than the lease are released, so messages that
+        another live process is delivering right now are left alone.
+
+        Returns:
+            Number of messages released.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE outbox SET status = ?, claimed_at = NULL "
+                "WHERE status = ? AND (claimed_at IS NULL OR claimed_at < ?)",
+                (
+                    DeliveryStatus.PENDING.value,
+                    DeliveryStatus.SENDING.value,
+                    _wall_clock() - self.lease_seconds,
+                ),
+            )
+        if cursor.rowcount:
+            logger.warning(f"Released {cursor.rowcount} stale outbox claim(s)")
+        return cursor.rowcount
+
+    def _claim(self, message_id: str) -> bool:
+        """Mark a pending message as being sent; False if already claimed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE outbox SET status = ?, claimed_at = ? "
+                "WHERE message_id = ? AND status = ?",
+                (
+                    DeliveryStatus.SENDING.value,
+                    _wall_clock(),
+                    message_id,
+                    DeliveryStatus.PENDING.value,
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def _deliver(self, message_id: str):
+        """Send one claimed message and record the outcome."""
+        with self._lock:
+            sender, recipient, message, attempts = self._conn.execute(
+                "SELECT sender, recipient, message, attempts FROM outbox "
+                "WHERE message_id = ?",
+                (message_id,),
+            ).fetchone()
+
+        attempts += 1
+        try:
+            with timed_tool("smtp_send"):
+                get_smtp_pool().send(sender, [recipient], message)
+        except smtplib.SMTPRecipientsRefused as e:
+            logger.error(f"Recipient refused for email {message_id}: {recipient}")
+            record_failure("outbox", type(e).__name__)
+            self._record_failure(message_id, attempts, str(e), permanent=True)
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error("SMTP authentication failed while draining outbox")
+            record_failure("outbox", type(e).__name__)
+            self._record_failure(message_id, attempts, str(e), permanent=False)
+        except Exception as e:
+            logger.warning(f"Delivery attempt {attempts} for {message_id} failed: {e}")
+            record_failure("outbox", type(e).__name__)
+            self._record_failure(message_id, attempts, str(e), permanent=False)
+        else:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, sent_at = ?, "
+                    "last_error = NULL WHERE message_id = ?",
+                    (DeliveryStatus.SENT.value, attempts, _wall_clock(), message_id),
+                )
+            logger.info(f"Delivered email {message_id} to {recipient}")
+
+    def _record_failure(
+        self, message_id: str, attempts: int, error: str, permanent: bool
+    ):
+        """Schedule a retry or mark the message failed."""
+        if permanent or attempts >= self.max_attempts:
+            status = DeliveryStatus.FAILED
+            next_attempt_at = _wall_clock()
+        else:
+            status = DeliveryStatus.PENDING
+            next_attempt_at = _wall_clock() + self.backoff_seconds * 2 ** (attempts - 1)
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, "
+                "next_attempt_at = ? WHERE message_id = ?",
+                (status.value, attempts, error, next_attempt_at, message_id),
+            )
+
+    @staticmethod
+    def _row_to_message(row: tuple) -> OutboxMessage:
+        """Convert a database row into an OutboxMessage."""
+        (
+            message_id, batch_id, recipient, subject, status,
+            attempts, last_error, created_at, sent_at,
+        ) = row
+        return OutboxMessage(
+            message_id=message_id,
+            batch_id=batch_id,
+            recipient=recipient,
+            subject=subject,
+            status=DeliveryStatus(status),
+            attempts=attempts,
+            last_error=last_error,
+            created_at=created_at,
+            sent_at=sent_at,
+        )
+
+
+@lru_cache()
+def get_outbox() -> EmailOutbox:
+    """
+    Get the process-wide email outbox with its sender thread running.
+
+    Returns:
+        EmailOutbox configured from settings.
+    """
+    settings = get_settings()
+    outbox = EmailOutbox(
+        db_path=settings.data_path / "outbox.db",
+        max_attempts=settings.email_outbox_max_attempts,
+        backoff_seconds=settings.email_outbox_backoff,
+        lease_seconds=settings.email_outbox_lease,
+    )
+    outbox.start()
+    OUTBOX_PENDING.set_function(outbox.pending_count)
+    return outbox
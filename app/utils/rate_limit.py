@@ -0,0 +1,307 @@
+"""
+Rate Limiting for AI Research Crew Pro
+
+Token buckets shared by every workflow in a process, or by every
+process on a host through SQLite, so concurrent workflows draw from one
+per-provider request budget instead of each assuming the full quota.
+"""
+
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+from app.utils.metrics import RATE_LIMIT_WAIT
+
+logger = get_logger(__name__)
+
+# Clocks used by the buckets and retries (replaced in tests). The
+# shared bucket uses wall-clock time so every process agrees on it.
+_monotonic = time.monotonic
+_wall_clock = time.time
+_sleep = time.sleep
+
+
+# Seconds before the first retry of a failed LLM request
+RETRY_BACKOFF = 1.0
+
+
+class TokenBucket:
+    """
+    In-process token bucket.
+
+    Holds up to capacity tokens and refills at rate_per_minute; each
+    request takes one token and waits while the bucket is empty.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, capacity: int):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            name: Budget name, used in logs and metrics.
+            rate_per_minute: Sustained requests per minute.
+            capacity: Largest burst allowed after idle time.
+        """
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = _monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one refills.
+        """
+        with self._lock:
+            now = _monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available and take it.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        start = _monotonic()
+        while True:
+            wait = self._take()
+            if not wait:
+                break
+            _sleep(wait)
+
+        waited = _monotonic() - start
+        RATE_LIMIT_WAIT.observe(waited, limiter=self.name)
+        if waited > 1:
+            logger.debug(f"Waited {waited:.1f}s for {self.name} rate limit")
+        return waited
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in SQLite, shared across processes.
+
+    Each take runs in an immediate transaction, so processes on the same
+    host serialize on the database lock rather than a thread lock.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, capacity: int, db_path: Path):
+        """
+        Initialize the bucket.
+
+        Args:
+            name: Budget name (the row key shared between processes).
+            rate_per_minute: Sustained requests per minute.
+            capacity: Largest burst allowed after idle time.
+            db_path: SQLite database file (created if missing).
+        """
+        super().__init__(name, rate_per_minute, capacity)
+        self.db_path = Path(db_path)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    def _take(self) -> float:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Wall clock, since monotonic clocks are not shared between processes
+                now = _wall_clock()
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limits WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                tokens, updated = row if row else (float(self.capacity), now)
+                tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+                return wait
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+class RateLimiter:
+    """
+    Named request budgets (one bucket per provider).
+
+    Budgets are configured in settings as <NAME>_RPM; a budget of 0
+    (or an unknown name) is unlimited.
+    """
+
+    def __init__(self, backend: str, burst: int, db_path: Optional[Path] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            backend: "memory" for per-process buckets, "sqlite" for shared ones.
+            burst: Bucket capacity.
+            db_path: SQLite database used by the sqlite backend.
+        """
+        self.backend = backend
+        self.burst = burst
+        self.db_path = db_path
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, name: str) -> Optional[TokenBucket]:
+        """
+        Get (creating if needed) the bucket of a budget.
+
+        Args:
+            name: Budget name (gemini, openai, serper).
+
+        Returns:
+            TokenBucket, or None if the budget is unlimited.
+        """
+        with self._lock:
+            if name in self._buckets:
+                return self._buckets[name]
+
+            rpm = getattr(get_settings(), f"{name}_rpm", 0)
+            bucket = None
+            if rpm:
+                capacity = max(1, min(self.burst, rpm))
+                if self.backend == "sqlite":
+                    bucket = SQLiteTokenBucket(name, rpm, capacity, self.db_path)
+                else:
+                    bucket = TokenBucket(name, rpm, capacity)
+                logger.info(f"Rate limiting {name} to {rpm} requests/min ({self.backend})")
+            self._buckets[name] = bucket
+            return bucket
+
+    def acquire(self, name: str) -> float:
+        """
+        Wait for one request's worth of a budget.
+
+        Args:
+            name: Budget name.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        bucket = self.bucket(name)
+        return bucket.acquire() if bucket is not None else 0.0
+
+
+@lru_cache()
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter.
+
+    Returns:
+        RateLimiter configured from settings.
+    """
+    settings = get_settings()
+    return RateLimiter(
+        backend=settings.rate_limit_backend,
+        burst=settings.rate_limit_burst,
+        db_path=settings.data_path / "rate_limits.db",
+    )
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether a failed request is worth another attempt.
+
+    Args:
+        error: Exception raised by the upstream call.
+
+    Returns:
+        True for rate limiting (429), server errors, timeouts and
+        dropped connections.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    name = type(error).__name__
+    return any(word in name for word in ("Timeout", "Connection", "RateLimit", "Unavailable"))
+
+
+def install_rate_limit(
+    llm: Any,
+    name: str,
+    limiter: Optional[RateLimiter] = None,
+    retries: int = 0,
+    backoff: float = RETRY_BACKOFF,
+) -> Any:
+    """
+    Wrap an LLM instance's call() so each attempt takes from a budget.
+
+    Transient failures are retried here, with exponential backoff,
+    instead of inside the provider client, so retries cannot exceed
+    the shared budget.
+
+    Args:
+        llm: CrewAI LLM instance.
+        name: Budget name (the LLM provider).
+        limiter: Limiter to use (defaults to the process-wide one).
+        retries: Extra attempts after a retryable failure.
+        backoff: Seconds before the first retry (doubled per retry).
+
+    Returns:
+        The same LLM instance.
+    """
+    limiter = limiter or get_rate_limiter()
+    call = llm.call
+
+    def rate_limited_call(messages, *args, **kwargs):
+        for attempt in range(retries + 1):
+            limiter.acquire(name)
+            try:
+                return call(messages, *args, **kwargs)
+            except Exception as e:
+                if attempt >= retries or not is_retryable(e):
+                    raise
+                delay = backoff * 2 ** attempt
+                logger.warning(
+                    f"{name} request failed ({type(e).__name__}), retrying in {delay:.1f}s"
+                )
+                _sleep(delay)
+
+    object.__setattr__(llm, "call", rate_limited_call)
+    return llm
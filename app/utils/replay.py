@@ -0,0 +1,216 @@
+"""
+Record/Replay for AI Research Crew Pro
+
+Captures LLM responses and Serper search results to a compact gzipped
+JSONL recording and serves them back later without network access,
+so whole-pipeline runs can be reproduced and profiled deterministically.
+"""
+
+import atexit
+import gzip
+import json
+import threading
+import zlib
+from collections import defaultdict, deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.config.settings import get_settings
+from app.utils.cache import DiskCache
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+KIND_LLM = "llm"
+KIND_SEARCH = "search"
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed run makes a request that was never recorded."""
+
+
+def llm_request_key(model: str, messages: Any) -> str:
+    """
+    Key an LLM request for recording.
+
+    Agent conversations embed tool observations that can vary between
+    runs (message ids, timestamps), so requests are keyed by the model,
+    the opening system/user messages and the conversation turn rather
+    than the full transcript.
+
+    Args:
+        model: Model name.
+        messages: Prompt string or list of chat messages.
+
+    Returns:
+        Stable hex key.
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    opening = [
+        {"role": m.get("role"), "content": m.get("content")} for m in messages[:2]
+    ]
+    return DiskCache.make_key(model, opening, len(messages))
+
+
+class Cassette:
+    """
+    Recording of external responses.
+
+    In record mode every response is appended to the file as it
+    arrives; the first write of a session replaces any earlier
+    recording. In replay mode responses for a key are served in the
+    order they were recorded; once exhausted, the last one repeats.
+    """
+
+    def __init__(self, path: Path, mode: str):
+        """
+        Initialize the cassette.
+
+        Args:
+            path: Gzipped JSONL recording.
+            mode: MODE_RECORD or MODE_REPLAY.
+
+        Raises:
+            FileNotFoundError: If replaying a recording that does not exist.
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Deque[Any]] = defaultdict(deque)
+        self._last: Dict[Tuple[str, str], Any] = {}
+        self._file = None
+        self._closed = False
+
+        if mode == MODE_REPLAY:
+            self._load()
+        else:
+            atexit.register(self.close)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == MODE_RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    def _load(self):
+        """Read every entry of the recording into per-key queues."""
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    entry = json.loads(line)
+                    self._entries[(entry["k"], entry["h"])].append(entry["r"])
+                    count += 1
+            except (EOFError, json.JSONDecodeError):
+                # Recording process died mid-write; keep what was flushed
+                logger.warning(f"Recording {self.path} is truncated; using {count} entries")
+        logger.info(f"Loaded {count} recorded responses from {self.path}")
+
+    def record(self, kind: str, key: str, response: Any):
+        """
+        Append a response to the recording.
+
+        Args:
+            kind: KIND_LLM or KIND_SEARCH.
+            key: Request key.
+            response: JSON-serializable response.
+        """
+        line = json.dumps({"k": kind, "h": key, "r": response}, ensure_ascii=False)
+        with self._lock:
+            if self._closed:
+                return
+            if self._file is None:
+                # Start afresh so responses from earlier sessions are not replayed
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = gzip.open(self.path, "wt", encoding="utf-8")
+            self._file.write(line + "\n")
+            # Sync-flush so a crashed recording is still readable
+            self._file.flush()
+            self._file.buffer.flush(zlib.Z_SYNC_FLUSH)
+
+    def play(self, kind: str, key: str) -> Any:
+        """
+        Serve the next recorded response for a request.
+
+        Args:
+            kind: KIND_LLM or KIND_SEARCH.
+            key: Request key.
+
+        Returns:
+            The recorded response.
+
+        Raises:
+            ReplayMissError: If the request was never recorded.
+        """
+        with self._lock:
+            queue = self._entries.get((kind, key))
+            if queue:
+                response = queue.popleft()
+                self._last[(kind, key)] = response
+                return response
+            if (kind, key) in self._last:
+                return self._last[(kind, key)]
+        raise ReplayMissError(f"No recorded {kind} response for request {key[:12]}")
+
+    def close(self):
+        """Finish the recording file."""
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def install_llm_replay(llm: Any, cassette: Optional[Cassette] = None) -> Any:
+    """
+    Wrap an LLM instance's call() to record or replay its responses.
+
+    Args:
+        llm: CrewAI LLM instance.
+        cassette: Recording to use (defaults to the configured one).
+
+    Returns:
+        The same LLM instance.
+    """
+    cassette = cassette or get_cassette()
+    if cassette is None:
+        return llm
+
+    call = llm.call
+    model = str(getattr(llm, "model", "unknown"))
+
+    def replay_call(messages, *args, **kwargs):
+        key = llm_request_key(model, messages)
+        if cassette.replaying:
+            return cassette.play(KIND_LLM, key)
+
+        response = call(messages, *args, **kwargs)
+        if isinstance(response, str):
+            cassette.record(KIND_LLM, key, response)
+        return response
+
+    object.__setattr__(llm, "call", replay_call)
+    logger.info(f"LLM calls will be {'replayed' if cassette.replaying else 'recorded'}")
+    return llm
+
+
+@lru_cache()
+def get_cassette() -> Optional[Cassette]:
+    """
+    Get the process-wide recording selected by REPLAY_MODE.
+
+    Returns:
+        Cassette, or None when record/replay is off.
+    """
+    settings = get_settings()
+    if settings.replay_mode == "off":
+        return None
+    return Cassette(settings.replay_path, settings.replay_mode)
@@ -0,0 +1,191 @@
+"""
+SMTP Connection Pool for AI Research Crew Pro
+
+Keeps authenticated SMTP connections alive between messages so
+batches of emails share one handshake instead of one per send.
+"""
+
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP connections.
+
+    Features:
+    - Reuses idle connections after a NOOP health check
+    - Discards connections idle past the timeout or broken mid-send
+    - Bounds the number of simultaneously open connections
+    - Reconnects once and retries when the server drops a connection
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        max_size: int = 2,
+        idle_timeout: float = 60.0,
+        use_tls: bool = True,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            host: SMTP server hostname.
+            port: SMTP server port.
+            username: Login user (login skipped when empty).
+            password: Login password.
+            max_size: Maximum connections open at once.
+            idle_timeout: Seconds an idle connection may be reused.
+            use_tls: Upgrade connections with STARTTLS.
+            timeout: Socket timeout in seconds.
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.idle_timeout = idle_timeout
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new connection."""
+        logger.debug(f"Opening SMTP connection to {self.host}:{self.port}")
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            self._close(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP):
+        """Close a connection, ignoring errors from a dead socket."""
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _is_alive(server: smtplib.SMTP) -> bool:
+        """Check a connection with NOOP."""
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        """Take a healthy idle connection or open a new one."""
+        now = time.monotonic()
+
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, released_at = self._idle.pop()
+
+            if now - released_at <= self.idle_timeout and self._is_alive(server):
+                return server
+            self._close(server)
+
+        return self._connect()
+
+    def _release(self, server: smtplib.SMTP):
+        """Return a connection to the idle set."""
+        with self._lock:
+            self._idle.append((server, time.monotonic()))
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow an authenticated connection.
+
+        The connection is returned to the pool on success or when the
+        server answered with an SMTP error, and discarded otherwise.
+
+        Yields:
+            Authenticated smtplib.SMTP connection.
+        """
+        with self._slots:
+            server = self._acquire()
+            try:
+                yield server
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                self._release(server)
+                raise
+            except Exception:
+                self._close(server)
+                raise
+            else:
+                self._release(server)
+
+    def send(self, from_addr: str, to_addrs: List[str], message: str) -> dict:
+        """
+        Send one message, reconnecting once if the connection was dropped.
+
+        Args:
+            from_addr: Envelope sender.
+            to_addrs: Envelope recipients.
+            message: Fully rendered RFC 5322 message.
+
+        Returns:
+            Refused recipients as returned by smtplib.sendmail.
+        """
+        try:
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, message)
+        except smtplib.SMTPServerDisconnected:
+            logger.warning("SMTP connection dropped, reconnecting")
+            with self.connection() as server:
+                return server.sendmail(from_addr, to_addrs, message)
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._close(server)
+
+
+@lru_cache()
+def get_smtp_pool() -> SMTPConnectionPool:
+    """
+    Get the process-wide SMTP connection pool.
+
+    Returns:
+        SMTPConnectionPool configured from settings.
+    """
+    settings = get_settings()
+    return SMTPConnectionPool(
+        host=settings.smtp_server,
+        port=settings.smtp_port,
+        username=settings.email_user,
+        password=settings.email_pass,
+        max_size=settings.smtp_pool_size,
+        idle_timeout=settings.smtp_idle_timeout,
+        use_tls=settings.smtp_use_tls,
+    )
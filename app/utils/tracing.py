@@ -0,0 +1,463 @@
+"""
+Tracing for AI Research Crew Pro
+
+Provides lightweight OpenTelemetry-style spans for workflows, tasks,
+LLM calls and tool invocations, with console, JSONL file and optional
+OTLP exporters.
+"""
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from app.config.settings import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class Span:
+    """A timed, attributed unit of work within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = STATUS_OK
+    status_message: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds between start and end (0.0 while open)."""
+        return (self.end_time - self.start_time) if self.end_time else 0.0
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach one attribute to the span."""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        """Attach several attributes to the span."""
+        self.attributes.update(attributes)
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        """Set the span outcome (STATUS_OK or STATUS_ERROR)."""
+        self.status = status
+        self.status_message = message
+
+    def to_dict(self) -> dict:
+        """Serialize the span to JSON-compatible primitives."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+            "status_message": self.status_message,
+        }
+
+
+class _NoopSpan(Span):
+    """Span handed out when tracing is disabled; discards everything."""
+
+    def __init__(self):
+        super().__init__(name="noop", trace_id="", span_id="")
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class SpanExporter:
+    """Base class for span exporters."""
+
+    def on_start(self, span: Span):
+        """Called when a span opens (optional)."""
+
+    def export(self, span: Span):
+        """Called when a span closes."""
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Flush and release resources."""
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Logs each finished span on one line."""
+
+    def export(self, span: Span):
+        attributes = " ".join(f"{k}={v!r}" for k, v in span.attributes.items())
+        logger.info(
+            f"[trace {span.trace_id[:8]}] {span.name} "
+            f"{span.duration * 1000:.0f}ms {span.status} {attributes}"
+        )
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends each finished span to a JSONL file."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: JSONL file receiving one span per line.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self):
+        with self._lock:
+            self._file.close()
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    Mirrors spans into the OpenTelemetry SDK and ships them over OTLP/HTTP.
+
+    Requires the ``opentelemetry-sdk`` and
+    ``opentelemetry-exporter-otlp-proto-http`` packages.
+    """
+
+    def __init__(self, endpoint: Optional[str] = None, service_name: str = "prime-brief"):
+        """
+        Initialize the exporter.
+
+        Args:
+            endpoint: OTLP traces endpoint (SDK default when None).
+            service_name: Value of the service.name resource attribute.
+
+        Raises:
+            ImportError: If the OpenTelemetry packages are not installed.
+        """
+        from opentelemetry import trace as otel_trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter as HTTPExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.trace import Status, StatusCode
+
+        self._otel_trace = otel_trace
+        self._error_status = lambda message: Status(StatusCode.ERROR, message)
+
+        exporter = HTTPExporter(endpoint=endpoint) if endpoint else HTTPExporter()
+        self._provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name})
+        )
+        self._provider.add_span_processor(BatchSpanProcessor(exporter))
+        self._tracer = self._provider.get_tracer("app.utils.tracing")
+
+        self._live: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span):
+        with self._lock:
+            parent = self._live.get(span.parent_id)
+        context = self._otel_trace.set_span_in_context(parent) if parent else None
+        otel_span = self._tracer.start_span(
+            span.name, context=context, start_time=int(span.start_time * 1e9)
+        )
+        with self._lock:
+            self._live[span.span_id] = otel_span
+
+    def export(self, span: Span):
+        with self._lock:
+            otel_span = self._live.pop(span.span_id, None)
+        if otel_span is None:
+            return
+
+        for key, value in span.attributes.items():
+            if not isinstance(value, (str, bool, int, float)):
+                value = str(value)
+            otel_span.set_attribute(key, value)
+        if span.status == STATUS_ERROR:
+            otel_span.set_status(self._error_status(span.status_message))
+        otel_span.end(end_time=int(span.end_time * 1e9))
+
+    def shutdown(self):
+        self._provider.shutdown()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to exporters.
+
+    The active span is tracked in a context variable, so nested spans
+    (including those opened in tools called by agents) are parented
+    automatically within a thread or a copied context.
+    """
+
+    def __init__(self, exporters: Sequence[SpanExporter] = ()):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporters: Receivers of finished spans. With none, tracing is
+                disabled and spans are no-ops.
+        """
+        self.exporters: List[SpanExporter] = list(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[Span] = None,
+    ) -> Span:
+        """
+        Open a span without making it current.
+
+        Args:
+            name: Span name.
+            attributes: Initial attributes.
+            parent: Parent span (defaults to the current span).
+
+        Returns:
+            The open span (NOOP_SPAN when tracing is disabled).
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+
+        parent = parent or _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes or {}),
+        )
+        for exporter in self.exporters:
+            try:
+                exporter.on_start(span)
+            except Exception as e:
+                logger.debug(f"Span exporter failed on start: {e}")
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None):
+        """
+        Close a span and export it.
+
+        Args:
+            span: Span returned by start_span().
+            error: Exception that ended the span, if any.
+        """
+        if span is NOOP_SPAN or span.end_time is not None:
+            return
+
+        if error is not None:
+            span.set_status(STATUS_ERROR, f"{type(error).__name__}: {error}")
+        span.end_time = time.time()
+
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.debug(f"Span exporter failed on export: {e}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Open a span, make it current for the block, then close it.
+
+        Args:
+            name: Span name.
+            **attributes: Initial attributes.
+        """
+        span = self.start_span(name, attributes)
+        if span is NOOP_SPAN:
+            yield span
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def shutdown(self):
+        """Flush and close all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+class SpanSequence:
+    """
+    Consecutive sibling spans driven by callbacks, such as the tasks of
+    a crew, where each span ends when the next one begins.
+    """
+
+    def __init__(self, tracer: Tracer, names: Sequence[str]):
+        """
+        Initialize the sequence.
+
+        Args:
+            tracer: Tracer creating the spans.
+            names: Span names in execution order.
+        """
+        self.tracer = tracer
+        self.names = list(names)
+        self.index = 0
+        self._span: Optional[Span] = None
+        self._parent: Optional[Span] = None
+
+    def _open(self):
+        """Open and activate the span at the current index."""
+        if self.index < len(self.names):
+            self._span = self.tracer.start_span(self.names[self.index], parent=self._parent)
+            if self._span is not NOOP_SPAN:
+                _current_span.set(self._span)
+        else:
+            self._span = None
+            _current_span.set(self._parent)
+
+    def advance(self, **attributes: Any):
+        """Close the current span with attributes and open the next one."""
+        if self._span is None:
+            return
+        self._span.set_attributes(**attributes)
+        self.tracer.end_span(self._span)
+        self.index += 1
+        self._open()
+
+    @contextmanager
+    def running(self) -> Iterator["SpanSequence"]:
+        """Open the first span and close any span left open on exit."""
+        self._parent = _current_span.get()
+        self._open()
+        try:
+            yield self
+        except BaseException as e:
+            if self._span is not None:
+                self.tracer.end_span(self._span, e)
+            raise
+        finally:
+            if self._span is not None:
+                self.tracer.end_span(self._span)
+            _current_span.set(self._parent)
+
+
+def current_span() -> Span:
+    """The active span, or NOOP_SPAN when there is none."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def trace_llm_calls(llm: Any, tracer: Optional[Tracer] = None) -> Any:
+    """
+    Wrap an LLM instance's call() so each call opens an ``llm.call`` span.
+
+    The wrapper is installed on the instance, so it also applies when
+    the LLM class dispatches to a provider-specific implementation.
+
+    Args:
+        llm: CrewAI LLM instance.
+        tracer: Tracer to use (defaults to the process-wide tracer).
+
+    Returns:
+        The same LLM instance.
+    """
+    tracer = tracer or get_tracer()
+    if not tracer.enabled:
+        return llm
+
+    call = llm.call
+    model = str(getattr(llm, "model", "unknown"))
+
+    def traced_call(messages, *args, **kwargs):
+        with tracer.span("llm.call", model=model) as span:
+            if isinstance(messages, list):
+                span.set_attribute("message_count", len(messages))
+            response = call(messages, *args, **kwargs)
+            if isinstance(response, str):
+                span.set_attribute("response_chars", len(response))
+            return response
+
+    object.__setattr__(llm, "call", traced_call)
+    return llm
+
+
+def _create_exporters() -> List[SpanExporter]:
+    """Build the exporters selected in settings."""
+    settings = get_settings()
+    if not settings.tracing_enabled:
+        return []
+
+    if settings.tracing_exporter == "console":
+        return [ConsoleSpanExporter()]
+
+    if settings.tracing_exporter == "otlp":
+        try:
+            return [OTLPSpanExporter(endpoint=settings.otlp_endpoint)]
+        except ImportError:
+            logger.warning(
+                "OpenTelemetry packages not installed; "
+                f"writing traces to {settings.trace_path} instead"
+            )
+
+    return [JsonlSpanExporter(settings.trace_path)]
+
+
+@lru_cache()
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer.
+
+    Returns:
+        Tracer with the exporters configured in settings.
+    """
+    return Tracer(_create_exporters())
+
+
+def trace_span(name: str, **attributes: Any):
+    """
+    Open a span on the process-wide tracer.
+
+    Usage:
+        with trace_span("tool.web_search", query=query) as span:
+            ...
+            span.set_attribute("result_count", n)
+    """
+    return get_tracer().span(name, **attributes)
@@ -0,0 +1,300 @@
+"""
+Offline stand-ins for the external services used by the research workflow.
+
+- FakeLLM: a CrewAI LLM that answers in ReAct format after a configurable
+  delay, calling the search and email tools once per agent.
+- FakeSerperServer: an HTTP server that answers Serper search requests
+  with canned results.
+- SMTPSink: a minimal plaintext SMTP server that accepts every message.
+"""
+
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+
+try:
+    from crewai import BaseLLM
+except ImportError:
+    from crewai.llms.base_llm import BaseLLM
+
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+TOPIC_PATTERN = re.compile(r"web research on:\s*(.+)")
+TOOL_NAME_PATTERN = re.compile(r"^Tool Name:\s*(.+?)\s*$", re.MULTILINE)
+
+LOREM = (
+    "Analysts expect steady adoption as costs fall and tooling matures, "
+    "while regulators focus on transparency, safety and data protection. "
+)
+
+
+def _report(words: int) -> str:
+    """Build a Markdown report of roughly the given length."""
+    sentences = max(1, words // len(LOREM.split()))
+    body = LOREM * sentences
+    return (
+        "## Executive Summary\n\n"
+        f"{body}\n\n"
+        "## Key Findings\n\n"
+        "- **Adoption** is accelerating across industries\n"
+        "- **Costs** continue to decline year over year\n"
+        "- **Regulation** is converging on common principles\n\n"
+        "## Sources\n\n"
+        "1. https://example.com/report-2024\n"
+    )
+
+
+class FakeLLM(BaseLLM):
+    """
+    Deterministic LLM for benchmarks.
+
+    The first call of an agent that has the search or email tool returns
+    an action for that tool; every other call returns a final answer.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        jitter: float = 0.0,
+        report_words: int = 400,
+        use_tools: bool = True,
+    ):
+        """
+        Initialize the fake LLM.
+
+        Args:
+            latency: Seconds each call takes.
+            jitter: Extra random delay of up to this many seconds.
+            report_words: Approximate length of final answers.
+            use_tools: Whether agents call their tools before answering.
+        """
+        super().__init__(model="fake/benchmark", temperature=0.0)
+        self.latency = latency
+        self.jitter = jitter
+        self.report = _report(report_words)
+        self.use_tools = use_tools
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        has_acted = any(m.get("role") == "assistant" for m in messages)
+
+        if self.use_tools and not has_acted:
+            # Tools are listed under the names the agent must use in Action:
+            tools = TOOL_NAME_PATTERN.findall(prompt)
+            email_tool = self._find_tool(tools, "email")
+            search_tool = self._find_tool(tools, "search", exclude="batch")
+            if email_tool:
+                match = EMAIL_PATTERN.search(prompt.split("Send a professional email")[-1])
+                return self._action(email_tool, {
+                    "to_email": match.group(0) if match else "bench@example.com",
+                    "subject": "Benchmark report",
+                    "body": self.report,
+                })
+            if search_tool:
+                match = TOPIC_PATTERN.search(prompt)
+                return self._action(search_tool, {
+                    "search_query": match.group(1).strip() if match else "benchmark",
+                })
+
+        return f"Thought: I now know the final answer\nFinal Answer: {self.report}"
+
+    @staticmethod
+    def _find_tool(tools: List[str], word: str, exclude: str = "") -> Optional[str]:
+        """First listed tool whose name mentions word (and not exclude)."""
+        for tool in tools:
+            name = tool.lower()
+            if word in name and not (exclude and exclude in name):
+                return tool
+        return None
+
+    @staticmethod
+    def _action(tool: str, arguments: dict) -> str:
+        return (
+            f"Thought: I should use the {tool} tool\n"
+            f"Action: {tool}\n"
+            f"Action Input: {json.dumps(arguments)}"
+        )
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128_000
+
+
+class _SerperHandler(BaseHTTPRequestHandler):
+    """Answers POST /search with canned organic results."""
+
+    server: "FakeSerperServer"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.server.latency)
+
+        query = payload.get("q", "")
+        results = {
+            "searchParameters": {"q": query},
+            "organic": [
+                {
+                    "title": f"{query} - result {i + 1}",
+                    "link": f"https://example.com/{i + 1}",
+                    "snippet": LOREM,
+                    "date": "2024-01-01",
+                }
+                for i in range(int(payload.get("num", 5)))
+            ],
+        }
+        body = json.dumps(results).encode("utf-8")
+
+        with self.server.lock:
+            self.server.requests += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSerperServer(ThreadingHTTPServer):
+    """Local stand-in for the Serper search API."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.1):
+        """
+        Initialize the server (call start() to serve).
+
+        Args:
+            host: Interface to bind.
+            port: Port to bind (0 picks a free one).
+            latency: Seconds each search takes.
+        """
+        super().__init__((host, port), _SerperHandler)
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="fake-serper", daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for smtplib (EHLO, AUTH PLAIN, MAIL, RCPT, DATA)."""
+
+    server: "SMTPSink"
+
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        self._reply("220 localhost benchmark sink ready")
+        mail_from, rcpt_to = "", []
+
+        for raw in self.rfile:
+            command = raw.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self._reply("250-localhost")
+                self._reply("250-AUTH PLAIN")
+                self._reply("250 8BITMIME")
+            elif verb == "HELO":
+                self._reply("250 localhost")
+            elif verb == "AUTH":
+                self._reply("235 Authentication successful")
+            elif verb == "MAIL":
+                mail_from, rcpt_to = command[10:].strip("<> "), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                rcpt_to.append(command[8:].strip("<> "))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                    size += len(line)
+                time.sleep(self.server.latency)
+                self.server.record(mail_from, rcpt_to, size)
+                self._reply("250 OK queued")
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Local SMTP server that accepts every message (no TLS)."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Initialize the sink (call start() to serve).
+
+        Args:
+            host: Interface to bind.
+            port: Port to bind (0 picks a free one).
+            latency: Seconds spent accepting each message.
+        """
+        super().__init__((host, port), _SMTPHandler)
+        self.latency = latency
+        self.messages: List[Tuple[str, List[str], int]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record(self, mail_from: str, rcpt_to: List[str], size: int):
+        with self._lock:
+            self.messages.append((mail_from, list(rcpt_to), size))
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,227 @@
+"""
+Offline end-to-end benchmark for the research workflow.
+
+Runs CrewService.execute_research_workflow against a fake LLM, a local
+Serper stand-in and a local SMTP sink, so performance changes can be
+measured without network access or API spend.
+
+Usage:
+    python -m benchmarks.run --workflows 20 --concurrency 4 --llm-latency 0.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.fakes import FakeLLM, FakeSerperServer, SMTPSink
+
+
+def configure_environment(
+    args: argparse.Namespace,
+    serper: FakeSerperServer,
+    smtp: SMTPSink,
+    workdir: Path,
+):
+    """Point the application at the local fakes (before it is imported)."""
+    def flag(value: bool) -> str:
+        return "true" if value else "false"
+
+    os.environ.update({
+        "LLM_PROVIDER": "gemini",
+        "GOOGLE_API_KEY": "benchmark",
+        "SERPER_API_KEY": "benchmark",
+        "SERPER_URL": serper.url,
+        "HTTP_MAX_RETRIES": "0",
+        "EMAIL_USER": "benchmark@example.com",
+        "EMAIL_PASS": "benchmark",
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_USE_TLS": "false",
+        "EMAIL_DELIVERY_MODE": args.delivery_mode,
+        "EMAIL_OUTBOX_ENABLED": flag(args.outbox),
+        "SEARCH_CACHE_ENABLED": flag(args.cache),
+        "WORKFLOW_CACHE_ENABLED": flag(args.cache),
+        "LLM_CACHE": "on" if args.cache else "off",
+        "CACHE_DIR": str(workdir / "cache"),
+        "DATA_DIR": str(workdir / "data"),
+        "ENABLE_MEMORY": "false",
+        "ENABLE_VERBOSE": "false",
+        "MAX_RPM": "100000",
+        "GEMINI_RPM": "0",
+        "SERPER_RPM": "0",
+        "LOG_LEVEL": "WARNING",
+        "TRACING_ENABLED": "false",
+        "METRICS_ENABLED": "false",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true",
+    })
+
+
+def max_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (None if unknown)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark the research workflow offline.",
+    )
+    parser.add_argument("-n", "--workflows", type=int, default=10,
+                        help="Workflows to run (default: 10)")
+    parser.add_argument("-j", "--concurrency", type=int, default=1,
+                        help="Workflows run at once (default: 1)")
+    parser.add_argument("--topics", type=int, default=None,
+                        help="Distinct topics cycled through (default: one per workflow)")
+    parser.add_argument("--recipients", type=int, default=1,
+                        help="Recipients per workflow (default: 1)")
+    parser.add_argument("--num-results", type=int, default=5,
+                        help="Search results per query (default: 5)")
+    parser.add_argument("--llm-latency", type=float, default=0.2,
+                        help="Seconds per fake LLM call (default: 0.2)")
+    parser.add_argument("--llm-jitter", type=float, default=0.0,
+                        help="Extra random seconds per LLM call (default: 0)")
+    parser.add_argument("--report-words", type=int, default=400,
+                        help="Approximate words per fake LLM answer (default: 400)")
+    parser.add_argument("--no-tools", action="store_true",
+                        help="Answer immediately instead of calling tools")
+    parser.add_argument("--serper-latency", type=float, default=0.1,
+                        help="Seconds per fake search (default: 0.1)")
+    parser.add_argument("--smtp-latency", type=float, default=0.0,
+                        help="Seconds per message accepted by the SMTP sink (default: 0)")
+    parser.add_argument("--delivery-mode", choices=["agent", "direct"], default="agent",
+                        help="EMAIL_DELIVERY_MODE for the run (default: agent)")
+    parser.add_argument("--outbox", action="store_true",
+                        help="Deliver through the email outbox (flushed before reporting)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Enable search, workflow and LLM caches")
+    parser.add_argument("--json", type=Path, default=None,
+                        help="Also write the report to this JSON file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+
+    serper = FakeSerperServer(latency=args.serper_latency)
+    smtp = SMTPSink(latency=args.smtp_latency)
+    serper.start()
+    smtp.start()
+
+    workdir = Path(tempfile.mkdtemp(prefix="prime-brief-bench-"))
+    configure_environment(args, serper, smtp, workdir)
+
+    # Imported only now so settings pick up the benchmark environment
+    from app.agents import get_llm_pool
+    from app.cli import percentile
+    from app.services import CrewService
+    from app.utils import setup_logging
+    from app.utils.outbox import get_outbox
+
+    setup_logging()
+    fake_llms = []
+
+    def build_fake_llm(provider: str, model: str, temperature: float) -> FakeLLM:
+        llm = FakeLLM(
+            latency=args.llm_latency,
+            jitter=args.llm_jitter,
+            report_words=args.report_words,
+            use_tools=not args.no_tools,
+        )
+        fake_llms.append(llm)
+        return llm
+
+    get_llm_pool().builder = build_fake_llm
+
+    topics = args.topics or args.workflows
+    workflows = [
+        {
+            "topic": f"Benchmark topic {i % topics}: trends in edge computing",
+            "recipient_email": [
+                f"reader{r}@example.com" for r in range(args.recipients)
+            ],
+            "num_results": args.num_results,
+        }
+        for i in range(args.workflows)
+    ]
+
+    per_workflow_peaks = []
+
+    def run_one(workflow: dict):
+        if args.concurrency == 1:
+            tracemalloc.reset_peak()
+        result = CrewService().execute_research_workflow(**workflow)
+        if args.concurrency == 1:
+            per_workflow_peaks.append(tracemalloc.get_traced_memory()[1])
+        return result
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(run_one, workflows))
+    if args.outbox:
+        get_outbox().flush(timeout=300)
+    wall_time = time.perf_counter() - start
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [r.execution_time for r in results]
+    mib = 1024 * 1024
+    report = {
+        "workflows": len(results),
+        "succeeded": sum(1 for r in results if r.success),
+        "concurrency": args.concurrency,
+        "wall_time_s": round(wall_time, 3),
+        "throughput_per_min": round(len(results) / wall_time * 60, 2),
+        "latency_p50_s": round(percentile(latencies, 50), 3),
+        "latency_p95_s": round(percentile(latencies, 95), 3),
+        "latency_max_s": round(max(latencies), 3),
+        "latency_mean_s": round(statistics.mean(latencies), 3),
+        "llm_calls": sum(llm.calls for llm in fake_llms),
+        "search_requests": serper.requests,
+        "emails_received": sum(len(rcpts) for _, rcpts, _ in smtp.messages),
+        "peak_traced_memory_mib": round(peak_traced / mib, 2),
+        "memory_per_workflow_mib": round(
+            (max(per_workflow_peaks) if per_workflow_peaks
+             else peak_traced / args.concurrency) / mib, 2
+        ),
+        "max_rss_mib": round(max_rss_mb() or 0.0, 1),
+    }
+
+    errors = {r.error_message for r in results if not r.success}
+    for error in errors:
+        print(f"Workflow failed: {error}", file=sys.stderr)
+
+    print()
+    for key, value in report.items():
+        print(f"{key:<26} {value}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    serper.stop()
+    smtp.stop()
+    return 0 if report["succeeded"] == report["workflows"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
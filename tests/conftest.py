@@ -0,0 +1,40 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+class FakeClock:
+    """Stands in for the clocks of the module under test; sleeping advances it."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock_targets():
+    """(module, attribute) clock functions to replace; override per test module."""
+    return []
+
+
+@pytest.fixture
+def sleep_targets():
+    """(module, attribute) sleep functions to replace; override per test module."""
+    return []
+
+
+@pytest.fixture
+def clock(monkeypatch, clock_targets, sleep_targets):
+    clock = FakeClock()
+    for module, name in clock_targets:
+        monkeypatch.setattr(module, name, clock)
+    for module, name in sleep_targets:
+        monkeypatch.setattr(module, name, clock.sleep)
+    return clock
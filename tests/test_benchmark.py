@@ -0,0 +1,32 @@
+"""Smoke test for the offline benchmark harness."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_one_workflow_reaches_search_and_smtp(tmp_path):
+    report_path = tmp_path / "report.json"
+    subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.run",
+            "--workflows", "1",
+            "--llm-latency", "0",
+            "--serper-latency", "0",
+            "--delivery-mode", "agent",
+            "--json", str(report_path),
+        ],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        timeout=300,
+    )
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+
+    assert report["succeeded"] == 1
+    # The fake LLM drives the agents through their real tools
+    assert report["search_requests"] > 0
+    assert report["emails_received"] > 0
@@ -0,0 +1,97 @@
+"""Tests for the SQLite-backed DiskCache."""
+
+import pytest
+
+from app.utils import cache as cache_module
+from app.utils.cache import DiskCache
+
+
+@pytest.fixture
+def clock_targets():
+    return [(cache_module, "_wall_clock")]
+
+
+def make_cache(tmp_path, namespace="test", ttl_seconds=60, max_entries=10):
+    return DiskCache(
+        path=tmp_path / "cache.db",
+        namespace=namespace,
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+    )
+
+
+def test_round_trips_json_values(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.set("key", {"results": [1, 2, 3], "query": "héllo"})
+
+    assert cache.get("key") == {"results": [1, 2, 3], "query": "héllo"}
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.set("key", "value")
+
+    clock.now += 60
+    assert cache.get("key") == "value"
+
+    clock.now += 1
+    assert cache.get("key") is None
+    assert cache.stats.size == 0
+
+
+def test_zero_ttl_never_expires(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=0)
+    cache.set("key", "value")
+
+    clock.now += 10 ** 9
+    assert cache.get("key") == "value"
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.set("a", 1)
+    clock.now += 1
+    cache.set("b", 2)
+    clock.now += 1
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    clock.now += 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.size == 2
+
+
+def test_namespaces_are_isolated(tmp_path, clock):
+    first = make_cache(tmp_path, namespace="first", max_entries=1)
+    second = make_cache(tmp_path, namespace="second", max_entries=1)
+    first.set("key", "one")
+    second.set("key", "two")
+    second.set("other", "three")
+
+    assert first.get("key") == "one"
+    assert second.get("key") is None
+    assert second.get("other") == "three"
+
+
+def test_stats_count_hits_and_misses(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("key")
+    cache.get("missing")
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+    cache.clear()
+    assert cache.stats.hits == cache.stats.misses == cache.stats.size == 0
+
+
+def test_make_key_ignores_dict_order():
+    assert DiskCache.make_key({"a": 1, "b": 2}) == DiskCache.make_key({"b": 2, "a": 1})
+    assert DiskCache.make_key("q", 1) != DiskCache.make_key("q", 2)
@@ -0,0 +1,126 @@
+"""Tests for workflow checkpoint storage and resume."""
+
+import warnings
+from dataclasses import asdict
+from types import SimpleNamespace
+
+from app.services import crew_service
+from app.services.checkpoints import (
+    STAGE_EMAIL,
+    STAGE_RESEARCH,
+    STAGE_SUMMARY,
+    CheckpointStore,
+)
+from app.services.crew_service import CrewService, WorkflowRequest
+from app.services.progress import StageHistory
+
+
+def make_request(**overrides) -> WorkflowRequest:
+    options = dict(
+        topic="Solid-state batteries",
+        recipient_email=["a@example.com", "b@example.com"],
+        report_format="Technical Brief",
+        num_results=3,
+        run_id="run-1",
+    )
+    options.update(overrides)
+    return WorkflowRequest.create(**options)
+
+
+def test_unknown_run_has_no_checkpoint(tmp_path):
+    assert CheckpointStore(tmp_path / "checkpoints.db").load("missing") is None
+
+
+def test_saves_stages_in_order(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    request = make_request()
+    store.begin(request.run_id, asdict(request))
+
+    checkpoint = store.load(request.run_id)
+    assert checkpoint.last_stage is None
+    assert not checkpoint.completed
+
+    store.save_stage(request.run_id, STAGE_RESEARCH, "findings")
+    assert store.load(request.run_id).last_stage == STAGE_RESEARCH
+
+    store.save_stage(request.run_id, STAGE_SUMMARY, "summary")
+    checkpoint = store.load(request.run_id)
+    assert checkpoint.last_stage == STAGE_SUMMARY
+    assert checkpoint.research_output == "findings"
+    assert checkpoint.summary_output == "summary"
+    assert checkpoint.email_output is None
+
+
+def test_resume_after_restart(tmp_path):
+    db_path = tmp_path / "checkpoints.db"
+    request = make_request()
+    store = CheckpointStore(db_path)
+    store.begin(request.run_id, asdict(request))
+    store.save_stage(request.run_id, STAGE_RESEARCH, "findings")
+
+    # A new process reads the same database
+    checkpoint = CheckpointStore(db_path).load(request.run_id)
+
+    assert checkpoint.research_output == "findings"
+    assert checkpoint.last_stage == STAGE_RESEARCH
+    assert WorkflowRequest(**checkpoint.request) == request
+
+
+def test_begin_keeps_completed_stages(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    request = make_request()
+    store.begin(request.run_id, asdict(request))
+    store.save_stage(request.run_id, STAGE_RESEARCH, "findings")
+
+    store.begin(request.run_id, asdict(request))
+
+    assert store.load(request.run_id).research_output == "findings"
+
+
+def test_records_delivery_and_completion(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    request = make_request()
+    store.begin(request.run_id, asdict(request))
+    store.save_stage(request.run_id, STAGE_EMAIL, "sent")
+    store.save_delivery(request.run_id, {"a@example.com": "sent", "b@example.com": "queued"})
+    store.mark_completed(request.run_id)
+
+    checkpoint = store.load(request.run_id)
+    assert checkpoint.last_stage == STAGE_EMAIL
+    assert checkpoint.delivery_status == {"a@example.com": "sent", "b@example.com": "queued"}
+    assert checkpoint.completed
+
+
+def test_runs_are_independent(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    first, second = make_request(run_id="run-1"), make_request(run_id="run-2")
+    store.begin(first.run_id, asdict(first))
+    store.begin(second.run_id, asdict(second))
+    store.save_stage(first.run_id, STAGE_RESEARCH, "findings")
+
+    assert store.load(second.run_id).last_stage is None
+
+
+def test_crew_checkpoints_each_finished_stage(monkeypatch, tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    history = StageHistory(tmp_path / "history.db")
+    monkeypatch.setattr(crew_service, "get_checkpoint_store", lambda: store)
+    monkeypatch.setattr(crew_service, "get_stage_history", lambda: history)
+    published = []
+    service = CrewService(stage_callback=lambda stage, output: published.append(stage))
+    request = make_request(recipient_email="a@example.com")
+    store.begin(request.run_id, asdict(request))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        crew, stages = service._build_crew(request)
+    tracker = service._create_tracker(crew, stages)
+    service._checkpoint_tasks(crew, request, tracker)
+    crew.task_callback(SimpleNamespace(raw="findings"))
+    crew.task_callback(SimpleNamespace(raw="summary"))
+
+    assert all(task.callback is None for task in crew.tasks)
+    checkpoint = store.load(request.run_id)
+    assert checkpoint.research_output == "findings"
+    assert checkpoint.summary_output == "summary"
+    assert published == [STAGE_RESEARCH, STAGE_SUMMARY]
@@ -0,0 +1,183 @@
+"""Tests for the circuit breaker state machine."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import circuit_breaker
+from app.utils.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    install_circuit_breaker,
+    is_outage,
+    reject_when_open,
+)
+
+
+@pytest.fixture
+def clock_targets():
+    return [(circuit_breaker, "_monotonic")]
+
+
+def make_breaker(**overrides):
+    options = dict(
+        failure_rate=0.5,
+        min_calls=4,
+        window=10,
+        slow_call_seconds=5.0,
+        reset_timeout=30.0,
+        max_reset_timeout=100.0,
+    )
+    options.update(overrides)
+    return CircuitBreaker("test", **options)
+
+
+def succeed(breaker):
+    with breaker.guard():
+        pass
+
+
+def fail(breaker, error=None):
+    with pytest.raises(type(error or ConnectionError())):
+        with breaker.guard():
+            raise error or ConnectionError("upstream down")
+
+
+def trip(breaker):
+    for _ in range(breaker.min_calls):
+        fail(breaker)
+    assert breaker.state == STATE_OPEN
+
+
+def test_opens_at_failure_rate(clock):
+    breaker = make_breaker()
+    succeed(breaker)
+    succeed(breaker)
+    fail(breaker)
+    assert breaker.state == STATE_CLOSED
+
+    fail(breaker)
+    assert breaker.state == STATE_OPEN
+
+
+def test_needs_min_calls_before_opening(clock):
+    breaker = make_breaker(min_calls=4)
+    for _ in range(3):
+        fail(breaker)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_client_errors_do_not_count(clock):
+    breaker = make_breaker()
+    bad_request = ValueError("bad request")
+    bad_request.status_code = 400
+    for _ in range(10):
+        fail(breaker, bad_request)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_slow_calls_count_as_failures(clock):
+    breaker = make_breaker()
+    for _ in range(4):
+        with breaker.guard():
+            clock.now += 6
+    assert breaker.state == STATE_OPEN
+
+
+def test_open_breaker_rejects_until_cooled_down(clock):
+    breaker = make_breaker()
+    trip(breaker)
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.check()
+    assert excinfo.value.retry_in == pytest.approx(30)
+    with pytest.raises(CircuitOpenError):
+        succeed(breaker)
+
+    clock.now += 30
+    breaker.check()
+
+
+def test_successful_probe_closes(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 30
+
+    with breaker.guard():
+        assert breaker.state == STATE_HALF_OPEN
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        with pytest.raises(CircuitOpenError):
+            succeed(breaker)
+    assert breaker.state == STATE_CLOSED
+
+    # The failure window starts over after recovery
+    fail(breaker)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_failed_probe_doubles_cooldown(clock):
+    breaker = make_breaker(reset_timeout=30, max_reset_timeout=100)
+    trip(breaker)
+
+    clock.now += 30
+    fail(breaker)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.check()
+    assert excinfo.value.retry_in == pytest.approx(60)
+
+    clock.now += 60
+    fail(breaker)
+    clock.now += 99
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    clock.now += 1
+    succeed(breaker)
+    assert breaker.state == STATE_CLOSED
+
+    # Recovery resets the cool-down
+    trip(breaker)
+    clock.now += 30
+    breaker.check()
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (SimpleNamespace(status_code=500), True),
+        (SimpleNamespace(status_code=429), True),
+        (SimpleNamespace(status_code=401), False),
+        (SimpleNamespace(response=SimpleNamespace(status_code=404)), False),
+        (TimeoutError(), True),
+    ],
+)
+def test_is_outage(error, expected):
+    assert is_outage(error) is expected
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, messages, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("upstream down")
+
+
+def test_llm_wrappers_fail_fast_while_open(clock):
+    breaker = make_breaker()
+    llm = FakeLLM()
+    install_circuit_breaker(llm, breaker)
+    reject_when_open(llm, breaker)
+
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            llm.call([])
+    with pytest.raises(CircuitOpenError):
+        llm.call([])
+    assert llm.calls == 4
@@ -0,0 +1,47 @@
+"""Tests for loading batch topics files."""
+
+import json
+
+import pytest
+
+from app.cli import load_topics
+
+
+def write_jsonl(path, *records):
+    path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+    return path
+
+
+def test_jsonl_recipient_list(tmp_path):
+    path = write_jsonl(
+        tmp_path / "topics.jsonl",
+        {"topic": "Solid-state batteries", "recipient_email": ["a@example.com", "b@example.com"]},
+        {"topic": "Edge computing", "recipient_email": ["c@example.com"]},
+    )
+
+    first, second = load_topics(path)
+
+    assert first["recipient_email"] == ["a@example.com", "b@example.com"]
+    assert second["recipient_email"] == "c@example.com"
+
+
+def test_csv_recipients_split_on_semicolons(tmp_path):
+    path = tmp_path / "topics.csv"
+    path.write_text(
+        "topic,recipient_email\nSolid-state batteries,a@example.com;b@example.com\n",
+        encoding="utf-8",
+    )
+
+    (workflow,) = load_topics(path)
+
+    assert workflow["recipient_email"] == ["a@example.com", "b@example.com"]
+
+
+def test_rejects_invalid_recipients_in_list(tmp_path):
+    path = write_jsonl(
+        tmp_path / "topics.jsonl",
+        {"topic": "Solid-state batteries", "recipient_email": ["a@example.com", 42]},
+    )
+
+    with pytest.raises(ValueError, match="Record 1"):
+        load_topics(path)
@@ -0,0 +1,23 @@
+"""Tests for HTML email rendering."""
+
+from app.tools.email_renderer import EmailRenderer
+
+
+def test_escapes_markup_in_subject():
+    rendered = EmailRenderer().render("<script>alert(1)</script> report", "Body")
+
+    assert "<script>" not in rendered
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; report" in rendered
+
+
+def test_subject_braces_are_kept_literally():
+    rendered = EmailRenderer().render("Sets like {a, b} and {content}", "**Body**")
+
+    assert "Sets like {a, b} and {content}" in rendered
+    assert rendered.count("<strong>Body</strong>") == 1
+
+
+def test_reuses_rendered_html():
+    renderer = EmailRenderer()
+
+    assert renderer.render("Subject", "Body") is renderer.render("Subject", "Body")
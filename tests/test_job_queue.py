@@ -0,0 +1,163 @@
+"""Tests for the SQLite job queue: claims, leases and resume."""
+
+import json
+import time
+import uuid
+
+import pytest
+
+from app.services import job_queue as job_queue_module
+from app.services.crew_service import ResearchResult
+from app.services.job_queue import JobQueue, JobStatus
+
+
+PARAMS = {"topic": "Edge computing", "recipient_email": "reader@example.com"}
+
+
+class FakeCrewService:
+    """Stands in for CrewService; fails runs while `failing` is set."""
+
+    failing = False
+    crash = False
+    resumed = []
+
+    def __init__(self, **callbacks):
+        self.callbacks = callbacks
+
+    def execute_research_workflow(self, run_id: str, **params) -> ResearchResult:
+        if FakeCrewService.crash:
+            raise RuntimeError("worker crashed")
+        if FakeCrewService.failing:
+            return ResearchResult(success=False, error_message="LLM unavailable", run_id=run_id)
+        return ResearchResult(success=True, summary_output="report", run_id=run_id)
+
+    def resume(self, run_id: str) -> ResearchResult:
+        FakeCrewService.resumed.append(run_id)
+        return ResearchResult(success=True, summary_output="resumed", run_id=run_id)
+
+
+@pytest.fixture(autouse=True)
+def crew_service(monkeypatch):
+    monkeypatch.setattr(FakeCrewService, "failing", False)
+    monkeypatch.setattr(FakeCrewService, "crash", False)
+    monkeypatch.setattr(FakeCrewService, "resumed", [])
+    monkeypatch.setattr(job_queue_module, "CrewService", FakeCrewService)
+    return FakeCrewService
+
+
+@pytest.fixture
+def queues(tmp_path):
+    """Builds queues sharing one database and shuts them down afterwards."""
+    created = []
+
+    def make_queue(lease_seconds: float = 60.0) -> JobQueue:
+        queue = JobQueue(tmp_path / "jobs.db", max_workers=2, lease_seconds=lease_seconds)
+        created.append(queue)
+        return queue
+
+    yield make_queue
+    for queue in created:
+        queue.shutdown()
+
+
+def wait_for(queue: JobQueue, job_id: str, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if not job.is_active:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} still {job.status.value}")
+
+
+def insert_job(queue: JobQueue, status: JobStatus, **fields) -> str:
+    """Store a job as if another process had created (and claimed) it."""
+    job_id = uuid.uuid4().hex
+    queue._conn.execute(
+        "INSERT INTO jobs (job_id, params, status, created_at) VALUES (?, ?, ?, ?)",
+        (job_id, json.dumps(PARAMS), status.value, time.time()),
+    )
+    if fields:
+        queue._update(job_id, **fields)
+    return job_id
+
+
+def test_runs_submitted_jobs(queues):
+    queue = queues()
+    job_id = queue.submit("Edge computing", ["a@example.com", "b@example.com"])
+
+    job = wait_for(queue, job_id)
+
+    assert job.status == JobStatus.COMPLETED
+    assert job.result.run_id == job_id
+    assert job.result.summary_output == "report"
+    assert job.params["recipient_email"] == ["a@example.com", "b@example.com"]
+    assert queue._running == set()
+
+
+def test_claims_are_exclusive(queues):
+    first, second = queues(), queues()
+    job_id = insert_job(first, JobStatus.QUEUED)
+
+    assert second._claim(job_id)
+    assert not first._claim(job_id)
+    assert second.get(job_id).status == JobStatus.RUNNING
+
+
+def test_live_jobs_survive_another_process_starting(queues):
+    job_id = insert_job(
+        queues(), JobStatus.RUNNING, owner="other-host:1:abc", heartbeat_at=time.time()
+    )
+
+    queue = queues(lease_seconds=60)
+
+    assert queue.get(job_id).status == JobStatus.RUNNING
+
+
+def test_jobs_with_expired_leases_are_failed(queues):
+    job_id = insert_job(
+        queues(), JobStatus.RUNNING, owner="other-host:1:abc", heartbeat_at=time.time() - 61
+    )
+
+    queue = queues(lease_seconds=60)
+
+    job = queue.get(job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.message == "Interrupted: its worker process stopped"
+    assert job.result is None
+
+
+def test_waiting_jobs_are_picked_up_after_restart(queues):
+    job_id = insert_job(queues(), JobStatus.QUEUED)
+
+    queue = queues()
+
+    assert wait_for(queue, job_id).status == JobStatus.COMPLETED
+
+
+def test_failed_jobs_resume(queues, crew_service):
+    crew_service.failing = True
+    queue = queues()
+    job_id = queue.submit("Edge computing", "reader@example.com")
+    assert wait_for(queue, job_id).status == JobStatus.FAILED
+
+    assert queue.resume(job_id)
+
+    job = wait_for(queue, job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.result.summary_output == "resumed"
+    assert crew_service.resumed == [job_id]
+    assert not queue.resume(job_id)
+
+
+def test_crashed_jobs_keep_their_run_id(queues, crew_service):
+    crew_service.crash = True
+    queue = queues()
+    job_id = queue.submit("Edge computing", "reader@example.com")
+
+    job = wait_for(queue, job_id)
+
+    assert job.status == JobStatus.FAILED
+    assert job.result.error_message == "worker crashed"
+    assert job.result.run_id == job_id
+    assert queue._running == set()
@@ -0,0 +1,95 @@
+"""Tests for per-workflow LLM request and token accounting."""
+
+import threading
+import uuid
+
+from crewai.events import LLMCallCompletedEvent, crewai_event_bus
+from crewai.events.types.llm_events import LLMCallType
+
+from app.agents.llm_pool import LLMPool, record_call_usage
+from app.utils.instrumentation import MetricsCollector, collecting
+
+
+class FakeLLM:
+    """LLM stand-in that reports usage the way CrewAI providers do."""
+
+    model = "fake/usage"
+    temperature = 0.7
+
+    def __init__(self, prompt_tokens: int = 100, completion_tokens: int = 10):
+        self.usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+
+    def call(self, messages, *args, **kwargs):
+        crewai_event_bus.emit(
+            self,
+            LLMCallCompletedEvent(
+                response="ok",
+                call_type=LLMCallType.LLM_CALL,
+                model=self.model,
+                call_id=uuid.uuid4().hex,
+                usage=self.usage,
+            ),
+        )
+        return "ok"
+
+
+def make_pool():
+    return LLMPool(max_concurrency=4, builder=lambda *key: FakeLLM())
+
+
+def test_counts_requests_and_tokens_per_stage():
+    llm = make_pool().get("openai", "fake/usage", 0.7)
+    collector = MetricsCollector()
+
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.on(LLMCallCompletedEvent)(record_call_usage)
+        with collecting(collector):
+            with collector.stage("research"):
+                llm.call("one")
+                llm.call("two")
+            with collector.stage("summary"):
+                llm.call("three")
+        crewai_event_bus.flush()
+
+    research = collector.metrics.stages["research"]
+    summary = collector.metrics.stages["summary"]
+    assert (research.llm_calls, research.prompt_tokens, research.total_tokens) == (2, 200, 220)
+    assert (summary.llm_calls, summary.completion_tokens) == (1, 10)
+
+
+def test_concurrent_workflows_on_a_shared_client_stay_separate():
+    llm = make_pool().get("openai", "fake/usage", 0.7)
+    collectors = [MetricsCollector() for _ in range(4)]
+    start = threading.Barrier(len(collectors))
+
+    def workflow(collector: MetricsCollector, calls: int):
+        with collecting(collector), collector.stage("research"):
+            start.wait()
+            for _ in range(calls):
+                llm.call("prompt")
+
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.on(LLMCallCompletedEvent)(record_call_usage)
+        threads = [
+            threading.Thread(target=workflow, args=(collector, calls))
+            for calls, collector in enumerate(collectors, 1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        crewai_event_bus.flush()
+
+    for calls, collector in enumerate(collectors, 1):
+        stats = collector.metrics.stages["research"]
+        assert stats.llm_calls == calls
+        assert stats.total_tokens == 110 * calls
+
+
+def test_calls_outside_a_workflow_are_not_counted():
+    llm = make_pool().get("openai", "fake/usage", 0.7)
+
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.on(LLMCallCompletedEvent)(record_call_usage)
+        assert llm.call("prompt") == "ok"
+        crewai_event_bus.flush()
@@ -0,0 +1,101 @@
+"""Tests for the Prometheus metrics registry and text rendering."""
+
+import urllib.request
+
+import pytest
+
+from app.utils.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    start_http_server,
+    write_textfile,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_renders_labelled_series(registry):
+    counter = registry.counter("jobs_total", "Jobs run.", ["status"])
+    counter.inc(status="success")
+    counter.inc(2, status="success")
+    counter.inc(status="error")
+
+    assert counter.value(status="success") == 3
+    assert registry.render() == (
+        "# HELP jobs_total Jobs run.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{status="error"} 1\n'
+        'jobs_total{status="success"} 3\n'
+    )
+
+
+def test_counter_rejects_decrease_and_wrong_labels(registry):
+    counter = registry.counter("jobs_total", "Jobs run.", ["status"])
+    with pytest.raises(ValueError):
+        counter.inc(-1, status="success")
+    with pytest.raises(ValueError):
+        counter.inc(stage="research")
+
+
+def test_gauge_renders_values_and_callbacks(registry):
+    gauge = registry.gauge("queue_depth", "Items waiting.")
+    gauge.set(2.5)
+    assert registry.render().splitlines()[-1] == "queue_depth 2.5"
+
+    gauge.set_function(lambda: 7)
+    assert registry.render().splitlines()[-1] == "queue_depth 7"
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = registry.histogram("latency_seconds", "Latency.", ["tool"], buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, tool="search")
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{tool="search",le="0.1"} 2',
+        'latency_seconds_bucket{tool="search",le="1"} 3',
+        'latency_seconds_bucket{tool="search",le="+Inf"} 4',
+        'latency_seconds_sum{tool="search"} 3.65',
+        'latency_seconds_count{tool="search"} 4',
+    ]
+
+
+def test_label_values_are_escaped(registry):
+    counter = registry.counter("errors_total", "Errors.", ["message"])
+    counter.inc(message='bad "quote"\\path\nnext')
+
+    assert registry.render().splitlines()[-1] == (
+        'errors_total{message="bad \\"quote\\"\\\\path\\nnext"} 1'
+    )
+
+
+def test_registering_twice_returns_the_same_metric(registry):
+    first = registry.counter("jobs_total", "Jobs run.")
+    assert registry.counter("jobs_total", "Jobs run.") is first
+    with pytest.raises(ValueError):
+        registry.gauge("jobs_total", "Jobs run.")
+
+
+def test_write_textfile(tmp_path, registry):
+    registry.counter("jobs_total", "Jobs run.").inc()
+    path = tmp_path / "metrics" / "crew.prom"
+
+    write_textfile(path, registry)
+
+    assert path.read_text(encoding="utf-8") == registry.render()
+    assert [p.name for p in path.parent.iterdir()] == ["crew.prom"]
+
+
+def test_http_endpoint_serves_registry():
+    server = start_http_server(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert b"# TYPE research_workflows_total counter" in response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,156 @@
+"""Tests for the durable email outbox."""
+
+import smtplib
+
+import pytest
+
+from app.utils import outbox as outbox_module
+from app.utils.outbox import DeliveryStatus, EmailOutbox
+
+
+class FakeSMTPPool:
+    """Records deliveries and raises queued errors first."""
+
+    def __init__(self):
+        self.errors = []
+        self.sent = []
+
+    def send(self, sender, recipients, message):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((sender, recipients, message))
+
+
+@pytest.fixture
+def clock_targets():
+    return [(outbox_module, "_wall_clock")]
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    pool = FakeSMTPPool()
+    monkeypatch.setattr(outbox_module, "get_smtp_pool", lambda: pool)
+    return pool
+
+
+def make_outbox(tmp_path, **options):
+    options.setdefault("max_attempts", 3)
+    options.setdefault("backoff_seconds", 10.0)
+    options.setdefault("lease_seconds", 60.0)
+    return EmailOutbox(tmp_path / "outbox.db", **options)
+
+
+def enqueue(outbox, recipient="reader@example.com", batch_id=None):
+    return outbox.enqueue(
+        sender="bot@example.com",
+        recipient=recipient,
+        subject="Weekly digest",
+        message="Subject: Weekly digest\n\nHello",
+        batch_id=batch_id,
+    )
+
+
+def test_delivers_due_messages(tmp_path, clock, smtp):
+    outbox = make_outbox(tmp_path)
+    message_id = enqueue(outbox, batch_id="run-1")
+    assert outbox.pending_count() == 1
+
+    assert outbox.drain_once() == 1
+
+    message = outbox.get(message_id)
+    assert message.status == DeliveryStatus.SENT
+    assert message.attempts == 1
+    assert message.sent_at == clock.now
+    assert smtp.sent == [
+        ("bot@example.com", ["reader@example.com"], "Subject: Weekly digest\n\nHello")
+    ]
+    assert outbox.pending_count() == 0
+    assert [m.message_id for m in outbox.status_for_batch("run-1")] == [message_id]
+
+
+def test_transient_failures_back_off_exponentially(tmp_path, clock, smtp):
+    outbox = make_outbox(tmp_path, backoff_seconds=10.0)
+    message_id = enqueue(outbox)
+    smtp.errors = [smtplib.SMTPServerDisconnected("gone")] * 2
+
+    outbox.drain_once()
+    message = outbox.get(message_id)
+    assert message.status == DeliveryStatus.PENDING
+    assert message.last_error == "gone"
+
+    # Not due again until the first backoff has passed
+    clock.now += 9
+    assert outbox.drain_once() == 0
+    clock.now += 1
+    assert outbox.drain_once() == 1
+
+    # The second backoff is twice as long
+    clock.now += 19
+    assert outbox.drain_once() == 0
+    clock.now += 1
+    assert outbox.drain_once() == 1
+    assert outbox.get(message_id).status == DeliveryStatus.SENT
+    assert outbox.get(message_id).attempts == 3
+
+
+def test_fails_after_max_attempts(tmp_path, clock, smtp):
+    outbox = make_outbox(tmp_path, max_attempts=2, backoff_seconds=0)
+    message_id = enqueue(outbox)
+    smtp.errors = [OSError("connection refused")] * 2
+
+    outbox.drain_once()
+    outbox.drain_once()
+
+    message = outbox.get(message_id)
+    assert message.status == DeliveryStatus.FAILED
+    assert message.attempts == 2
+    assert outbox.drain_once() == 0
+
+
+def test_refused_recipient_fails_immediately(tmp_path, clock, smtp):
+    outbox = make_outbox(tmp_path)
+    message_id = enqueue(outbox)
+    smtp.errors = [smtplib.SMTPRecipientsRefused({"reader@example.com": (550, b"no")})]
+
+    outbox.drain_once()
+
+    message = outbox.get(message_id)
+    assert message.status == DeliveryStatus.FAILED
+    assert message.attempts == 1
+
+
+def test_claims_are_exclusive(tmp_path, clock, smtp):
+    first = make_outbox(tmp_path)
+    second = make_outbox(tmp_path)
+    message_id = enqueue(first)
+
+    assert first._claim(message_id)
+    assert not second._claim(message_id)
+    assert second.drain_once() == 0
+    assert smtp.sent == []
+
+
+def test_stale_claims_are_released_after_lease(tmp_path, clock, smtp):
+    crashed = make_outbox(tmp_path, lease_seconds=60)
+    survivor = make_outbox(tmp_path, lease_seconds=60)
+    message_id = enqueue(crashed)
+    crashed._claim(message_id)
+
+    # A live claim is left alone
+    clock.now += 60
+    assert survivor.drain_once() == 0
+    assert survivor.get(message_id).status == DeliveryStatus.SENDING
+
+    clock.now += 1
+    assert survivor.drain_once() == 1
+    assert survivor.get(message_id).status == DeliveryStatus.SENT
+    assert len(smtp.sent) == 1
+
+
+def test_spool_survives_reopening(tmp_path, clock, smtp):
+    message_id = enqueue(make_outbox(tmp_path))
+
+    reopened = make_outbox(tmp_path)
+    assert reopened.pending_count() == 1
+    reopened.drain_once()
+    assert reopened.get(message_id).status == DeliveryStatus.SENT
@@ -0,0 +1,157 @@
+"""Tests for the token buckets and the LLM retry wrapper."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.settings import get_settings
+from app.utils import rate_limit
+from app.utils.rate_limit import (
+    RateLimiter,
+    SQLiteTokenBucket,
+    TokenBucket,
+    install_rate_limit,
+    is_retryable,
+)
+
+
+@pytest.fixture
+def clock_targets():
+    return [(rate_limit, "_monotonic"), (rate_limit, "_wall_clock")]
+
+
+@pytest.fixture
+def sleep_targets():
+    return [(rate_limit, "_sleep")]
+
+
+@pytest.fixture
+def fresh_settings():
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket("test", rate_per_minute=60, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert clock.slept == []
+
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket("test", rate_per_minute=60, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 3600
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_sqlite_buckets_share_one_budget(tmp_path, clock):
+    db_path = tmp_path / "rate_limits.db"
+    first = SQLiteTokenBucket("gemini", 60, 2, db_path)
+    second = SQLiteTokenBucket("gemini", 60, 2, db_path)
+
+    first.acquire()
+    second.acquire()
+    assert clock.slept == []
+
+    # Both tokens are gone, whichever process asks next
+    assert first.acquire() == pytest.approx(1.0)
+    assert second.acquire() == pytest.approx(1.0)
+
+
+def test_sqlite_buckets_keep_names_apart(tmp_path, clock):
+    db_path = tmp_path / "rate_limits.db"
+    SQLiteTokenBucket("gemini", 60, 1, db_path).acquire()
+
+    assert SQLiteTokenBucket("openai", 60, 1, db_path).acquire() == 0
+
+
+def test_limiter_skips_unlimited_budgets(monkeypatch, fresh_settings, clock):
+    monkeypatch.setenv("GEMINI_RPM", "0")
+    monkeypatch.setenv("OPENAI_RPM", "120")
+    limiter = RateLimiter(backend="memory", burst=5)
+
+    assert limiter.bucket("gemini") is None
+    assert limiter.bucket("unknown") is None
+    assert limiter.acquire("gemini") == 0.0
+
+    bucket = limiter.bucket("openai")
+    assert bucket.capacity == 5
+    assert limiter.bucket("openai") is bucket
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (SimpleNamespace(status_code=429), True),
+        (SimpleNamespace(status_code=503), True),
+        (SimpleNamespace(status_code=400), False),
+        (SimpleNamespace(response=SimpleNamespace(status_code=502)), True),
+        (TimeoutError(), True),
+        (ConnectionError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+class FlakyLLM:
+    """LLM stand-in that raises the queued errors before answering."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def call(self, messages, *args, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self, name: str) -> float:
+        self.acquired += 1
+        return 0.0
+
+
+def test_retries_take_a_token_per_attempt(clock):
+    llm = FlakyLLM(TimeoutError(), ConnectionError())
+    limiter = CountingLimiter()
+    install_rate_limit(llm, "gemini", limiter=limiter, retries=2, backoff=1.0)
+
+    assert llm.call([]) == "ok"
+    assert limiter.acquired == 3
+    assert clock.slept == [1.0, 2.0]
+
+
+def test_gives_up_after_retries(clock):
+    llm = FlakyLLM(TimeoutError(), TimeoutError())
+    limiter = CountingLimiter()
+    install_rate_limit(llm, "gemini", limiter=limiter, retries=1)
+
+    with pytest.raises(TimeoutError):
+        llm.call([])
+    assert limiter.acquired == 2
+
+
+def test_does_not_retry_client_errors(clock):
+    llm = FlakyLLM(ValueError("bad request"))
+    limiter = CountingLimiter()
+    install_rate_limit(llm, "gemini", limiter=limiter, retries=3)
+
+    with pytest.raises(ValueError):
+        llm.call([])
+    assert limiter.acquired == 1
+    assert clock.slept == []
@@ -0,0 +1,61 @@
+"""Tests for recording and replaying external responses."""
+
+import pytest
+
+from app.config.settings import get_settings
+from app.tools import search_tool
+from app.tools.search_tool import SearchTool
+from app.utils.replay import KIND_SEARCH, MODE_RECORD, MODE_REPLAY, Cassette, ReplayMissError
+
+
+def record(path, *responses):
+    cassette = Cassette(path, MODE_RECORD)
+    for key, response in responses:
+        cassette.record(KIND_SEARCH, key, response)
+    cassette.close()
+
+
+def test_replays_responses_in_recorded_order(tmp_path):
+    path = tmp_path / "replay.jsonl.gz"
+    record(path, ("q", {"n": 1}), ("q", {"n": 2}))
+
+    cassette = Cassette(path, MODE_REPLAY)
+
+    assert cassette.play(KIND_SEARCH, "q") == {"n": 1}
+    assert cassette.play(KIND_SEARCH, "q") == {"n": 2}
+    assert cassette.play(KIND_SEARCH, "q") == {"n": 2}
+    with pytest.raises(ReplayMissError):
+        cassette.play(KIND_SEARCH, "other")
+
+
+def test_recording_again_replaces_the_previous_session(tmp_path):
+    path = tmp_path / "replay.jsonl.gz"
+    record(path, ("q", {"session": 1}))
+    record(path, ("q", {"session": 2}))
+
+    cassette = Cassette(path, MODE_REPLAY)
+
+    assert cassette.play(KIND_SEARCH, "q") == {"session": 2}
+
+
+def test_record_session_without_writes_keeps_the_recording(tmp_path):
+    path = tmp_path / "replay.jsonl.gz"
+    record(path, ("q", {"session": 1}))
+    record(path)
+
+    assert Cassette(path, MODE_REPLAY).play(KIND_SEARCH, "q") == {"session": 1}
+
+
+def test_search_replay_miss_fails_the_workflow(monkeypatch, tmp_path):
+    path = tmp_path / "replay.jsonl.gz"
+    record(path, ("other", {"organic": []}))
+    monkeypatch.setenv("SEARCH_CACHE_ENABLED", "false")
+    get_settings.cache_clear()
+    cassette = Cassette(path, MODE_REPLAY)
+    monkeypatch.setattr(search_tool, "get_cassette", lambda: cassette)
+
+    try:
+        with pytest.raises(ReplayMissError):
+            SearchTool().search("edge computing")
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,100 @@
+"""Tests for Serper request retries in the search tool."""
+
+import json
+
+import pytest
+import requests
+
+from app.config.settings import get_settings
+from app.tools import search_tool
+from app.tools.search_tool import SearchTool
+from app.utils.http import retry_after
+
+
+def make_response(status: int, body: dict = None, retry_after_header: str = None):
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://serper.test/search"
+    response._content = json.dumps(body or {}).encode("utf-8")
+    if retry_after_header is not None:
+        response.headers["Retry-After"] = retry_after_header
+    return response
+
+
+class FakeSession:
+    """Returns the queued responses in order."""
+
+    def __init__(self, *responses: requests.Response):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        return self.responses.pop(0)
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, name: str) -> float:
+        self.acquired.append(name)
+        return 0.0
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "test")
+    monkeypatch.setenv("SEARCH_CACHE_ENABLED", "false")
+    monkeypatch.setenv("CIRCUIT_BREAKER_ENABLED", "false")
+    monkeypatch.setenv("HTTP_MAX_RETRIES", "2")
+    monkeypatch.setenv("HTTP_BACKOFF_FACTOR", "0")
+    get_settings.cache_clear()
+    limiter = CountingLimiter()
+    monkeypatch.setattr(search_tool, "get_rate_limiter", lambda: limiter)
+    yield limiter
+    get_settings.cache_clear()
+
+
+def use_session(monkeypatch, session: FakeSession):
+    monkeypatch.setattr(search_tool, "get_http_session", lambda: session)
+
+
+def test_retries_rate_limited_requests_through_the_limiter(monkeypatch, limiter):
+    session = FakeSession(
+        make_response(429, retry_after_header="0"),
+        make_response(503),
+        make_response(200, {"organic": [{"title": "Result", "link": "https://a.test"}]}),
+    )
+    use_session(monkeypatch, session)
+
+    formatted = SearchTool().search("edge computing")
+
+    assert "Result" in formatted
+    assert session.posts == 3
+    assert limiter.acquired == ["serper"] * 3
+
+
+def test_gives_up_after_max_retries(monkeypatch, limiter):
+    session = FakeSession(*(make_response(429, retry_after_header="0") for _ in range(3)))
+    use_session(monkeypatch, session)
+
+    assert SearchTool().search("edge computing") == "❌ Search failed: HTTP error 429"
+    assert session.posts == 3
+    assert len(limiter.acquired) == 3
+
+
+def test_does_not_retry_client_errors(monkeypatch, limiter):
+    session = FakeSession(make_response(403))
+    use_session(monkeypatch, session)
+
+    assert "Invalid API key" in SearchTool().search("edge computing")
+    assert session.posts == 1
+
+
+def test_retry_after_parses_seconds_and_dates():
+    assert retry_after(make_response(429, retry_after_header="7")) == 7.0
+    assert retry_after(make_response(429, retry_after_header="Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+    assert retry_after(make_response(429, retry_after_header="soon")) is None
+    assert retry_after(make_response(429)) is None
+    assert retry_after(None) is None